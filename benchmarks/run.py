@@ -0,0 +1,170 @@
+"""
+Run the benchmark suite and compare against a stored baseline.
+
+    python -m benchmarks.run --out baseline.json
+    python -m benchmarks.run --compare baseline.json --threshold 0.10
+
+Each case is timed `--repeat` times per game it applies to; the median
+time of one repetition is reported (the minimum is kept as well). With
+`--compare`, a case whose median is slower than the baseline by more than
+`--threshold` is flagged and the exit status is 1.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.suite import CASES, GAMES
+
+
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.10
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+
+def run_case(name: str, game_name: str, repeat: int) -> Dict[str, Any]:
+    case, unit, _ = CASES[name]
+    run, ops = case(GAMES[game_name]())
+
+    # one untimed warm-up repetition
+    run()
+
+    times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    median = statistics.median(times)
+    return {
+        "median": median,
+        "min": min(times),
+        "repeat": repeat,
+        "ops": ops,
+        "unit": unit,
+        "rate": ops / median if median else 0.0,
+    }
+
+
+def run_suite(
+    names: List[str],
+    game_names: List[str],
+    repeat: int,
+) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, Any]] = {}
+
+    for game_name in game_names:
+        for name in names:
+            if game_name not in CASES[name][2]:
+                continue
+            key = f"{game_name}/{name}"
+            results[key] = stats = run_case(name, game_name, repeat)
+            print(
+                f"{key:40s} {stats['median'] * 1e3:10.2f} ms"
+                f"   {stats['rate']:14,.1f} {stats['unit']}/s"
+            )
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Comparing
+# ---------------------------------------------------------------------------
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float,
+) -> List[str]:
+    """
+    Print a comparison table; return the names of regressed cases.
+    """
+    regressions: List[str] = []
+
+    print(f"\n{'case':40s} {'baseline':>12s} {'current':>12s} {'change':>8s}")
+
+    for key, stats in current["results"].items():
+        old = baseline["results"].get(key)
+        if old is None:
+            print(f"{key:40s} {'-':>12s} {stats['median'] * 1e3:10.2f}ms {'new':>8s}")
+            continue
+
+        change = stats["median"] / old["median"] - 1.0
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(key)
+
+        print(
+            f"{key:40s} {old['median'] * 1e3:10.2f}ms {stats['median'] * 1e3:10.2f}ms"
+            f" {change:+8.1%}{flag}"
+        )
+
+    return regressions
+
+
+# ---------------------------------------------------------------------------
+# Entry point
+# ---------------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("cases", nargs="*",
+                        help=f"cases to run (default: all of {', '.join(CASES)})")
+    parser.add_argument("--game", action="append", choices=sorted(GAMES),
+                        help="game or rules implementation (repeatable; default: all)")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--out", default=None, help="write results to this JSON file")
+    parser.add_argument("--compare", default=None, help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="relative slowdown counted as a regression")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+    current = run_suite(
+        args.cases or list(CASES),
+        args.game or sorted(GAMES),
+        args.repeat,
+    )
+
+    if args.out is not None:
+        with open(args.out, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.compare is None:
+        return 0
+
+    with open(args.compare) as f:
+        baseline = json.load(f)
+
+    regressions = compare(current, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}")
+        return 1
+
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
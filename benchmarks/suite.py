@@ -0,0 +1,351 @@
+"""
+Benchmark cases for the hot paths.
+
+Every case takes the rules implementation to measure and returns
+(run, ops): `run` performs one timed repetition and `ops` is the number of
+operations it performs, used to report a rate. Setup done before returning
+is not timed. Each case lists the games it applies to.
+"""
+
+from __future__ import annotations
+import random
+from typing import Callable, Dict, List, Tuple
+
+from core.game import Game
+from core.match import Match
+from core.types import PlayerID
+
+from games.connect4.game import Connect4Game
+from games.connect4.state import Connect4State
+
+from games.mnk.game import MNKGame, three_player_game
+from games.mnk.state import MNKState
+
+from games.tictactoe.game import TicTacToeGame
+from games.tictactoe.bitboard import BitboardTicTacToeGame, position_key
+from games.tictactoe.state import TicTacToeState
+
+from players.ai.core.search.minimax import ALGORITHMS, minimax_decision
+from players.ai.core.search.max_n import max_n_decision
+from players.ai.core.search.stack import stack_max_n_decision, stack_minimax_decision
+from players.ai.core.search.transposition import TranspositionTable
+from players.ai.games.tictactoe import minimax as ttt_minimax
+from players.ai.games.tictactoe import max_n as ttt_max_n
+from players.ai.games.tictactoe.random import RandomTicTacToePlayer
+from players.ai.games.connect4 import minimax as c4_minimax
+from players.ai.games.connect4 import max_n as c4_max_n
+from players.ai.games.mnk.max_n import MaxnMNKPlayer
+
+
+Case = Callable[[Game], Tuple[Callable[[], None], int]]
+
+GAMES: Dict[str, Callable[[], Game]] = {
+    "tictactoe": TicTacToeGame,
+    "bitboard": BitboardTicTacToeGame,
+    "connect4": Connect4Game,
+    "mnk3": three_player_game,
+}
+
+TICTACTOE = ("tictactoe", "bitboard")
+ALL_GAMES = tuple(GAMES)
+
+SEED = 12345
+
+# passes over every reachable state per repetition of the rules cases
+RULE_PASSES = 20
+
+# self-play games per repetition
+GAMES_PER_RUN = 2000
+
+# every n-th reachable state is a position of the per-move search cases
+MOVE_SAMPLE = 20
+
+# Connect Four depth-limited searches: positions, and plies searched
+C4_POSITIONS = 8
+C4_MINIMAX_DEPTH = 6
+C4_MAX_N_DEPTH = 4
+
+# three-player m,n,k Max^n searches: positions, plies searched, and the
+# distance from placed stones within which moves are considered
+MNK3_POSITIONS = 8
+MNK3_MAX_N_DEPTH = 3
+MNK3_RADIUS = 1
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+def _reachable(game: TicTacToeGame) -> List[TicTacToeState]:
+    """
+    Every non-terminal reachable state, in a fixed order.
+    """
+    seen = set()
+    order: List[TicTacToeState] = []
+    stack = [game.initial_state()]
+
+    while stack:
+        state = stack.pop()
+        if state in seen or game.is_terminal(state):
+            continue
+        seen.add(state)
+        order.append(state)
+        pid = state.current_player
+        for action in game.legal_actions(state, pid):
+            stack.append(game.next_state(state, {pid: action}))
+
+    return order
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+def legal_actions(game: TicTacToeGame) -> Tuple[Callable[[], None], int]:
+    states = _reachable(game)
+
+    def run() -> None:
+        for _ in range(RULE_PASSES):
+            for state in states:
+                for _ in game.legal_actions(state, state.current_player):
+                    pass
+
+    return run, RULE_PASSES * len(states)
+
+
+def next_state(game: TicTacToeGame) -> Tuple[Callable[[], None], int]:
+    moves = [
+        (state, {state.current_player: action})
+        for state in _reachable(game)
+        for action in game.legal_actions(state, state.current_player)
+    ]
+
+    def run() -> None:
+        for _ in range(RULE_PASSES):
+            for state, joint_action in moves:
+                game.next_state(state, joint_action)
+
+    return run, RULE_PASSES * len(moves)
+
+
+def is_terminal(game: TicTacToeGame) -> Tuple[Callable[[], None], int]:
+    states = _reachable(game)
+
+    def run() -> None:
+        for _ in range(RULE_PASSES):
+            for state in states:
+                game.is_terminal(state)
+
+    return run, RULE_PASSES * len(states)
+
+
+# ---------------------------------------------------------------------------
+# Search
+# ---------------------------------------------------------------------------
+
+def minimax_full_tree(game: TicTacToeGame) -> Tuple[Callable[[], None], int]:
+    callbacks = ttt_minimax.callbacks(game)
+
+    def run() -> None:
+        state = game.initial_state()
+        minimax_decision(state, state.current_player, **callbacks, depth=None)
+
+    return run, 1
+
+
+def minimax_full_tree_stack(game: TicTacToeGame) -> Tuple[Callable[[], None], int]:
+    callbacks = ttt_minimax.callbacks(game)
+
+    def run() -> None:
+        state = game.initial_state()
+        stack_minimax_decision(state, state.current_player, **callbacks, depth=None)
+
+    return run, 1
+
+
+def _minimax_moves(algorithm: str) -> Case:
+    """
+    Case: one full-depth decision per sampled position with `algorithm`,
+    each with a fresh transposition table (MTD(f) needs one).
+    """
+
+    def case(game: TicTacToeGame) -> Tuple[Callable[[], None], int]:
+        callbacks = ttt_minimax.callbacks(game)
+        key = position_key if game.supports_inplace() else None
+        states = _reachable(game)[::MOVE_SAMPLE]
+
+        def run() -> None:
+            for state in states:
+                minimax_decision(
+                    state,
+                    state.current_player,
+                    **callbacks,
+                    depth=None,
+                    table=TranspositionTable(key=key),
+                    algorithm=algorithm,
+                )
+
+        return run, len(states)
+
+    return case
+
+
+def max_n_full_tree(game: TicTacToeGame) -> Tuple[Callable[[], None], int]:
+    callbacks = ttt_max_n.callbacks(game)
+
+    def run() -> None:
+        state = game.initial_state()
+        max_n_decision(state, state.current_player, **callbacks, depth=None)
+
+    return run, 1
+
+
+def max_n_full_tree_stack(game: TicTacToeGame) -> Tuple[Callable[[], None], int]:
+    callbacks = ttt_max_n.callbacks(game)
+
+    def run() -> None:
+        state = game.initial_state()
+        stack_max_n_decision(state, state.current_player, **callbacks, depth=None)
+
+    return run, 1
+
+
+def _c4_positions() -> List[Connect4State]:
+    """
+    Fixed Connect Four positions a few random moves into the game.
+    """
+    game = Connect4Game()
+    rng = random.Random(SEED)
+    positions: List[Connect4State] = []
+
+    while len(positions) < C4_POSITIONS:
+        state = game.initial_state()
+        for _ in range(rng.randrange(12)):
+            pid = state.current_player
+            state = game.next_state(state, {pid: rng.choice(game.legal_actions(state, pid))})
+        if not game.is_terminal(state):
+            positions.append(state)
+
+    return positions
+
+
+def c4_minimax_depth(game: Connect4Game) -> Tuple[Callable[[], None], int]:
+    positions = _c4_positions()
+
+    def run() -> None:
+        for position in positions:
+            player = c4_minimax.MinimaxConnect4Player(
+                position.current_player, depth=C4_MINIMAX_DEPTH
+            )
+            player.select_action(position, None)
+
+    return run, len(positions)
+
+
+def c4_max_n_depth(game: Connect4Game) -> Tuple[Callable[[], None], int]:
+    positions = _c4_positions()
+
+    def run() -> None:
+        for position in positions:
+            player = c4_max_n.MaxnConnect4Player(
+                position.current_player, depth=C4_MAX_N_DEPTH
+            )
+            player.select_action(position, None)
+
+    return run, len(positions)
+
+
+def _mnk3_positions() -> List[MNKState]:
+    """
+    Fixed three-player m,n,k positions a few random moves into the game.
+    """
+    game = three_player_game()
+    rng = random.Random(SEED)
+    positions: List[MNKState] = []
+
+    while len(positions) < MNK3_POSITIONS:
+        state = game.initial_state()
+        for _ in range(rng.randrange(3, 12)):
+            pid = state.current_player
+            moves = list(game.legal_actions(state, pid))
+            state = game.next_state(state, {pid: rng.choice(moves)})
+        if not game.is_terminal(state):
+            positions.append(state)
+
+    return positions
+
+
+def mnk3_max_n_depth(game: MNKGame) -> Tuple[Callable[[], None], int]:
+    positions = _mnk3_positions()
+
+    def run() -> None:
+        for position in positions:
+            player = MaxnMNKPlayer(
+                position.current_player,
+                game=game,
+                depth=MNK3_MAX_N_DEPTH,
+                radius=MNK3_RADIUS,
+            )
+            player.select_action(position, None)
+
+    return run, len(positions)
+
+
+# ---------------------------------------------------------------------------
+# Playing
+# ---------------------------------------------------------------------------
+
+def _random_players(game: Game) -> Dict[PlayerID, RandomTicTacToePlayer]:
+    return {
+        pid: RandomTicTacToePlayer(pid, seed=SEED + i)
+        for i, pid in enumerate(game.PLAYERS)
+    }
+
+
+def random_self_play(game: Game) -> Tuple[Callable[[], None], int]:
+    players = _random_players(game)
+
+    def run() -> None:
+        for _ in range(GAMES_PER_RUN):
+            state = game.initial_state()
+            while not game.is_terminal(state):
+                pid = state.current_player
+                action = players[pid].select_action(state, game.legal_actions(state, pid))
+                state = game.next_state(state, {pid: action})
+
+    return run, GAMES_PER_RUN
+
+
+def match_run(game: Game) -> Tuple[Callable[[], None], int]:
+    players = _random_players(game)
+
+    def run() -> None:
+        for _ in range(GAMES_PER_RUN):
+            Match(game, players).run()
+
+    return run, GAMES_PER_RUN
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+# name -> (case, unit of one op, games it applies to)
+CASES: Dict[str, Tuple[Case, str, Tuple[str, ...]]] = {
+    "legal_actions": (legal_actions, "calls", TICTACTOE),
+    "next_state": (next_state, "calls", TICTACTOE),
+    "is_terminal": (is_terminal, "calls", TICTACTOE),
+    "minimax_full_tree": (minimax_full_tree, "searches", TICTACTOE),
+    "minimax_full_tree_stack": (minimax_full_tree_stack, "searches", TICTACTOE),
+    **{
+        f"minimax_moves_{algorithm}": (_minimax_moves(algorithm), "moves", TICTACTOE)
+        for algorithm in ALGORITHMS
+    },
+    "max_n_full_tree": (max_n_full_tree, "searches", TICTACTOE),
+    "max_n_full_tree_stack": (max_n_full_tree_stack, "searches", TICTACTOE),
+    "c4_minimax_depth": (c4_minimax_depth, "moves", ("connect4",)),
+    "c4_max_n_depth": (c4_max_n_depth, "moves", ("connect4",)),
+    "mnk3_max_n_depth": (mnk3_max_n_depth, "moves", ("mnk3",)),
+    "random_self_play": (random_self_play, "games", ALL_GAMES),
+    "match_run": (match_run, "games", ALL_GAMES),
+}
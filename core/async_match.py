@@ -0,0 +1,101 @@
+from __future__ import annotations
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
+from .async_player import AsyncPlayer
+from .game import Game
+from .match import HISTORY_MODES
+from .state import State
+from .types import PlayerID, JointAction, Result
+
+
+class AsyncMatch:
+    """
+    Asynchronous counterpart of Match: moves are awaited, and the players
+    acting in the same state are asked concurrently.
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        players: Dict[PlayerID, AsyncPlayer],
+        history: str = "full",
+    ):
+        if history not in HISTORY_MODES:
+            raise ValueError(
+                f"Unknown history mode {history!r} (choose from {', '.join(HISTORY_MODES)})."
+            )
+
+        self.game = game
+        self.players = players
+        self.history_mode = history
+
+        self.history: List = []
+        self.state: Optional[State] = None
+        self.result: Optional[Result] = None
+        self.plies = 0
+
+    async def iter_steps(self) -> AsyncIterator[Tuple[State, JointAction]]:
+        """
+        Play the game, yielding (state, joint action) as each move is made.
+
+        Once exhausted, `state` holds the final state and `result` the
+        outcome.
+        """
+        state = self.game.initial_state()
+
+        self.history = [state] if self.history_mode == "full" else []
+        self.state = state
+        self.result = None
+        self.plies = 0
+
+        while not self.game.is_terminal(state):
+
+            active = list(self.game.active_players(state))
+
+            actions = await asyncio.gather(*(
+                self.players[pid].select_action(state, self.game.legal_actions(state, pid))
+                for pid in active
+            ))
+
+            joint_action: JointAction = dict(zip(active, actions))
+
+            yield state, joint_action
+
+            state = self.game.next_state(state, joint_action)
+            self.state = state
+            self.plies += 1
+
+            if self.history_mode == "full":
+                self.history.append(state)
+            elif self.history_mode == "actions":
+                self.history.append(joint_action)
+
+        self.result = self.game.result(state)
+
+    async def run(self) -> Tuple[Result, List]:
+        """
+        Play to the end; return (result, history) with history as configured.
+        """
+        async for _ in self.iter_steps():
+            pass
+        return self.result, self.history
+
+
+async def run_matches(
+    matches: Iterable[AsyncMatch],
+    concurrency: int = 1000,
+) -> List[Tuple[Result, List]]:
+    """
+    Run many matches concurrently in the current event loop, at most
+    `concurrency` at a time; return their (result, history) in order.
+    """
+    if concurrency <= 0:
+        raise ValueError("concurrency must be positive.")
+
+    slots = asyncio.Semaphore(concurrency)
+
+    async def play(match: AsyncMatch) -> Tuple[Result, List]:
+        async with slots:
+            return await match.run()
+
+    return await asyncio.gather(*(play(match) for match in matches))
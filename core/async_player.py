@@ -0,0 +1,77 @@
+from __future__ import annotations
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import Iterable, Optional
+
+from .player import Player
+from .state import State
+from .types import PlayerID, Action
+
+
+class AsyncPlayer(ABC):
+    """
+    Player whose move is awaited, so waiting on it (a human, a remote bot)
+    does not block other games running in the same event loop.
+    """
+
+    def __init__(self, player_id: PlayerID):
+        self.player_id = player_id
+
+    @abstractmethod
+    async def select_action(self, state: State, legal_actions: Iterable[Action]) -> Action:
+        raise NotImplementedError
+
+
+class InlinePlayer(AsyncPlayer):
+    """
+    Runs a synchronous Player directly on the event loop. Only for players
+    that answer instantly (e.g. random); anything slower stalls every game.
+    """
+
+    def __init__(self, player: Player):
+        super().__init__(player.player_id)
+        self.player = player
+
+    async def select_action(self, state: State, legal_actions: Iterable[Action]) -> Action:
+        return self.player.select_action(state, legal_actions)
+
+
+class ExecutorPlayer(AsyncPlayer):
+    """
+    Runs a synchronous Player in an executor (the loop's default thread
+    pool if none is given), keeping the event loop free while it thinks.
+
+    With a ProcessPoolExecutor the player and state are pickled for every
+    move, so anything the player learns between moves (caches, trees) is
+    lost; use it for players that keep no such state.
+    """
+
+    def __init__(self, player: Player, executor: Optional[Executor] = None):
+        super().__init__(player.player_id)
+        self.player = player
+        self.executor = executor
+
+    async def select_action(self, state: State, legal_actions: Iterable[Action]) -> Action:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor,
+            self.player.select_action,
+            state,
+            list(legal_actions),
+        )
+
+
+def as_async(
+    player: Player,
+    executor: Optional[Executor] = None,
+    inline: bool = False,
+) -> AsyncPlayer:
+    """
+    Wrap a synchronous Player; `inline` runs it on the loop itself.
+    """
+    if isinstance(player, AsyncPlayer):
+        return player
+    if inline:
+        return InlinePlayer(player)
+    return ExecutorPlayer(player, executor)
@@ -0,0 +1,20 @@
+from __future__ import annotations
+import os
+from typing import BinaryIO, Callable
+
+
+def atomic_write(path: str, writer: Callable[[BinaryIO], None]) -> None:
+    """
+    Create or replace the file at `path` with what `writer` writes to the
+    binary file object it is given.
+    """
+    # write beside the target and rename, so readers never see a partial file
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            writer(f)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
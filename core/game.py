@@ -31,3 +31,25 @@ class Game(ABC):
     def result(self,state:State)->Result:
         raise NotImplementedError
 
+    # -----------------------------------------------------------------------
+    # Optional in-place protocol (make/unmake) for search
+    # -----------------------------------------------------------------------
+
+    def supports_inplace(self) -> bool:
+        """
+        True if `apply`/`undo` are implemented for this game's states.
+        """
+        return False
+
+    def apply(self, state: State, joint_action: JointAction) -> None:
+        """
+        In-place counterpart of `next_state`: mutate `state` instead of
+        building a new one.
+        """
+        raise NotImplementedError
+
+    def undo(self, state: State) -> None:
+        """
+        Revert the most recent `apply` on `state`.
+        """
+        raise NotImplementedError
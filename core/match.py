@@ -1,20 +1,53 @@
 from __future__ import annotations
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from .game import Game
 from .player import Player
 from .state import State
 from .types import PlayerID, JointAction, Result
 
+
+# what Match keeps while playing:
+#   "full"    every state, initial and final included
+#   "actions" every joint action, in order (replayable from initial_state)
+#   "none"    nothing; consume iter_steps() to see the game
+HISTORY_MODES = ("full", "actions", "none")
+
+
 class Match:
 
-    def __init__(self, game: Game, players: Dict[PlayerID, Player]):
+    def __init__(
+        self,
+        game: Game,
+        players: Dict[PlayerID, Player],
+        history: str = "full",
+    ):
+        if history not in HISTORY_MODES:
+            raise ValueError(
+                f"Unknown history mode {history!r} (choose from {', '.join(HISTORY_MODES)})."
+            )
+
         self.game = game
         self.players = players
+        self.history_mode = history
+
+        self.history: List = []
+        self.state: Optional[State] = None
+        self.result: Optional[Result] = None
+        self.plies = 0
 
+    def iter_steps(self) -> Iterator[Tuple[State, JointAction]]:
+        """
+        Play the game, yielding (state, joint action) as each move is made.
 
-    def run(self) -> Tuple[Result, List[State]]:
+        Once exhausted, `state` holds the final state and `result` the
+        outcome.
+        """
         state = self.game.initial_state()
-        history: List[State] = [state]
+
+        self.history = [state] if self.history_mode == "full" else []
+        self.state = state
+        self.result = None
+        self.plies = 0
 
         while not self.game.is_terminal(state):
 
@@ -31,7 +64,23 @@ class Match:
 
                 joint_action[pid] = action
 
+            yield state, joint_action
+
             state = self.game.next_state(state, joint_action)
-            history.append(state)
-        result = self.game.result(state)
-        return result, history
+            self.state = state
+            self.plies += 1
+
+            if self.history_mode == "full":
+                self.history.append(state)
+            elif self.history_mode == "actions":
+                self.history.append(joint_action)
+
+        self.result = self.game.result(state)
+
+    def run(self) -> Tuple[Result, List]:
+        """
+        Play to the end; return (result, history) with history as configured.
+        """
+        for _ in self.iter_steps():
+            pass
+        return self.result, self.history
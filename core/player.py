@@ -1,6 +1,6 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import Iterable, List, Sequence
 
 from .state import State
 from .types import PlayerID, Action
@@ -14,3 +14,17 @@ class Player(ABC):
     @abstractmethod
     def select_action(self,state: State,legal_actions: Iterable[Action],) -> Action:
         raise NotImplementedError
+
+    def select_actions(
+        self,
+        states: Sequence[State],
+        legal_actions_list: Sequence[Iterable[Action]],
+    ) -> List[Action]:
+        """
+        Choose an action in each of several games at once. Override to
+        amortize per-call overhead; by default each game is asked in turn.
+        """
+        return [
+            self.select_action(state, legal)
+            for state, legal in zip(states, legal_actions_list)
+        ]
@@ -0,0 +1,129 @@
+from __future__ import annotations
+import mmap
+import os
+import struct
+from typing import Iterator, List, Optional
+
+
+# A record file is a pair:
+#   PATH      the records' bytes, back to back, append-only
+#   PATH.idx  one (offset, length) entry per record, uint64 + uint32 LE
+#
+# The index is written after the data, so a record is visible only once
+# complete; bytes past the last indexed record (an interrupted append) are
+# dropped when the file is next opened for writing.
+
+_ENTRY = struct.Struct("<QI")
+
+
+def index_path(path: str) -> str:
+    return path + ".idx"
+
+
+class RecordWriter:
+    """
+    Appends opaque byte records (e.g. encoded games) to a record file,
+    creating it if needed.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self._data = open(path, "ab+")
+        self._index = open(index_path(path), "ab+")
+
+        # drop a torn index entry, then any data it does not cover
+        index_size = self._index.seek(0, os.SEEK_END)
+        whole = index_size - index_size % _ENTRY.size
+        if whole != index_size:
+            self._index.truncate(whole)
+
+        end = 0
+        if whole:
+            self._index.seek(whole - _ENTRY.size)
+            offset, length = _ENTRY.unpack(self._index.read(_ENTRY.size))
+            end = offset + length
+
+        if self._data.seek(0, os.SEEK_END) != end:
+            self._data.truncate(end)
+
+        self._count = whole // _ENTRY.size
+        self._end = end
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, record: bytes) -> int:
+        """
+        Append one record; return its index.
+        """
+        self._data.write(record)
+        self._data.flush()
+        self._index.write(_ENTRY.pack(self._end, len(record)))
+        self._index.flush()
+
+        self._end += len(record)
+        self._count += 1
+        return self._count - 1
+
+    def close(self) -> None:
+        self._data.close()
+        self._index.close()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class RecordReader:
+    """
+    Random access to the records of a record file through mmap; opening
+    costs the same whatever the file size.
+
+    Sees the records present when it was opened.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._maps: List[mmap.mmap] = []
+
+        self._data = self._map(path)
+        self._index = self._map(index_path(path))
+        self._count = len(self._index) // _ENTRY.size if self._index is not None else 0
+
+    def _map(self, path: str) -> Optional[mmap.mmap]:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(m)
+        return m
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> bytes:
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("record index out of range")
+
+        offset, length = _ENTRY.unpack_from(self._index, i * _ENTRY.size)
+        return self._data[offset:offset + length] if length else b""
+
+    def __iter__(self) -> Iterator[bytes]:
+        for i in range(self._count):
+            yield self[i]
+
+    def close(self) -> None:
+        for m in self._maps:
+            m.close()
+        self._maps.clear()
+
+    def __enter__(self) -> "RecordReader":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
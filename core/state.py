@@ -1,10 +1,13 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Iterable
-from .types import PlayerID
+from .types import PlayerID, Action
 
 class State(ABC):
 
+    # no per-instance __dict__, so subclasses can use __slots__ to save memory
+    __slots__ = ()
+
     @abstractmethod
     def active_players(self)-> Iterable[PlayerID]:
         raise NotImplementedError
@@ -13,4 +16,18 @@ class State(ABC):
     def copy(self)->"State":
         raise NotImplementedError
 
+    # -----------------------------------------------------------------------
+    # Optional in-place protocol (make/unmake) for search
+    # -----------------------------------------------------------------------
+
+    def apply(self, action: Action) -> None:
+        """
+        Play `action` for the player to move, mutating this state.
+        """
+        raise NotImplementedError
 
+    def undo(self) -> None:
+        """
+        Take back the most recent `apply`.
+        """
+        raise NotImplementedError
@@ -0,0 +1,126 @@
+from __future__ import annotations
+from typing import Dict, List, Optional, Tuple
+from .game import Game
+from .match import HISTORY_MODES
+from .player import Player
+from .state import State
+from .types import PlayerID, JointAction, Result
+
+
+class VectorMatch:
+    """
+    Plays `num_games` games of `game` in lockstep with one player per seat.
+
+    Every turn, each player is asked once, through `select_actions`, for
+    all the games in which it has to move; games that are over drop out.
+    Players that do not override `select_actions` are asked game by game.
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        players: Dict[PlayerID, Player],
+        num_games: int,
+        history: str = "none",
+    ):
+        if history not in HISTORY_MODES:
+            raise ValueError(
+                f"Unknown history mode {history!r} (choose from {', '.join(HISTORY_MODES)})."
+            )
+        if num_games <= 0:
+            raise ValueError("num_games must be positive.")
+
+        self.game = game
+        self.players = players
+        self.num_games = num_games
+        self.history_mode = history
+
+        self.states: List[State] = []
+        self.histories: List[List] = []
+        self.results: List[Optional[Result]] = []
+        self.plies: List[int] = []
+
+    def step(self, live: List[int]) -> List[int]:
+        """
+        Advance every game in `live` by one turn; return those still running.
+        """
+        game = self.game
+        states = self.states
+
+        # who has to move where
+        pending: Dict[PlayerID, List[int]] = {}
+        active_players = game.active_players
+        for i in live:
+            for pid in active_players(states[i]):
+                games = pending.get(pid)
+                if games is None:
+                    pending[pid] = [i]
+                else:
+                    games.append(i)
+
+        # one batched call per player
+        joint_actions: List[Optional[JointAction]] = [None] * len(states)
+        for pid, games in pending.items():
+            batch = [states[i] for i in games]
+            legal = [game.legal_actions(s, pid) for s in batch]
+
+            actions = self.players[pid].select_actions(batch, legal)
+
+            for i, action in zip(games, actions):
+                joint = joint_actions[i]
+                if joint is None:
+                    joint_actions[i] = {pid: action}
+                else:
+                    joint[pid] = action
+
+        next_state = game.next_state
+        is_terminal = game.is_terminal
+        plies = self.plies
+        histories = self.histories
+        full = self.history_mode == "full"
+        actions_only = self.history_mode == "actions"
+        still_live: List[int] = []
+
+        for i in live:
+            joint = joint_actions[i]
+            state = states[i] = next_state(states[i], joint)
+            plies[i] += 1
+
+            if full:
+                histories[i].append(state)
+            elif actions_only:
+                histories[i].append(joint)
+
+            if is_terminal(state):
+                self.results[i] = game.result(state)
+            else:
+                still_live.append(i)
+
+        return still_live
+
+    def run(self) -> List[Tuple[Result, List]]:
+        """
+        Play every game to the end; return (result, history) per game.
+        """
+        game = self.game
+        n = self.num_games
+
+        self.states = [game.initial_state() for _ in range(n)]
+        if self.history_mode == "full":
+            self.histories = [[s] for s in self.states]
+        else:
+            self.histories = [[] for _ in range(n)]
+        self.results = [None] * n
+        self.plies = [0] * n
+
+        live: List[int] = []
+        for i, state in enumerate(self.states):
+            if game.is_terminal(state):
+                self.results[i] = game.result(state)
+            else:
+                live.append(i)
+
+        while live:
+            live = self.step(live)
+
+        return list(zip(self.results, self.histories))
@@ -0,0 +1,133 @@
+"""
+Connect Four on bitboards.
+
+Players drop stones into one of seven columns of a six-row board; the
+first to connect four in a row (horizontally, vertically or diagonally)
+wins. Moves are column indices 0-6.
+
+Four-in-a-row is detected with shifts: for each direction, `b & b >> s`
+marks stones with a neighbour at distance s, and doing it again at 2s
+leaves stones starting a line of four. Legal columns are those whose top
+cell is empty, looked up from the top row alone.
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterable, Optional, Tuple
+
+from core.game import Game
+from core.state import State
+from core.types import PlayerID, Action, JointAction, Result
+
+from .state import (
+    Connect4State,
+    PLAYER_X,
+    PLAYER_O,
+    ROWS,
+    COLS,
+    HEIGHT,
+    BOTTOM,
+    COLUMN,
+    TOP,
+    TOP_MASK,
+    BOARD_MASK,
+)
+
+
+# shift between neighbouring cells: vertical, horizontal, and the diagonals
+DIRECTIONS: Tuple[int, ...] = (1, HEIGHT, HEIGHT - 1, HEIGHT + 1)
+
+
+def has_four(b: int) -> bool:
+    """
+    True if bitboard `b` holds four in a row.
+    """
+    for shift in DIRECTIONS:
+        m = b & (b >> shift)
+        if m & (m >> (2 * shift)):
+            return True
+    return False
+
+
+# _LEGAL[mask & TOP_MASK]: columns that still take a stone
+_LEGAL: Dict[int, Tuple[int, ...]] = {
+    full: tuple(c for c in range(COLS) if not full & TOP[c])
+    for full in (
+        sum(TOP[c] for c in range(COLS) if n >> c & 1) for n in range(1 << COLS)
+    )
+}
+
+
+class Connect4Game(Game):
+    PLAYER_X: PlayerID = PLAYER_X
+    PLAYER_O: PlayerID = PLAYER_O
+    PLAYERS = (PLAYER_X, PLAYER_O)
+
+    ROWS = ROWS
+    COLS = COLS
+
+    def initial_state(self) -> State:
+        return Connect4State(0, 0, self.PLAYER_X)
+
+    def active_players(self, state: State) -> Iterable[PlayerID]:
+        assert isinstance(state, Connect4State)
+        return state.active_players()
+
+    def legal_actions(self, state: State, player: PlayerID) -> Iterable[Action]:
+        assert isinstance(state, Connect4State)
+
+        return _LEGAL[(state.x | state.o) & TOP_MASK]
+
+    def next_state(self, state: State, joint_action: JointAction) -> State:
+        assert isinstance(state, Connect4State)
+
+        (player, column), = joint_action.items()
+        mask = state.x | state.o
+        if mask & TOP[column]:
+            raise ValueError(f"Column {column} is full.")
+        bit = (mask & COLUMN[column]) + BOTTOM[column]
+
+        if player == self.PLAYER_X:
+            return Connect4State(state.x | bit, state.o, self.PLAYER_O)
+        return Connect4State(state.x, state.o | bit, self.PLAYER_X)
+
+    def is_terminal(self, state: State) -> bool:
+        assert isinstance(state, Connect4State)
+
+        x, o = state.x, state.o
+        return has_four(x) or has_four(o) or (x | o) == BOARD_MASK
+
+    def result(self, state: State) -> Result:
+        assert isinstance(state, Connect4State)
+
+        winner = self.winner(state)
+        if winner is None:
+            return {self.PLAYER_X: 0.0, self.PLAYER_O: 0.0}
+
+        loser = self.PLAYER_O if winner == self.PLAYER_X else self.PLAYER_X
+        return {winner: 1.0, loser: -1.0}
+
+    def winner(self, state: Connect4State) -> Optional[PlayerID]:
+        if has_four(state.x):
+            return self.PLAYER_X
+        if has_four(state.o):
+            return self.PLAYER_O
+        return None
+
+    # -----------------------------------------------------------------------
+    # In-place protocol
+    # -----------------------------------------------------------------------
+
+    def supports_inplace(self) -> bool:
+        return True
+
+    def apply(self, state: State, joint_action: JointAction) -> None:
+        assert isinstance(state, Connect4State)
+
+        (player, column), = joint_action.items()
+        assert player == state.current_player
+        state.apply(column)
+
+    def undo(self, state: State) -> None:
+        assert isinstance(state, Connect4State)
+
+        state.undo()
@@ -0,0 +1,80 @@
+"""
+Static evaluation of Connect Four positions for depth-limited search.
+
+A position is scored from X's point of view by counting the 69 windows of
+four cells in a line: a window holding stones of one player only is worth
+more to that player the more stones it holds, since it can still become a
+four. Stones in the center column, which lies on the most windows, earn a
+small bonus.
+
+Scores are integers, well below `WIN_SCORE`, so a won position always
+outranks any heuristic one (and integer-valued searches such as MTD(f)
+converge in few passes).
+"""
+
+from __future__ import annotations
+from typing import Tuple
+
+from .game import has_four
+from .state import Connect4State, COLS, ROWS, HEIGHT, COLUMN, BOARD_MASK
+
+
+# value of a won game; decisive results are WIN_SCORE minus the stones played,
+# so quicker wins (and slower losses) are preferred
+WIN_SCORE = 1_000_000
+
+# WINDOW_WEIGHT[n]: an open window holding n stones of one player
+WINDOW_WEIGHT: Tuple[int, ...] = (0, 1, 8, 64, 0)
+CENTER_WEIGHT = 4
+
+
+def _window(col: int, row: int, d_col: int, d_row: int) -> int:
+    mask = 0
+    for i in range(4):
+        mask |= 1 << ((col + i * d_col) * HEIGHT + row + i * d_row)
+    return mask
+
+
+WINDOWS: Tuple[int, ...] = tuple(
+    _window(c, r, dc, dr)
+    for dc, dr in ((1, 0), (0, 1), (1, 1), (1, -1))
+    for c in range(COLS)
+    for r in range(ROWS)
+    if 0 <= c + 3 * dc < COLS and 0 <= r + 3 * dr < ROWS
+)
+
+CENTER = COLUMN[COLS // 2]
+
+
+def score(state: Connect4State) -> int:
+    """
+    Heuristic value of a non-terminal position for X (negate for O).
+    """
+    x, o = state.x, state.o
+    total = CENTER_WEIGHT * ((x & CENTER).bit_count() - (o & CENTER).bit_count())
+
+    for window in WINDOWS:
+        mine = x & window
+        theirs = o & window
+        if mine:
+            if not theirs:
+                total += WINDOW_WEIGHT[mine.bit_count()]
+        elif theirs:
+            total -= WINDOW_WEIGHT[theirs.bit_count()]
+
+    return total
+
+
+def value(state: Connect4State) -> int:
+    """
+    Value of any position for X (negate for O): decided games score
+    +-(WIN_SCORE - stones played), a draw 0, anything else `score`.
+    """
+    x, o = state.x, state.o
+    if has_four(x):
+        return WIN_SCORE - (x | o).bit_count()
+    if has_four(o):
+        return (x | o).bit_count() - WIN_SCORE
+    if x | o == BOARD_MASK:
+        return 0
+    return score(state)
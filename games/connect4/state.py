@@ -0,0 +1,117 @@
+from __future__ import annotations
+from typing import Iterable, Tuple
+from core.state import State
+from core.types import PlayerID, Action
+
+PLAYER_X: PlayerID = "X"
+PLAYER_O: PlayerID = "O"
+
+ROWS = 6
+COLS = 7
+
+# bits per column: the playable cells plus one always-empty sentinel on top,
+# which keeps shifted lines from wrapping into the next column
+HEIGHT = ROWS + 1
+
+Cell = int
+
+Board = Tuple[Tuple[Cell, ...], ...]
+
+BOTTOM: Tuple[int, ...] = tuple(1 << (c * HEIGHT) for c in range(COLS))
+TOP: Tuple[int, ...] = tuple(1 << (c * HEIGHT + ROWS - 1) for c in range(COLS))
+COLUMN: Tuple[int, ...] = tuple(((1 << ROWS) - 1) << (c * HEIGHT) for c in range(COLS))
+
+TOP_MASK = sum(TOP)
+BOARD_MASK = sum(COLUMN)
+
+
+class Connect4State(State):
+    """
+    Connect Four position as two bitboards plus side-to-move.
+
+    Bit `col * HEIGHT + row` of a mask is the cell in column `col`, `row`
+    counted from the bottom. A column's stones are contiguous from its
+    bottom bit, so adding the bottom bit to them gives the cell the next
+    stone drops into.
+
+    States also implement the in-place `apply`/`undo` protocol, so searches can
+    walk the tree on a single (copied) state without allocating.
+    """
+
+    __slots__ = ("x", "o", "current_player", "_played")
+
+    def __init__(self, x: int, o: int, current_player: PlayerID):
+        self.x = x
+        self.o = o
+        self.current_player = current_player
+        self._played: list[int] | None = None  # bits placed by `apply`
+
+    @property
+    def mask(self) -> int:
+        return self.x | self.o
+
+    @property
+    def board(self) -> Board:
+        """
+        Rows from the top, 1 for X, -1 for O and 0 for empty.
+        """
+        x, o = self.x, self.o
+        return tuple(
+            tuple(
+                1 if x >> (c * HEIGHT + r) & 1 else -1 if o >> (c * HEIGHT + r) & 1 else 0
+                for c in range(COLS)
+            )
+            for r in reversed(range(ROWS))
+        )
+
+    def active_players(self) -> Iterable[PlayerID]:
+        return (self.current_player,)
+
+    def copy(self) -> "Connect4State":
+        return Connect4State(self.x, self.o, self.current_player)
+
+    def apply(self, action: Action) -> None:
+        mask = self.x | self.o
+        bit = (mask & COLUMN[action]) + BOTTOM[action]
+
+        if self.current_player == PLAYER_X:
+            self.x |= bit
+            self.current_player = PLAYER_O
+        else:
+            self.o |= bit
+            self.current_player = PLAYER_X
+
+        if self._played is None:
+            self._played = []
+        self._played.append(bit)
+
+    def undo(self) -> None:
+        assert self._played, "undo() without a matching apply()"
+        bit = self._played.pop()
+
+        if self.current_player == PLAYER_X:
+            self.o &= ~bit
+            self.current_player = PLAYER_O
+        else:
+            self.x &= ~bit
+            self.current_player = PLAYER_X
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Connect4State):
+            return NotImplemented
+        return (
+            self.x == other.x
+            and self.o == other.o
+            and self.current_player == other.current_player
+        )
+
+    def __hash__(self) -> int:
+        return position_key(self)
+
+
+def position_key(state: Connect4State) -> int:
+    """
+    Immutable integer identifying the position (side to move follows from
+    the masks). Use this, not the state, as a cache key during in-place search.
+    """
+    return state.x | state.o << (COLS * HEIGHT)
@@ -0,0 +1,171 @@
+"""
+Generalized m,n,k-game: players alternately place stones on an m x n board
+and the first to get k in a row (horizontally, vertically or diagonally)
+wins. Tic-Tac-Toe is the 3,3,3-game; Gomoku is 15,15,5. Any number of players
+may take part; `three_player_game` sets up a small three-player table.
+
+Win detection only walks the four lines through the last placed stone and
+the free cells are kept as a bitmask, so making a move clears one bit
+instead of touching the whole board. Legal moves are yielded lazily from
+the set bits of that mask, lowest first.
+"""
+
+from __future__ import annotations
+from typing import Iterable, Iterator, Tuple
+
+from core.game import Game
+from core.state import State
+from core.types import PlayerID, Action, JointAction, Result
+
+from .state import MNKState, Move
+
+
+# (d_row, d_col) for horizontal, vertical, diagonal, anti-diagonal
+DIRECTIONS: Tuple[Move, ...] = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+class MNKGame(Game):
+    PLAYER_X: PlayerID = "X"
+    PLAYER_O: PlayerID = "O"
+    PLAYER_Z: PlayerID = "Z"
+
+    def __init__(
+        self,
+        rows: int = 15,
+        cols: int = 15,
+        k: int = 5,
+        players: Tuple[PlayerID, ...] = (PLAYER_X, PLAYER_O),
+    ):
+        if rows <= 0 or cols <= 0:
+            raise ValueError("Board dimensions must be positive.")
+        if not 0 < k <= max(rows, cols):
+            raise ValueError("k must fit on the board.")
+        if len(players) < 2:
+            raise ValueError("An m,n,k-game needs at least two players.")
+
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.PLAYERS = tuple(players)
+
+        self._index = {pid: i for i, pid in enumerate(self.PLAYERS)}
+        # _cells[i]: the move placing a stone on bit i
+        self._cells: Tuple[Move, ...] = tuple(
+            (r, c) for r in range(rows) for c in range(cols)
+        )
+        self._full = (1 << (rows * cols)) - 1
+
+    # -----------------------------------------------------------------------
+    # Game interface
+    # -----------------------------------------------------------------------
+
+    def initial_state(self) -> State:
+        return MNKState(
+            stones=(0,) * len(self.PLAYERS),
+            free=self._full,
+            current_player=self.PLAYERS[0],
+        )
+
+    def active_players(self, state: State) -> Iterable[PlayerID]:
+        assert isinstance(state, MNKState)
+        return state.active_players()
+
+    def legal_actions(self, state: State, player: PlayerID) -> Iterator[Action]:
+        """
+        Free cells in board order, generated one set bit of `free` at a time.
+        """
+        assert isinstance(state, MNKState)
+        return self.moves(state.free)
+
+    def moves(self, mask: int) -> Iterator[Move]:
+        """
+        The cells of the set bits of `mask`, in board order.
+        """
+        cells = self._cells
+        while mask:
+            low = mask & -mask
+            yield cells[low.bit_length() - 1]
+            mask ^= low
+
+    def next_state(self, state: State, joint_action: JointAction) -> State:
+        assert isinstance(state, MNKState)
+
+        (player, move), = joint_action.items()
+        r, c = move
+        if not (0 <= r < self.rows and 0 <= c < self.cols):
+            raise ValueError(f"Cell {move} is not free.")
+        bit = 1 << (r * self.cols + c)
+        if not state.free & bit:
+            raise ValueError(f"Cell {move} is not free.")
+
+        i = self._index[player]
+        stones = list(state.stones)
+        stones[i] |= bit
+        new_stones = tuple(stones)
+
+        winner = player if self._completes_line(new_stones[i], r, c) else None
+
+        return MNKState(
+            new_stones,
+            state.free & ~bit,
+            self.PLAYERS[(i + 1) % len(self.PLAYERS)],
+            move,
+            winner,
+        )
+
+    def is_terminal(self, state: State) -> bool:
+        assert isinstance(state, MNKState)
+        return state.winner is not None or not state.free
+
+    def result(self, state: State) -> Result:
+        """
+        Constant-sum: the winner gets 1.0 and the others share -1.0; a draw
+        is 0.0 for everyone.
+        """
+        assert isinstance(state, MNKState)
+
+        if state.winner is None:
+            return {pid: 0.0 for pid in self.PLAYERS}
+
+        loss = -1.0 / (len(self.PLAYERS) - 1)
+        return {
+            pid: 1.0 if pid == state.winner else loss for pid in self.PLAYERS
+        }
+
+    # -----------------------------------------------------------------------
+    # Win detection
+    # -----------------------------------------------------------------------
+
+    def _completes_line(self, mask: int, r: int, c: int) -> bool:
+        """
+        True if the stone at (r, c) is part of k in a row in `mask`.
+        """
+        rows, cols, k = self.rows, self.cols, self.k
+
+        for dr, dc in DIRECTIONS:
+            count = 1
+
+            for sign in (1, -1):
+                rr, cc = r + sign * dr, c + sign * dc
+                while (
+                    0 <= rr < rows
+                    and 0 <= cc < cols
+                    and mask >> (rr * cols + cc) & 1
+                ):
+                    count += 1
+                    if count >= k:
+                        return True
+                    rr += sign * dr
+                    cc += sign * dc
+
+            if count >= k:
+                return True
+
+        return False
+
+
+def three_player_game(rows: int = 7, cols: int = 7, k: int = 4) -> MNKGame:
+    """
+    X, O and Z taking turns on a 7x7 board, four in a row to win.
+    """
+    return MNKGame(rows, cols, k, (MNKGame.PLAYER_X, MNKGame.PLAYER_O, MNKGame.PLAYER_Z))
@@ -0,0 +1,100 @@
+"""
+Static evaluation of m,n,k positions as utility vectors, for Max^n.
+
+Each player is scored by the windows of k cells in a line that hold only
+their stones, since only those can still become a win; a window is worth
+more the more stones it holds. Every player also gets a small base score,
+and the scores are normalized to sum to one.
+
+Utilities thus lie in [0, 1] and sum to exactly 1 (a decided game is 1 for
+the winner and 0 for the others, a draw 1/n each), so shallow pruning can
+run with `max_sum=1` and `min_utility=0`. A heuristic position never
+scores a full 1 or 0, so decided games outrank any of them.
+"""
+
+from __future__ import annotations
+from functools import lru_cache
+from typing import List, Tuple
+
+from core.types import Result
+
+from .game import DIRECTIONS, MNKGame
+from .state import MNKState
+
+
+# score every player starts with; keeps heuristic utilities off 0 and 1
+BASE_SCORE = 1.0
+
+# a window holding n stones of one player only is worth WINDOW_BASE ** n
+WINDOW_BASE = 8.0
+
+MAX_SUM = 1.0
+MIN_UTILITY = 0.0
+
+
+@lru_cache(maxsize=None)
+def windows(rows: int, cols: int, k: int) -> Tuple[int, ...]:
+    """
+    Bitmasks of every line of k cells on a rows x cols board.
+    """
+    masks: List[int] = []
+
+    for dr, dc in DIRECTIONS:
+        for r in range(rows):
+            for c in range(cols):
+                end_r, end_c = r + (k - 1) * dr, c + (k - 1) * dc
+                if not (0 <= end_r < rows and 0 <= end_c < cols):
+                    continue
+
+                mask = 0
+                for i in range(k):
+                    mask |= 1 << ((r + i * dr) * cols + c + i * dc)
+                masks.append(mask)
+
+    return tuple(masks)
+
+
+@lru_cache(maxsize=None)
+def _weights(k: int) -> Tuple[float, ...]:
+    return tuple(WINDOW_BASE ** n for n in range(k + 1))
+
+
+def scores(state: MNKState, game: MNKGame) -> List[float]:
+    """
+    Unnormalized heuristic score of each player, in `game.PLAYERS` order.
+    """
+    stones = state.stones
+    weight = _weights(game.k)
+    total = [BASE_SCORE] * len(stones)
+
+    for window in windows(game.rows, game.cols, game.k):
+        owner = -1
+        for i, mask in enumerate(stones):
+            if mask & window:
+                if owner >= 0:
+                    break
+                owner = i
+        else:
+            if owner >= 0:
+                total[owner] += weight[(stones[owner] & window).bit_count()]
+
+    return total
+
+
+def utilities(state: MNKState, game: MNKGame) -> Result:
+    """
+    Utility vector of any position: 1 for the winner of a decided game,
+    1/n each for a draw, normalized `scores` otherwise.
+    """
+    players = game.PLAYERS
+
+    if state.winner is not None:
+        return {pid: 1.0 if pid == state.winner else 0.0 for pid in players}
+
+    if not state.free:
+        share = 1.0 / len(players)
+        return {pid: share for pid in players}
+
+    total = scores(state, game)
+    norm = sum(total)
+    return {pid: score / norm for pid, score in zip(players, total)}
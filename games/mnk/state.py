@@ -0,0 +1,56 @@
+from __future__ import annotations
+from typing import Iterable, Optional, Tuple
+from core.state import State
+from core.types import PlayerID
+
+Move = Tuple[int, int]  # (row, col)
+
+
+class MNKState(State):
+    """
+    m,n,k-game position.
+
+    `stones[i]` is the bitmask of cells owned by the i-th player (bit
+    row * cols + col). `free` is the bitmask of empty cells and is
+    maintained incrementally by the game, as is `winner`, which is decided
+    from the last placed stone only.
+    """
+
+    __slots__ = ("stones", "free", "current_player", "last_move", "winner")
+
+    def __init__(
+        self,
+        stones: Tuple[int, ...],
+        free: int,
+        current_player: PlayerID,
+        last_move: Optional[Move] = None,
+        winner: Optional[PlayerID] = None,
+    ):
+        self.stones = stones
+        self.free = free
+        self.current_player = current_player
+        self.last_move = last_move
+        self.winner = winner
+
+    def active_players(self) -> Iterable[PlayerID]:
+        return (self.current_player,)
+
+    def copy(self) -> "MNKState":
+        return MNKState(
+            self.stones,
+            self.free,
+            self.current_player,
+            self.last_move,
+            self.winner,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MNKState):
+            return NotImplemented
+        return (
+            self.stones == other.stones
+            and self.current_player == other.current_player
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.stones, self.current_player))
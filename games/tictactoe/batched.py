@@ -0,0 +1,201 @@
+"""
+Batched Tic-Tac-Toe kernel on NumPy arrays.
+
+A batch is an (N, 9) int8 array, one row per board in row-major cell
+order, with the same encoding as TicTacToeState: 1 = X, -1 = O, 0 = empty.
+X always moves first, so the side to move follows from the stone count.
+
+Every function works on the whole batch at once, with no Python-level loop
+over boards or plies.
+"""
+
+from __future__ import annotations
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+from .game import TicTacToeGame
+from .state import TicTacToeState
+
+
+X = 1
+O = -1
+
+# (8, 3) cell indices of every line
+LINES = np.array(
+    [
+        [0, 1, 2], [3, 4, 5], [6, 7, 8],  # rows
+        [0, 3, 6], [1, 4, 7], [2, 5, 8],  # columns
+        [0, 4, 8], [2, 4, 6],             # diagonals
+    ],
+    dtype=np.intp,
+)
+
+
+# ---------------------------------------------------------------------------
+# Conversion
+# ---------------------------------------------------------------------------
+
+def empty_boards(n: int) -> np.ndarray:
+    return np.zeros((n, 9), dtype=np.int8)
+
+
+def from_states(states: Iterable[TicTacToeState]) -> np.ndarray:
+    return np.array(
+        [[cell for row in s.board for cell in row] for s in states],
+        dtype=np.int8,
+    ).reshape(-1, 9)
+
+
+def to_state(board: np.ndarray) -> TicTacToeState:
+    cells = [int(c) for c in board]
+    rows = tuple(tuple(cells[r * 3:r * 3 + 3]) for r in range(3))
+    x_to_move = side_to_move(board[None, :])[0] == X
+    player = TicTacToeGame.PLAYER_X if x_to_move else TicTacToeGame.PLAYER_O
+    return TicTacToeState(rows, player)
+
+
+# base-3 digit of each cell value (-1, 0, 1) as in encoding.encode
+_DIGIT = np.array([2, 0, 1], dtype=np.uint16)
+_POW3 = (3 ** np.arange(9)).astype(np.uint16)
+
+
+def encode_boards(boards: np.ndarray) -> np.ndarray:
+    """
+    (N,) uint16 base-3 codes of the boards (see encoding.encode).
+    """
+    return (_DIGIT[boards + 1] * _POW3).sum(axis=1, dtype=np.uint16)
+
+
+def decode_codes(codes: np.ndarray) -> np.ndarray:
+    """
+    Inverse of `encode_boards`.
+    """
+    digits = (np.asarray(codes, dtype=np.uint16)[:, None] // _POW3) % 3
+    return np.array([0, 1, -1], dtype=np.int8)[digits]
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+def side_to_move(boards: np.ndarray) -> np.ndarray:
+    """
+    (N,) int8: X (1) or O (-1) for each board.
+    """
+    stones = np.count_nonzero(boards, axis=1)
+    return np.where(stones % 2 == 0, X, O).astype(np.int8)
+
+
+def winners(boards: np.ndarray) -> np.ndarray:
+    """
+    (N,) int8: X (1), O (-1), or 0 if nobody has three in a row.
+    """
+    sums = boards[:, LINES].sum(axis=2, dtype=np.int8)
+    x_won = (sums == 3).any(axis=1)
+    o_won = (sums == -3).any(axis=1)
+    return np.where(x_won, X, np.where(o_won, O, 0)).astype(np.int8)
+
+
+def is_full(boards: np.ndarray) -> np.ndarray:
+    return (boards != 0).all(axis=1)
+
+
+def is_terminal(boards: np.ndarray) -> np.ndarray:
+    return (winners(boards) != 0) | is_full(boards)
+
+
+def is_draw(boards: np.ndarray) -> np.ndarray:
+    return (winners(boards) == 0) & is_full(boards)
+
+
+def legal_mask(boards: np.ndarray) -> np.ndarray:
+    """
+    (N, 9) bool: empty cells of boards that are still in play.
+    """
+    return (boards == 0) & ~is_terminal(boards)[:, None]
+
+
+def apply_moves(
+    boards: np.ndarray,
+    moves: np.ndarray,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Play cell `moves[i]` (0-8) for the side to move on board i.
+
+    Writes into `out` (which may be `boards` itself for in-place update);
+    by default a new array is returned.
+    """
+    if out is None:
+        out = boards.copy()
+    elif out is not boards:
+        out[...] = boards
+
+    rows = np.arange(len(boards))
+    if not (boards[rows, moves] == 0).all():
+        raise ValueError("Move on an occupied cell.")
+
+    out[rows, moves] = side_to_move(boards)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Random playouts
+# ---------------------------------------------------------------------------
+
+def random_playouts(
+    n: int,
+    rng: Optional[np.random.Generator] = None,
+    boards: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Play uniformly random moves until every game is over.
+
+    Starts from `boards` (left untouched) or from `n` empty boards. Returns
+    (winners, lengths): the (N,) int8 winner per game as in `winners`, and
+    the (N,) int8 number of stones on the board when each game ended.
+
+    Picking a uniformly random empty cell at every ply is the same as
+    filling the empty cells in a uniformly random order, so each game is one
+    random permutation: the winner is the owner of the line completed at
+    the earliest ply, and no per-ply loop is needed.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    boards = empty_boards(n) if boards is None else boards
+    count = len(boards)
+
+    occupied = boards != 0
+    stones = np.count_nonzero(occupied, axis=1)
+
+    # random order of the empty cells; occupied cells sort last
+    keys = rng.random((count, 9), dtype=np.float32)
+    keys[occupied] = 2.0
+    order = np.argsort(keys, axis=1)
+
+    # ply (0-based, from this position) at which each cell gets filled;
+    # stones already on the board count as ply -1
+    ply = np.empty((count, 9), dtype=np.int8)
+    np.put_along_axis(ply, order, np.arange(9, dtype=np.int8)[None, :], axis=1)
+    ply[occupied] = -1
+
+    # owner of every cell once the board is full
+    mover = side_to_move(boards)[:, None]
+    owner = np.where(ply % 2 == 0, mover, -mover).astype(np.int8)
+    owner[occupied] = boards[occupied]
+
+    # ply at which each line is completed by a single owner, or 9 if never
+    line_owner = owner[:, LINES]
+    same = (line_owner[:, :, 0] == line_owner[:, :, 1]) & (
+        line_owner[:, :, 1] == line_owner[:, :, 2]
+    )
+    done_at = np.where(same, ply[:, LINES].max(axis=2), 9)
+
+    first = done_at.argmin(axis=1)
+    rows = np.arange(count)
+    won = done_at[rows, first] < 9
+
+    result = np.where(won, line_owner[rows, first, 0], 0).astype(np.int8)
+    lengths = np.where(won, stones + done_at[rows, first] + 1, 9).astype(np.int8)
+
+    return result, lengths
@@ -0,0 +1,218 @@
+"""
+Bitboard-backed Tic-Tac-Toe.
+
+Drop-in replacement for TicTacToeGame/TicTacToeState: same players, same
+(row, col) moves, same results. The board is two 9-bit masks (one per
+player) and every hot operation is an integer op or a table lookup.
+
+Bit i of a mask is the cell (i // 3, i % 3).
+
+States also implement the in-place `apply`/`undo` protocol, so searches can
+walk the tree on a single (copied) state without allocating.
+"""
+
+from __future__ import annotations
+from typing import Iterable, Tuple
+
+from core.state import State
+from core.types import PlayerID, Action, JointAction, Result
+
+from .game import TicTacToeGame, Move
+from .state import TicTacToeState, Board
+
+
+# ---------------------------------------------------------------------------
+# Precomputed tables
+# ---------------------------------------------------------------------------
+
+WIN_MASKS: Tuple[int, ...] = (
+    0b000000111, 0b000111000, 0b111000000,  # rows
+    0b001001001, 0b010010010, 0b100100100,  # columns
+    0b100010001, 0b001010100,               # diagonals
+)
+
+MOVE_TO_BIT = {(i // 3, i % 3): i for i in range(9)}
+BIT_TO_MOVE: Tuple[Move, ...] = tuple((i // 3, i % 3) for i in range(9))
+
+# _IS_WIN[mask]: mask contains a complete line
+_IS_WIN: Tuple[bool, ...] = tuple(
+    any(mask & w == w for w in WIN_MASKS) for mask in range(1 << 9)
+)
+
+# _LEGAL[occupied]: moves available when `occupied` cells are taken
+_LEGAL: Tuple[Tuple[Move, ...], ...] = tuple(
+    tuple(BIT_TO_MOVE[i] for i in range(9) if not occupied >> i & 1)
+    for occupied in range(1 << 9)
+)
+
+
+# ---------------------------------------------------------------------------
+# State
+# ---------------------------------------------------------------------------
+
+class BitboardTicTacToeState(TicTacToeState):
+    """
+    Tic-Tac-Toe state as two 9-bit masks plus side-to-move.
+
+    Subclasses TicTacToeState so existing players and `render_board` accept it;
+    `board` is derived on demand and is not used by the bitboard game itself.
+    """
+
+    # current_player is the base class slot; its `board` slot goes unused
+    __slots__ = ("x", "o", "_played")
+
+    def __init__(self, x: int, o: int, current_player: PlayerID):
+        self.x = x
+        self.o = o
+        self.current_player = current_player
+        self._played: list[int] | None = None  # bits placed by `apply`
+
+    @property
+    def board(self) -> Board:
+        x, o = self.x, self.o
+        return tuple(
+            tuple(
+                1 if x >> i & 1 else -1 if o >> i & 1 else 0
+                for i in range(r * 3, r * 3 + 3)
+            )
+            for r in range(3)
+        )
+
+    @classmethod
+    def from_board(
+        cls, board: Board, current_player: PlayerID
+    ) -> "BitboardTicTacToeState":
+        x = o = 0
+        for r, row in enumerate(board):
+            for c, cell in enumerate(row):
+                if cell == 1:
+                    x |= 1 << (r * 3 + c)
+                elif cell == -1:
+                    o |= 1 << (r * 3 + c)
+        return cls(x, o, current_player)
+
+    def copy(self) -> "BitboardTicTacToeState":
+        return BitboardTicTacToeState(self.x, self.o, self.current_player)
+
+    def __reduce__(self):
+        # the default would restore the base class `board` slot through the
+        # read-only property; the masks and side to move are the whole state
+        return BitboardTicTacToeState, (self.x, self.o, self.current_player)
+
+    def apply(self, action: Action) -> None:
+        bit = 1 << MOVE_TO_BIT[action]
+
+        if self.current_player == TicTacToeGame.PLAYER_X:
+            self.x |= bit
+            self.current_player = TicTacToeGame.PLAYER_O
+        else:
+            self.o |= bit
+            self.current_player = TicTacToeGame.PLAYER_X
+
+        if self._played is None:
+            self._played = []
+        self._played.append(bit)
+
+    def undo(self) -> None:
+        assert self._played, "undo() without a matching apply()"
+        bit = self._played.pop()
+
+        if self.current_player == TicTacToeGame.PLAYER_X:
+            self.o &= ~bit
+            self.current_player = TicTacToeGame.PLAYER_O
+        else:
+            self.x &= ~bit
+            self.current_player = TicTacToeGame.PLAYER_X
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitboardTicTacToeState):
+            return NotImplemented
+        return (
+            self.x == other.x
+            and self.o == other.o
+            and self.current_player == other.current_player
+        )
+
+    def __hash__(self) -> int:
+        return position_key(self)
+
+
+def position_key(state: BitboardTicTacToeState) -> int:
+    """
+    Immutable integer identifying the position (side to move follows from
+    the masks). Use this, not the state, as a cache key during in-place search.
+    """
+    return state.x | state.o << 9
+
+
+# ---------------------------------------------------------------------------
+# Game
+# ---------------------------------------------------------------------------
+
+class BitboardTicTacToeGame(TicTacToeGame):
+    """
+    TicTacToeGame operating on BitboardTicTacToeState.
+    """
+
+    def initial_state(self) -> State:
+        return BitboardTicTacToeState(0, 0, self.PLAYER_X)
+
+    def legal_actions(self, state: State, player: PlayerID) -> Iterable[Action]:
+        assert isinstance(state, BitboardTicTacToeState)
+
+        return _LEGAL[state.x | state.o]
+
+    def next_state(self, state: State, joint_action: JointAction) -> State:
+        assert isinstance(state, BitboardTicTacToeState)
+
+        (player, move), = joint_action.items()
+        bit = 1 << MOVE_TO_BIT[move]
+
+        if player == self.PLAYER_X:
+            return BitboardTicTacToeState(state.x | bit, state.o, self.PLAYER_O)
+        return BitboardTicTacToeState(state.x, state.o | bit, self.PLAYER_X)
+
+    def is_terminal(self, state: State) -> bool:
+        assert isinstance(state, BitboardTicTacToeState)
+
+        x, o = state.x, state.o
+        return _IS_WIN[x] or _IS_WIN[o] or (x | o).bit_count() == 9
+
+    def result(self, state: State) -> Result:
+        assert isinstance(state, BitboardTicTacToeState)
+
+        if _IS_WIN[state.x]:
+            return {self.PLAYER_X: 1.0, self.PLAYER_O: -1.0}
+        if _IS_WIN[state.o]:
+            return {self.PLAYER_O: 1.0, self.PLAYER_X: -1.0}
+        return {self.PLAYER_X: 0.0, self.PLAYER_O: 0.0}
+
+    def supports_inplace(self) -> bool:
+        return True
+
+    def apply(self, state: State, joint_action: JointAction) -> None:
+        assert isinstance(state, BitboardTicTacToeState)
+
+        (player, move), = joint_action.items()
+        assert player == state.current_player
+        state.apply(move)
+
+    def undo(self, state: State) -> None:
+        assert isinstance(state, BitboardTicTacToeState)
+
+        state.undo()
+
+    def _winner(self, state: TicTacToeState) -> PlayerID | None:
+        assert isinstance(state, BitboardTicTacToeState)
+
+        if _IS_WIN[state.x]:
+            return self.PLAYER_X
+        if _IS_WIN[state.o]:
+            return self.PLAYER_O
+        return None
+
+    def _is_draw(self, state: TicTacToeState) -> bool:
+        assert isinstance(state, BitboardTicTacToeState)
+
+        x, o = state.x, state.o
+        return (x | o).bit_count() == 9 and not (_IS_WIN[x] or _IS_WIN[o])
@@ -0,0 +1,138 @@
+"""
+Compact integer encoding of Tic-Tac-Toe positions.
+
+A board is read as a 9-digit base-3 number, cell i (row-major) being digit
+i: 0 = empty, 1 = X, 2 = O. The side to move follows from the stone counts
+(X moves first), so every position maps to a distinct integer in
+[0, 3 ** 9) and the encoding doubles as a direct index into tables.
+
+A game is stored as its moves: cell indices (0-8) packed two per byte,
+first move in the high nibble, an odd count padded with 0xF. A whole game
+fits in 5 bytes and is replayed from the initial state.
+"""
+
+from __future__ import annotations
+from array import array
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from .bitboard import BitboardTicTacToeState
+from .game import TicTacToeGame
+from .state import TicTacToeState, Board
+
+
+NUM_CODES = 3 ** 9
+
+_POW3: Tuple[int, ...] = tuple(3 ** i for i in range(9))
+
+_DIGIT = {0: 0, 1: 1, -1: 2}
+_CELL = (0, 1, -1)
+
+
+def encode(state: TicTacToeState) -> int:
+    if isinstance(state, BitboardTicTacToeState):
+        x, o = state.x, state.o
+        return sum(
+            _POW3[i] * (1 if x >> i & 1 else 2 if o >> i & 1 else 0)
+            for i in range(9)
+        )
+
+    return sum(
+        _POW3[i] * _DIGIT[cell]
+        for i, cell in enumerate(c for row in state.board for c in row)
+    )
+
+
+@lru_cache(maxsize=None)
+def decode(code: int) -> TicTacToeState:
+    if not 0 <= code < NUM_CODES:
+        raise ValueError(f"Not a Tic-Tac-Toe code: {code}")
+
+    cells = []
+    for _ in range(9):
+        code, digit = divmod(code, 3)
+        cells.append(_CELL[digit])
+
+    board: Board = tuple(tuple(cells[r * 3:r * 3 + 3]) for r in range(3))
+
+    x_count = cells.count(1)
+    o_count = cells.count(-1)
+    player = TicTacToeGame.PLAYER_X if x_count == o_count else TicTacToeGame.PLAYER_O
+
+    return TicTacToeState(board, player)
+
+
+# ---------------------------------------------------------------------------
+# Bulk positions
+# ---------------------------------------------------------------------------
+
+def encode_many(states: Iterable[TicTacToeState]) -> array:
+    """
+    Codes of `states` as an array of uint16 (2 bytes per position);
+    `.tobytes()` gives the packed form.
+    """
+    return array("H", map(encode, states))
+
+
+def decode_many(codes: Iterable[int]) -> List[TicTacToeState]:
+    """
+    Inverse of `encode_many`; accepts an array, any iterable of ints, or the
+    bytes of an encoded array.
+    """
+    if isinstance(codes, (bytes, bytearray, memoryview)):
+        packed = array("H")
+        packed.frombytes(codes)
+        codes = packed
+    # positions are immutable: equal codes share one decoded state
+    return [decode(code) for code in codes]
+
+
+# ---------------------------------------------------------------------------
+# Games
+# ---------------------------------------------------------------------------
+
+_PAD = 0xF
+
+
+def encode_moves(moves: Iterable[Tuple[int, int]]) -> bytes:
+    """
+    Pack a game's moves, (row, col) in the order played.
+    """
+    cells = [r * 3 + c for r, c in moves]
+    if len(cells) % 2:
+        cells.append(_PAD)
+    return bytes(cells[i] << 4 | cells[i + 1] for i in range(0, len(cells), 2))
+
+
+def decode_moves(data: bytes) -> List[Tuple[int, int]]:
+    moves: List[Tuple[int, int]] = []
+    for byte in data:
+        for cell in (byte >> 4, byte & 0xF):
+            if cell != _PAD:
+                moves.append(divmod(cell, 3))
+    return moves
+
+
+def moves_from_history(history: Sequence) -> List[Tuple[int, int]]:
+    """
+    Moves of a Match history recorded with history="actions".
+    """
+    return [action for joint_action in history for action in joint_action.values()]
+
+
+def replay(
+    data: bytes,
+    game: Optional[TicTacToeGame] = None,
+) -> List[TicTacToeState]:
+    """
+    Every state of an encoded game, initial and final included.
+    """
+    game = TicTacToeGame() if game is None else game
+
+    state = game.initial_state()
+    states = [state]
+    for move in decode_moves(data):
+        state = game.next_state(state, {state.current_player: move})
+        states.append(state)
+
+    return states
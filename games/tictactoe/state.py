@@ -9,6 +9,8 @@ Board = Tuple[Tuple[Cell, ...], ...]
 
 class TicTacToeState(State):
 
+    __slots__ = ("board", "current_player")
+
     def __init__(self,board:Board,current_player: PlayerID):
         self.board = board
         self.current_player = current_player
@@ -21,8 +23,10 @@ class TicTacToeState(State):
 
 
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, TicTacToeState):
-            return False
+        # states of other representations (e.g. bitboards) are never equal,
+        # as their hashes differ
+        if type(other) is not type(self):
+            return NotImplemented
         return self.board == other.board and self.current_player == other.current_player
 
     def __hash__(self) -> int:
@@ -0,0 +1,180 @@
+"""
+Symmetries of the Tic-Tac-Toe board.
+
+The board has 8 symmetries (4 rotations, each optionally mirrored). Two
+positions that map onto each other have the same game-theoretic value, so a
+search can keep one representative per class and a cache can key on the
+canonical form.
+
+Transform t maps cell i to cell PERMUTATIONS[t][i]. `canonical` returns the
+smallest image of a position together with the transform producing it, and
+`transform_move` / `inverse_move` carry moves between the two frames.
+"""
+
+from __future__ import annotations
+from typing import Iterable, List, Tuple, TypeVar
+
+from .bitboard import BitboardTicTacToeState, MOVE_TO_BIT, BIT_TO_MOVE
+from .game import TicTacToeGame, Move
+from .state import TicTacToeState
+
+ActionT = TypeVar("ActionT")
+
+
+# ---------------------------------------------------------------------------
+# Transform tables
+# ---------------------------------------------------------------------------
+
+def _rotate(i: int) -> int:
+    r, c = divmod(i, 3)
+    return c * 3 + (2 - r)
+
+
+def _mirror(i: int) -> int:
+    r, c = divmod(i, 3)
+    return r * 3 + (2 - c)
+
+
+def _build_permutations() -> Tuple[Tuple[int, ...], ...]:
+    perms: List[Tuple[int, ...]] = []
+    for mirrored in (False, True):
+        for turns in range(4):
+            perm = []
+            for i in range(9):
+                j = _mirror(i) if mirrored else i
+                for _ in range(turns):
+                    j = _rotate(j)
+                perm.append(j)
+            perms.append(tuple(perm))
+    return tuple(perms)
+
+
+PERMUTATIONS: Tuple[Tuple[int, ...], ...] = _build_permutations()
+
+IDENTITY = 0
+
+# INVERSE[t] undoes transform t
+INVERSE: Tuple[int, ...] = tuple(
+    next(
+        u for u, q in enumerate(PERMUTATIONS)
+        if all(q[p[i]] == i for i in range(9))
+    )
+    for p in PERMUTATIONS
+)
+
+# _MASK_IMAGE[t][mask]: image of a 9-bit cell mask under transform t
+_MASK_IMAGE: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        sum(1 << p[i] for i in range(9) if mask >> i & 1)
+        for mask in range(1 << 9)
+    )
+    for p in PERMUTATIONS
+)
+
+
+# ---------------------------------------------------------------------------
+# Canonical form
+# ---------------------------------------------------------------------------
+
+def masks(state: TicTacToeState) -> Tuple[int, int]:
+    """
+    (X mask, O mask) of any Tic-Tac-Toe state.
+    """
+    if isinstance(state, BitboardTicTacToeState):
+        return state.x, state.o
+
+    x = o = 0
+    for i, cell in enumerate(c for row in state.board for c in row):
+        if cell == 1:
+            x |= 1 << i
+        elif cell == -1:
+            o |= 1 << i
+    return x, o
+
+
+def canonical(state: TicTacToeState) -> Tuple[int, int]:
+    """
+    Return (key, transform) for `state`.
+
+    `key` is identical for all 8 symmetric images of a position (side to
+    move follows from the stone counts). `transform` maps `state` onto the
+    canonical image; on ties the lowest transform index wins.
+    """
+    x, o = masks(state)
+
+    best_key = -1
+    best_t = IDENTITY
+
+    for t, image in enumerate(_MASK_IMAGE):
+        key = image[x] | image[o] << 9
+        if best_key < 0 or key < best_key:
+            best_key = key
+            best_t = t
+
+    return best_key, best_t
+
+
+def canonical_key(state: TicTacToeState) -> int:
+    return canonical(state)[0]
+
+
+def transform_move(move: Move, t: int) -> Move:
+    """
+    Image of `move` under transform t.
+    """
+    return BIT_TO_MOVE[PERMUTATIONS[t][MOVE_TO_BIT[move]]]
+
+
+def inverse_move(move: Move, t: int) -> Move:
+    """
+    Map a move from the frame produced by transform t back to the original.
+    """
+    return transform_move(move, INVERSE[t])
+
+
+# ---------------------------------------------------------------------------
+# Search helpers
+# ---------------------------------------------------------------------------
+
+def unique_children(
+    children: Iterable[Tuple[ActionT, TicTacToeState]],
+) -> List[Tuple[ActionT, TicTacToeState]]:
+    """
+    Keep the first child of each symmetry class, preserving order.
+
+    Symmetric siblings have equal values, so a search that picks the first
+    strictly better child returns the same action with or without this filter.
+    """
+    seen = set()
+    unique: List[Tuple[ActionT, TicTacToeState]] = []
+
+    for action, child in children:
+        key = canonical_key(child)
+        if key not in seen:
+            seen.add(key)
+            unique.append((action, child))
+
+    return unique
+
+
+def unique_actions(state: TicTacToeState, actions: Iterable[Move]) -> List[Move]:
+    """
+    Action-level counterpart of `unique_children` for in-place search: the
+    children are classified from their masks without being built.
+    """
+    x, o = masks(state)
+    x_to_move = state.current_player == TicTacToeGame.PLAYER_X
+
+    seen = set()
+    unique: List[Move] = []
+
+    for move in actions:
+        bit = 1 << MOVE_TO_BIT[move]
+        cx, co = (x | bit, o) if x_to_move else (x, o | bit)
+
+        key = min(image[cx] | image[co] << 9 for image in _MASK_IMAGE)
+        if key not in seen:
+            seen.add(key)
+            unique.append(move)
+
+    return unique
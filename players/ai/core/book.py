@@ -0,0 +1,240 @@
+"""
+Opening book built from finished games.
+
+The builder replays recorded games and, for every position within the
+first `max_ply` plies, counts how often each move was played and how the
+player who played it scored in the end. A book player then plays the best
+scoring move while the game is still in the book and hands over to its
+fallback player once it leaves it.
+
+Knows NOTHING about any specific game: positions are identified through an
+injected `key` callable (which should be picklable if the book is saved),
+and games are replayed with the `core.game.Game` interface.
+"""
+
+from __future__ import annotations
+import pickle
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from core.files import atomic_write
+from core.game import Game
+from core.player import Player
+from core.state import State
+from core.types import Action, JointAction, PlayerID, Result
+
+KeyFn = Callable[[State], Hashable]
+
+
+# ---------------------------------------------------------------------------
+# Book
+# ---------------------------------------------------------------------------
+
+class OpeningBook:
+    """
+    Move statistics per (position key, player to move).
+
+    A move is only played from the book once it was seen at least
+    `min_count` times; among those, the one with the best mean score wins
+    (ties: most played, then first seen).
+    """
+
+    def __init__(self, key: KeyFn, max_ply: int = 6, min_count: int = 1):
+        if max_ply <= 0:
+            raise ValueError("max_ply must be positive.")
+        if min_count <= 0:
+            raise ValueError("min_count must be positive.")
+
+        self.key = key
+        self.max_ply = max_ply
+        self.min_count = min_count
+
+        # (position key, player) -> {action: [count, total score]}
+        self._entries: Dict[Tuple[Hashable, PlayerID], Dict[Action, List[float]]] = {}
+        self.games = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -----------------------------------------------------------------------
+    # Building
+    # -----------------------------------------------------------------------
+
+    def add_game(self, game: Game, history: Sequence, result: Result) -> None:
+        """
+        Add one finished game.
+
+        `history` is what `Match.run` returned with history="actions" (joint
+        actions) or "full" (states; the moves are then recovered by trying
+        the legal actions).
+        """
+        state = game.initial_state()
+        ply = 0
+
+        for joint_action in _joint_actions(game, history):
+            if ply >= self.max_ply:
+                break
+
+            position = self.key(state)
+            for pid, action in joint_action.items():
+                moves = self._entries.setdefault((position, pid), {})
+                stats = moves.get(action)
+                if stats is None:
+                    moves[action] = [1, result[pid]]
+                else:
+                    stats[0] += 1
+                    stats[1] += result[pid]
+
+            state = game.next_state(state, joint_action)
+            ply += 1
+
+        self.games += 1
+
+    def add_games(
+        self,
+        game: Game,
+        games: Iterable[Tuple[Result, Sequence]],
+    ) -> None:
+        """
+        Add (result, history) pairs, as returned by `Match.run`.
+        """
+        for result, history in games:
+            self.add_game(game, history, result)
+
+    # -----------------------------------------------------------------------
+    # Lookup
+    # -----------------------------------------------------------------------
+
+    def moves(self, state: State, player: PlayerID) -> Dict[Action, Tuple[int, float]]:
+        """
+        {action: (times played, mean score)} for `player` in `state`.
+        """
+        moves = self._entries.get((self.key(state), player), {})
+        return {a: (int(n), total / n) for a, (n, total) in moves.items()}
+
+    def choose(self, state: State, player: PlayerID) -> Optional[Action]:
+        """
+        Book move for `player` in `state`, or None if out of book.
+        """
+        moves = self._entries.get((self.key(state), player))
+        if not moves:
+            return None
+
+        best: Optional[Action] = None
+        best_rank: Tuple[float, float] = (float("-inf"), 0)
+
+        for action, (n, total) in moves.items():
+            if n < self.min_count:
+                continue
+            rank = (total / n, n)
+            if rank > best_rank:
+                best, best_rank = action, rank
+
+        return best
+
+    # -----------------------------------------------------------------------
+    # Persistence
+    # -----------------------------------------------------------------------
+
+    def save(self, path: str) -> None:
+        data = {
+            "max_ply": self.max_ply,
+            "min_count": self.min_count,
+            "games": self.games,
+            "entries": {
+                k: tuple((a, int(n), total) for a, (n, total) in moves.items())
+                for k, moves in self._entries.items()
+            },
+        }
+
+        atomic_write(
+            path, lambda f: pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+    @classmethod
+    def load(cls, path: str, key: KeyFn, min_count: Optional[int] = None) -> "OpeningBook":
+        """
+        Read a saved book; `min_count` overrides the stored threshold.
+        """
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+
+        book = cls(
+            key,
+            max_ply=data["max_ply"],
+            min_count=data["min_count"] if min_count is None else min_count,
+        )
+        book.games = data["games"]
+        book._entries = {
+            k: {a: [n, total] for a, n, total in moves}
+            for k, moves in data["entries"].items()
+        }
+        return book
+
+
+def _joint_actions(game: Game, history: Sequence) -> Iterable[JointAction]:
+    if not history or isinstance(history[0], Mapping):
+        yield from history
+        return
+
+    # a state history: find the joint action leading to each next state
+    for before, after in zip(history, history[1:]):
+        yield _recover_joint_action(game, before, after)
+
+
+def _recover_joint_action(game: Game, before: State, after: State) -> JointAction:
+    movers = list(game.active_players(before))
+    if len(movers) != 1:
+        raise ValueError("Moves can only be recovered from sequential games.")
+
+    pid = movers[0]
+    for action in game.legal_actions(before, pid):
+        if game.next_state(before, {pid: action}) == after:
+            return {pid: action}
+
+    raise ValueError("State history is not a legal game.")
+
+
+# ---------------------------------------------------------------------------
+# Player wrapper
+# ---------------------------------------------------------------------------
+
+class BookPlayer(Player):
+    """
+    Plays book moves while in book, otherwise asks `fallback`.
+
+    `book_moves` and `searched_moves` count how the moves were chosen.
+    """
+
+    def __init__(self, fallback: Player, book: OpeningBook):
+        super().__init__(fallback.player_id)
+        self.fallback = fallback
+        self.book = book
+
+        self.book_moves = 0
+        self.searched_moves = 0
+
+    def close(self) -> None:
+        close = getattr(self.fallback, "close", None)
+        if close is not None:
+            close()
+
+    def select_action(self, state: State, legal_actions: Iterable[Action]) -> Action:
+        legal_actions = list(legal_actions)
+
+        action = self.book.choose(state, self.player_id)
+        if action is not None and action in legal_actions:
+            self.book_moves += 1
+            return action
+
+        self.searched_moves += 1
+        return self.fallback.select_action(state, legal_actions)
@@ -0,0 +1,185 @@
+"""
+Bounded LRU cache of search results, shared across moves, games and players.
+
+Unlike a transposition table, which holds bounds valid within one search
+for one root player, a PositionCache holds final answers (e.g. the move a
+search settled on) keyed on the position AND the settings that produced
+them, so any player with the same settings can reuse them.
+
+`shared_cache()` returns one instance per name for the whole process, so
+players created afresh for every game still hit the results of earlier
+games. A cache can be backed by a file: it is loaded on creation and
+written back by `save()`. `CachedPlayer` puts one in front of any player.
+
+Knows NOTHING about any specific game: keys only need to be hashable (and
+picklable for disk backing).
+"""
+
+from __future__ import annotations
+import os
+import pickle
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from core.files import atomic_write
+from core.player import Player
+from core.state import State
+from core.types import Action
+
+
+class PositionCache:
+    """
+    Mapping from key to result with least-recently-used eviction once
+    `max_entries` is reached.
+    """
+
+    def __init__(self, max_entries: int = 100_000, path: Optional[str] = None):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive.")
+
+        self.max_entries = max_entries
+        self.path = path
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entries = self._entries
+
+        if key not in entries:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        entries.move_to_end(key)
+        return entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        entries = self._entries
+
+        if key in entries:
+            entries.move_to_end(key)
+        elif len(entries) >= self.max_entries:
+            entries.popitem(last=False)
+
+        entries[key] = value
+
+    # -----------------------------------------------------------------------
+    # Disk backing
+    # -----------------------------------------------------------------------
+
+    def load(self, path: Optional[str] = None) -> None:
+        """
+        Add the entries stored in `path` (default: the cache's own file).
+        """
+        path = self.path if path is None else path
+        if path is None:
+            raise ValueError("No cache file given.")
+
+        with open(path, "rb") as f:
+            stored: Dict[Hashable, Any] = pickle.load(f)
+
+        for key, value in stored.items():
+            self.put(key, value)
+
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Write all entries to `path` (default: the cache's own file).
+        """
+        path = self.path if path is None else path
+        if path is None:
+            raise ValueError("No cache file given.")
+
+        entries = dict(self._entries)
+        atomic_write(
+            path, lambda f: pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+
+# ---------------------------------------------------------------------------
+# Process-level instances
+# ---------------------------------------------------------------------------
+
+_shared: Dict[str, PositionCache] = {}
+
+
+def shared_cache(
+    name: str = "default",
+    max_entries: int = 100_000,
+    path: Optional[str] = None,
+) -> PositionCache:
+    """
+    Return this process's cache called `name`, creating it on first use
+    (later calls ignore `max_entries` and `path`).
+    """
+    cache = _shared.get(name)
+    if cache is None:
+        cache = _shared[name] = PositionCache(max_entries, path)
+    return cache
+
+
+# ---------------------------------------------------------------------------
+# Player wrapper
+# ---------------------------------------------------------------------------
+
+class CachedPlayer(Player):
+    """
+    Replays the move chosen before in the same position, otherwise asks
+    `player` and remembers its move.
+
+    `key(state)` identifies a position; `settings` (e.g. ("minimax", depth))
+    is part of every cache key, so players that could choose differently
+    never share moves. `cache` defaults to `shared_cache()`. Only wrap
+    players whose move depends on the position alone (no time budgets).
+
+    `cached_moves` and `searched_moves` count how the moves were chosen.
+    """
+
+    def __init__(
+        self,
+        player: Player,
+        key: Callable[[State], Hashable],
+        settings: Hashable = (),
+        cache: Optional[PositionCache] = None,
+    ):
+        super().__init__(player.player_id)
+        self.player = player
+        self.key = key
+        self.settings = settings
+        self.cache = shared_cache() if cache is None else cache
+
+        self.cached_moves = 0
+        self.searched_moves = 0
+
+    def close(self) -> None:
+        close = getattr(self.player, "close", None)
+        if close is not None:
+            close()
+
+    def select_action(self, state: State, legal_actions: Iterable[Action]) -> Action:
+        key = (self.settings, self.key(state))
+
+        action = self.cache.get(key)
+        if action is not None:
+            self.cached_moves += 1
+            return action
+
+        self.searched_moves += 1
+        action = self.player.select_action(state, legal_actions)
+        self.cache.put(key, action)
+        return action
@@ -0,0 +1,105 @@
+"""
+Child generation for the generic search engines.
+
+Engines either receive copying `next_states` (one new state per child) or
+the make/unmake triple `legal_actions` / `apply` / `undo`, which walks the
+tree by mutating a single state in place. `iter_children` hides the difference:
+in the in-place case every yielded child is the parent object itself, with
+the action applied, and it is undone when iteration resumes or the iterator
+is closed.
+
+Given `legal_actions` and an action-level `next_state` instead, copying
+children are built one at a time as the iteration reaches them, so the
+siblings left after a cutoff are never generated.
+
+Consumers must therefore not keep references to in-place children, and
+must `close()` the iterator after breaking out of a loop (before touching
+the parent state again).
+"""
+
+from __future__ import annotations
+from typing import Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+from players.ai.core.search.ordering import MoveOrdering, action_first, move_first
+
+StateT = TypeVar("StateT")
+ActionT = TypeVar("ActionT")
+
+
+# ---------------------------------------------------------------------------
+# Injected behavior contracts
+# ---------------------------------------------------------------------------
+
+NextStatesFn = Callable[[StateT], Iterable[Tuple[ActionT, StateT]]]
+LegalActionsFn = Callable[[StateT], Iterable[ActionT]]
+ApplyFn = Callable[[StateT, ActionT], None]
+UndoFn = Callable[[StateT], None]
+NextStateFn = Callable[[StateT, ActionT], StateT]
+
+
+# ---------------------------------------------------------------------------
+# Child iteration
+# ---------------------------------------------------------------------------
+
+def iter_children(
+    state: StateT,
+    *,
+    next_states: NextStatesFn,
+    legal_actions: Optional[LegalActionsFn] = None,
+    apply: Optional[ApplyFn] = None,
+    undo: Optional[UndoFn] = None,
+    first: Optional[ActionT] = None,
+    next_state: Optional[NextStateFn] = None,
+    ordering: Optional[MoveOrdering] = None,
+    ply: int = 0,
+) -> Iterable[Tuple[ActionT, StateT]]:
+    """
+    Iterate (action, child) pairs: in place when `apply` is given, lazily
+    copied when `next_state` (and `legal_actions`) are, else from
+    `next_states`.
+
+    `first`, if given, is moved to the front of the order; `ordering`, if
+    given, orders the rest (`ply` is the distance from the root).
+    """
+    if apply is None and next_state is None:
+        expanded = next_states(state)
+        if ordering is not None:
+            return ordering.order_children(state, expanded, ply, first)
+        return expanded if first is None else action_first(expanded, first)
+
+    assert legal_actions is not None
+
+    actions = legal_actions(state)
+    if ordering is not None:
+        actions = ordering.order(state, actions, ply, first)
+    elif first is not None:
+        actions = move_first(actions, first)
+
+    if apply is None:
+        return generated(state, actions, next_state)
+
+    assert undo is not None
+    return applied(state, actions, apply, undo)
+
+
+def generated(
+    state: StateT,
+    actions: Iterable[ActionT],
+    next_state: NextStateFn,
+) -> Iterator[Tuple[ActionT, StateT]]:
+    for action in actions:
+        yield action, next_state(state, action)
+
+
+def applied(
+    state: StateT,
+    actions: Iterable[ActionT],
+    apply: ApplyFn,
+    undo: UndoFn,
+) -> Iterator[Tuple[ActionT, StateT]]:
+    for action in actions:
+        apply(state, action)
+        try:
+            yield action, state
+        finally:
+            undo(state)
@@ -0,0 +1,160 @@
+"""
+Anytime iterative-deepening driver for the generic search engines.
+
+Runs a fixed-depth decision function at depth 1, 2, 3, ... until a
+wall-clock or node budget runs out, and returns the best action of the last
+iteration that completed. Each iteration searches the previous best action
+first at the root; with a transposition table the engines also try the
+stored best move first at every node, which replays the previous best line.
+
+Works with any decision function that takes `is_terminal`, `evaluate`,
+`next_states`, `depth` and `principal` keywords (minimax_decision,
+max_n_decision). Budgets are enforced by wrapping the injected callables
+(`next_states`, or `legal_actions` for in-place search), so the engines
+themselves know nothing about time.
+"""
+
+from __future__ import annotations
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+StateT = TypeVar("StateT")
+ActionT = TypeVar("ActionT")
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside a search when its budget is exhausted.
+    """
+
+
+# ---------------------------------------------------------------------------
+# Budget
+# ---------------------------------------------------------------------------
+
+class SearchBudget:
+    """
+    Wall-clock (seconds) and/or node (expansions) budget for one decision.
+    """
+
+    def __init__(
+        self,
+        time_budget: Optional[float] = None,
+        node_budget: Optional[int] = None,
+    ):
+        self.deadline = (
+            None if time_budget is None else time.perf_counter() + time_budget
+        )
+        self.node_budget = node_budget
+        self.nodes = 0
+
+    def exhausted(self) -> bool:
+        if self.node_budget is not None and self.nodes >= self.node_budget:
+            return True
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def charge(self) -> None:
+        """
+        Count one expansion; raise SearchTimeout once over budget.
+        """
+        self.nodes += 1
+        if self.exhausted():
+            raise SearchTimeout()
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def iterative_deepening(
+    decide: Callable[..., ActionT],
+    state: StateT,
+    *args: Any,
+    is_terminal: Callable[[StateT], bool],
+    evaluate: Callable[..., Any],
+    next_states: Callable[[StateT], Any],
+    max_depth: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    node_budget: Optional[int] = None,
+    **kwargs: Any,
+) -> ActionT:
+    """
+    Return the best action found within the budget.
+
+    `args` and `kwargs` are passed through to `decide`. The first iteration
+    always runs to completion so that an action is available.
+
+    Deepening stops early at `max_depth`, or - when no transposition table is
+    given - after an iteration that never cut a line off at the depth limit,
+    since a deeper search would only repeat it.
+    """
+
+    budget = SearchBudget(time_budget, node_budget)
+    armed = False
+    cutoff_seen = False
+    last_terminal = True
+
+    def charged(expand: Callable[[StateT], Any]) -> Callable[[StateT], Any]:
+        def timed(s: StateT) -> Any:
+            if armed:
+                budget.charge()
+            else:
+                budget.nodes += 1
+            return expand(s)
+        return timed
+
+    # in-place engines expand through legal_actions instead of next_states
+    if kwargs.get("legal_actions") is not None:
+        kwargs["legal_actions"] = charged(kwargs["legal_actions"])
+
+    def tracked_is_terminal(s: StateT) -> bool:
+        nonlocal last_terminal
+        last_terminal = is_terminal(s)
+        return last_terminal
+
+    def tracked_evaluate(s: StateT, *rest: Any) -> Any:
+        nonlocal cutoff_seen
+        # engines only evaluate non-terminal states at the depth limit
+        if not last_terminal:
+            cutoff_seen = True
+        return evaluate(s, *rest)
+
+    # the default aspiration/MTD(f) guess is an evaluation of the root, not
+    # a depth-limit cutoff: make it here, outside the tracked evaluate
+    if kwargs.get("algorithm") in ("aspiration", "mtdf") and kwargs.get("guess") is None:
+        kwargs["guess"] = evaluate(state, *args)
+
+    best: Optional[ActionT] = None
+    depth = 1
+
+    while max_depth is None or depth <= max_depth:
+        cutoff_seen = False
+
+        try:
+            action = decide(
+                state,
+                *args,
+                is_terminal=tracked_is_terminal,
+                evaluate=tracked_evaluate,
+                next_states=charged(next_states),
+                depth=depth,
+                principal=best,
+                **kwargs,
+            )
+        except SearchTimeout:
+            break
+
+        best = action
+        armed = True
+
+        if not cutoff_seen and kwargs.get("table") is None:
+            break
+        if budget.exhausted():
+            break
+
+        depth += 1
+
+    if best is None:
+        raise ValueError("No legal actions available.")
+
+    return best
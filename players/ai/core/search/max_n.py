@@ -5,6 +5,16 @@ Works for any sequential multi-player game where exactly one player moves
 at each state.
 
 All game knowledge is injected via callables.
+
+Pruning variants (selected on `max_n_decision`):
+  - "none":     plain Max^n, full tree.
+  - "shallow":  Korf's shallow pruning. Needs an upper bound on the sum of
+                all players' utilities and a lower bound on each utility;
+                returns the same action as plain Max^n.
+  - "paranoid": assumes all other players form a coalition minimizing the
+                root player's utility, which reduces the search to
+                alpha-beta minimax. Usually a different (more cautious)
+                action, at a fraction of the cost.
 """
 
 from __future__ import annotations
@@ -12,6 +22,15 @@ from typing import Callable, Iterable, Tuple, Optional, TypeVar, Sequence
 
 from core.types import PlayerID, Result
 
+from players.ai.core.search.inplace import (
+    iter_children,
+    LegalActionsFn,
+    ApplyFn,
+    UndoFn,
+)
+from players.ai.core.search.minimax import minimax_decision
+from players.ai.core.search.stats import SearchStats
+
 StateT = TypeVar("StateT")
 ActionT = TypeVar("ActionT")
 
@@ -24,6 +43,22 @@ EvaluateFn = Callable[[StateT],Result]
 NextStatesFn = Callable[[StateT], Iterable[Tuple[ActionT, StateT]]]
 CurrentPlayerFn = Callable[[StateT], PlayerID]
 
+PRUNING_MODES = ("none", "shallow", "paranoid")
+
+
+def shallow_cutoff(
+    value: Result,
+    player: PlayerID,
+    parent_best: float,
+    max_sum: float,
+    min_utility: float,
+) -> bool:
+    """
+    True if a node whose mover `player` can already get `value` leaves
+    another player, moving at its parent, no more than `parent_best`.
+    """
+    return max_sum - value[player] - (len(value) - 2) * min_utility <= parent_best
+
 
 # ---------------------------------------------------------------------------
 # Max^n recursion
@@ -37,19 +72,58 @@ def max_n(
     next_states: NextStatesFn,
     current_player: CurrentPlayerFn,
     depth: Optional[int],
+    legal_actions: Optional[LegalActionsFn] = None,
+    apply: Optional[ApplyFn] = None,
+    undo: Optional[UndoFn] = None,
+    max_sum: Optional[float] = None,
+    min_utility: float = 0.0,
+    parent_best: Optional[float] = None,
+    parent_player: Optional[PlayerID] = None,
+    stats: Optional[SearchStats] = None,
+    ply: int = 0,
 ) -> Result:
     """
     Returns utility vector for the state.
+
+    If `apply`/`undo`/`legal_actions` are given, the tree is walked by
+    mutating `state` in place instead of calling `next_states`.
+
+    With `max_sum` (upper bound on the sum of utilities) and `min_utility`
+    (lower bound on any single utility), shallow pruning is applied:
+    `parent_best` is the best utility `parent_player` (the player moving at
+    the parent) has secured so far, and once this node can no longer beat
+    it the remaining children are skipped. The vector returned then is only
+    a bound, which the parent rejects. The bound holds only if a different
+    player moves here, so nodes where `parent_player` moves again are never
+    cut off.
+
+    `stats`, if given, records the work done; `ply` is the distance from
+    the root, used to attribute nodes to plies.
     """
 
+    if stats is not None:
+        stats.node(ply)
+
     # terminal or depth cutoff
-    if is_terminal(state) or depth == 0:
+    terminal = is_terminal(state)
+    if terminal or depth == 0:
+        if stats is not None:
+            stats.evaluation(terminal)
         return evaluate(state)
 
     player = current_player(state)
     best_value: Optional[Result] = None
+    index = -1
+
+    children = iter_children(
+        state,
+        next_states=next_states,
+        legal_actions=legal_actions,
+        apply=apply,
+        undo=undo,
+    )
 
-    for _, child in next_states(state):
+    for index, (_, child) in enumerate(children):
         value = max_n(
             child,
             is_terminal=is_terminal,
@@ -57,11 +131,37 @@ def max_n(
             next_states=next_states,
             current_player=current_player,
             depth=None if depth is None else depth - 1,
+            legal_actions=legal_actions,
+            apply=apply,
+            undo=undo,
+            max_sum=max_sum,
+            min_utility=min_utility,
+            parent_best=None if best_value is None else best_value[player],
+            parent_player=player,
+            stats=stats,
+            ply=ply + 1,
         )
 
         if best_value is None or value[player] > best_value[player]:
             best_value = value
 
+            # shallow cutoff: the parent's player gets at most what is left
+            if (
+                max_sum is not None
+                and parent_best is not None
+                and player != parent_player
+                and shallow_cutoff(value, player, parent_best, max_sum, min_utility)
+            ):
+                if stats is not None:
+                    stats.cutoff(index)
+                break
+
+    if apply is not None:
+        children.close()
+
+    if stats is not None:
+        stats.expansion(index + 1)
+
     if best_value is None:
         raise ValueError("No legal moves found.")
 
@@ -81,15 +181,77 @@ def max_n_decision(
     next_states: NextStatesFn,
     current_player: CurrentPlayerFn,
     depth: Optional[int],
+    principal: Optional[ActionT] = None,
+    legal_actions: Optional[LegalActionsFn] = None,
+    apply: Optional[ApplyFn] = None,
+    undo: Optional[UndoFn] = None,
+    pruning: str = "none",
+    max_sum: Optional[float] = None,
+    min_utility: float = 0.0,
+    stats: Optional[SearchStats] = None,
 ) -> ActionT:
     """
     Return optimal action for root player.
+
+    `principal`, if given, is searched first (e.g. the best action of a
+    previous, shallower search).
+
+    In-place search (`apply`/`undo`/`legal_actions`) mutates `state` and
+    restores it on return; pass a copy if the search may be interrupted.
+
+    `pruning` is one of PRUNING_MODES; "shallow" requires `max_sum` (and
+    `min_utility` if utilities can be negative). Shallow cutoffs are only
+    taken between plies of different players, so games where a player may
+    move twice in a row are searched correctly, if with less pruning.
+
+    `stats`, if given, is filled in with the work done by this search
+    (added to whatever it already holds).
     """
 
+    if pruning not in PRUNING_MODES:
+        raise ValueError(f"Unknown pruning mode: {pruning!r}")
+
+    if pruning == "paranoid":
+        return minimax_decision(
+            state,
+            root_player,
+            is_terminal=is_terminal,
+            evaluate=RootUtility(evaluate),
+            next_states=next_states,
+            current_player=current_player,
+            depth=depth,
+            principal=principal,
+            legal_actions=legal_actions,
+            apply=apply,
+            undo=undo,
+            stats=stats,
+        )
+
+    if pruning == "shallow":
+        if max_sum is None:
+            raise ValueError("Shallow pruning requires max_sum.")
+    else:
+        max_sum = None
+
+    if stats is not None:
+        stats.begin()
+        stats.node(0)
+
     best_action: Optional[ActionT] = None
     best_value: Optional[Result] = None
+    searched = 0
 
-    for action, child in next_states(state):
+    children = iter_children(
+        state,
+        next_states=next_states,
+        legal_actions=legal_actions,
+        apply=apply,
+        undo=undo,
+        first=principal,
+    )
+
+    for action, child in children:
+        searched += 1
 
         value = max_n(
             child,
@@ -98,13 +260,43 @@ def max_n_decision(
             next_states=next_states,
             current_player=current_player,
             depth=None if depth is None else depth - 1,
+            legal_actions=legal_actions,
+            apply=apply,
+            undo=undo,
+            max_sum=max_sum,
+            min_utility=min_utility,
+            parent_best=None if best_value is None else best_value[root_player],
+            parent_player=root_player,
+            stats=stats,
+            ply=1,
         )
 
         if best_value is None or value[root_player] > best_value[root_player]:
             best_value = value
             best_action = action
 
+    if stats is not None:
+        stats.expansion(searched)
+        stats.end()
+
     if best_action is None:
         raise ValueError("No legal actions available.")
 
     return best_action
+
+
+# ---------------------------------------------------------------------------
+# Paranoid reduction
+# ---------------------------------------------------------------------------
+
+class RootUtility:
+    """
+    Adapts a utility-vector evaluation to minimax's (state, root_player)
+    scalar contract. A class rather than a closure so it stays picklable.
+    """
+
+    def __init__(self, evaluate: EvaluateFn):
+        self.evaluate = evaluate
+
+    def __call__(self, state: StateT, root_player: PlayerID) -> float:
+        return self.evaluate(state)[root_player]
@@ -0,0 +1,261 @@
+"""
+Pure generic Monte Carlo Tree Search (UCT).
+
+Works for any sequential N-player game where exactly one player moves at
+each state. Rewards are the utility vectors returned by `result` at the
+end of a playout; every node accumulates the reward of the player who moved
+into it, so each player maximizes their own utility during selection.
+
+The tree is kept between decisions: after a move, the subtree below the
+chosen action becomes the new root, and the next `search` starts from the
+matching descendant if the game went where the tree already looked.
+
+All game knowledge is injected via callables.
+"""
+
+from __future__ import annotations
+import math
+import random
+import time
+from collections import deque
+from typing import Callable, Generic, List, Optional, Sequence, TypeVar
+
+from core.types import PlayerID, Result
+
+StateT = TypeVar("StateT")
+ActionT = TypeVar("ActionT")
+
+
+# ---------------------------------------------------------------------------
+# Injected behavior contracts
+# ---------------------------------------------------------------------------
+
+IsTerminalFn = Callable[[StateT], bool]
+ResultFn = Callable[[StateT], Result]
+LegalActionsFn = Callable[[StateT], Sequence[ActionT]]
+NextStateFn = Callable[[StateT, ActionT], StateT]
+CurrentPlayerFn = Callable[[StateT], PlayerID]
+RolloutFn = Callable[[StateT, random.Random], Result]
+
+
+# ---------------------------------------------------------------------------
+# Tree nodes
+# ---------------------------------------------------------------------------
+
+class Node(Generic[StateT, ActionT]):
+    """
+    One tree node. `mover` is the player whose action led here and `total`
+    the sum of that player's rewards over all playouts through the node.
+    """
+
+    __slots__ = (
+        "state",
+        "parent",
+        "action",
+        "mover",
+        "children",
+        "untried",
+        "visits",
+        "total",
+    )
+
+    def __init__(
+        self,
+        state: StateT,
+        parent: Optional["Node[StateT, ActionT]"],
+        action: Optional[ActionT],
+        mover: Optional[PlayerID],
+        untried: List[ActionT],
+    ):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.mover = mover
+        self.children: List["Node[StateT, ActionT]"] = []
+        self.untried = untried
+        self.visits = 0
+        self.total = 0.0
+
+
+# ---------------------------------------------------------------------------
+# Search
+# ---------------------------------------------------------------------------
+
+class MCTS(Generic[StateT, ActionT]):
+    """
+    UCT search with tree reuse between decisions.
+
+    `exploration` is the UCT constant c in  mean + c * sqrt(ln N / n).
+    `rollout` replaces the default uniformly random playout.
+    `reuse_depth` bounds how many plies below the previous root the next
+    position is looked for (2 covers one move by each of two players).
+    """
+
+    def __init__(
+        self,
+        *,
+        is_terminal: IsTerminalFn,
+        result: ResultFn,
+        legal_actions: LegalActionsFn,
+        next_state: NextStateFn,
+        current_player: CurrentPlayerFn,
+        exploration: float = math.sqrt(2.0),
+        rollout: Optional[RolloutFn] = None,
+        reuse_depth: int = 2,
+        seed: Optional[int] = None,
+    ):
+        self.is_terminal = is_terminal
+        self.result = result
+        self.legal_actions = legal_actions
+        self.next_state = next_state
+        self.current_player = current_player
+        self.exploration = exploration
+        self.rollout = rollout if rollout is not None else self._random_rollout
+        self.reuse_depth = reuse_depth
+        self._rng = random.Random(seed)
+        self.root: Optional[Node[StateT, ActionT]] = None
+
+    # -----------------------------------------------------------------------
+    # Public API
+    # -----------------------------------------------------------------------
+
+    def search(
+        self,
+        state: StateT,
+        *,
+        iterations: Optional[int] = None,
+        time_budget: Optional[float] = None,
+    ) -> ActionT:
+        """
+        Run playouts from `state` and return the most visited action.
+
+        Stops after `iterations` playouts or `time_budget` seconds, whichever
+        comes first (at least one playout always runs); at least one of them
+        must be given.
+        """
+        if iterations is None and time_budget is None:
+            raise ValueError("MCTS needs an iteration or time budget.")
+
+        root = self._find_root(state)
+
+        if not root.untried and not root.children:
+            raise ValueError("No legal actions available.")
+
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        done = 0
+
+        while iterations is None or done < iterations:
+            # always complete one playout so there is an action to return
+            if done and deadline is not None and time.perf_counter() >= deadline:
+                break
+            self._iterate(root)
+            done += 1
+
+        best = max(root.children, key=lambda n: n.visits)
+
+        # keep the chosen subtree for the next decision
+        best.parent = None
+        self.root = best
+
+        return best.action
+
+    def reset(self) -> None:
+        self.root = None
+
+    # -----------------------------------------------------------------------
+    # One playout
+    # -----------------------------------------------------------------------
+
+    def _iterate(self, root: Node[StateT, ActionT]) -> None:
+        node = root
+
+        # --- selection ---
+        while not node.untried and node.children:
+            node = self._select_child(node)
+
+        # --- expansion ---
+        if node.untried:
+            action = node.untried.pop()
+            node = self._expand(node, action)
+
+        # --- simulation ---
+        if self.is_terminal(node.state):
+            reward = self.result(node.state)
+        else:
+            reward = self.rollout(node.state, self._rng)
+
+        # --- backpropagation ---
+        while node is not None:
+            node.visits += 1
+            if node.mover is not None:
+                node.total += reward[node.mover]
+            node = node.parent
+
+    def _select_child(self, node: Node[StateT, ActionT]) -> Node[StateT, ActionT]:
+        c_log_n = self.exploration * math.sqrt(math.log(node.visits))
+
+        best: Optional[Node[StateT, ActionT]] = None
+        best_score = float("-inf")
+
+        for child in node.children:
+            score = child.total / child.visits + c_log_n / math.sqrt(child.visits)
+            if score > best_score:
+                best_score = score
+                best = child
+
+        assert best is not None
+        return best
+
+    def _expand(
+        self, parent: Node[StateT, ActionT], action: ActionT
+    ) -> Node[StateT, ActionT]:
+        child = Node(
+            self.next_state(parent.state, action),
+            parent,
+            action,
+            self.current_player(parent.state),
+            [],
+        )
+        child.untried = self._untried(child.state)
+        parent.children.append(child)
+        return child
+
+    def _untried(self, state: StateT) -> List[ActionT]:
+        if self.is_terminal(state):
+            return []
+
+        actions = list(self.legal_actions(state))
+        # popped from the end: shuffle so expansion order is unbiased
+        self._rng.shuffle(actions)
+        return actions
+
+    def _random_rollout(self, state: StateT, rng: random.Random) -> Result:
+        while not self.is_terminal(state):
+            actions = self.legal_actions(state)
+            state = self.next_state(state, actions[rng.randrange(len(actions))])
+        return self.result(state)
+
+    # -----------------------------------------------------------------------
+    # Tree reuse
+    # -----------------------------------------------------------------------
+
+    def _find_root(self, state: StateT) -> Node[StateT, ActionT]:
+        """
+        Return the retained node for `state`, or a fresh root.
+        """
+        if self.root is not None:
+            frontier = deque([(self.root, 0)])
+
+            while frontier:
+                node, depth = frontier.popleft()
+
+                if node.state == state:
+                    node.parent = None
+                    self.root = node
+                    return node
+
+                if depth < self.reuse_depth:
+                    frontier.extend((child, depth + 1) for child in node.children)
+
+        self.root = Node(state, None, None, None, self._untried(state))
+        return self.root
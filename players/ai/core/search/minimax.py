@@ -6,10 +6,22 @@ All game knowledge is injected via callables.
 """
 
 from __future__ import annotations
+import math
 from typing import Callable, Iterable, Tuple, Optional, TypeVar
 
 from core.types import PlayerID
 
+from players.ai.core.search.inplace import (
+    iter_children,
+    LegalActionsFn,
+    ApplyFn,
+    UndoFn,
+    NextStateFn,
+)
+from players.ai.core.search.ordering import MoveOrdering
+from players.ai.core.search.stats import SearchStats
+from players.ai.core.search.transposition import TranspositionTable, bound_flag, probe
+
 StateT = TypeVar("StateT")
 ActionT = TypeVar("ActionT")
 
@@ -39,25 +51,92 @@ def minimax(
     depth: Optional[int],
     alpha: float,
     beta: float,
+    table: Optional[TranspositionTable] = None,
+    legal_actions: Optional[LegalActionsFn] = None,
+    apply: Optional[ApplyFn] = None,
+    undo: Optional[UndoFn] = None,
+    stats: Optional[SearchStats] = None,
+    ply: int = 0,
+    next_state: Optional[NextStateFn] = None,
+    ordering: Optional[MoveOrdering] = None,
+    pvs: bool = False,
 ) -> float:
     """
     Return minimax value of a state from root_player perspective.
+
+    If `table` is given, results are cached in it with bound flags and
+    positions already searched deeply enough are not searched again. The
+    stored best move of a position is searched first when it is revisited.
+
+    If `apply`/`undo`/`legal_actions` are given, the tree is walked by
+    mutating `state` in place instead of calling `next_states`; a table
+    must then be given a `key` that does not hold on to the state.
+
+    With `next_state` (and `legal_actions`) instead, children are copied
+    one at a time, so pruned siblings are never generated.
+
+    `ordering`, if given, orders children after the table move (killers,
+    history, static priority) and learns from every cutoff.
+
+    With `pvs` (principal variation search), every child after the first
+    is searched with a null window that only tells whether it beats the
+    best value so far, and searched again with the full window if it does.
+
+    `stats`, if given, records the work done; `ply` is the distance from
+    the root, used to attribute nodes to plies.
     """
 
+    if stats is not None:
+        stats.node(ply)
+
     # --- terminal or depth cutoff ---
-    if is_terminal(state) or depth == 0:
+    terminal = is_terminal(state)
+    if terminal or depth == 0:
+        if stats is not None:
+            stats.evaluation(terminal)
         return evaluate(state, root_player)
 
+    hint: Optional[ActionT] = None
+
+    # --- transposition table probe ---
+    if table is not None:
+        stored, alpha, beta, hint = probe(table, state, depth, alpha, beta)
+        if stored is not None:
+            if stats is not None:
+                stats.table_hits += 1
+            return stored
+
+    children = iter_children(
+        state,
+        next_states=next_states,
+        legal_actions=legal_actions,
+        apply=apply,
+        undo=undo,
+        first=hint,
+        next_state=next_state,
+        ordering=ordering,
+        ply=ply,
+    )
+
+    alpha_orig = alpha
+    beta_orig = beta
+    best_action: Optional[ActionT] = None
+    index = -1
+
     maximizing = current_player(state) == root_player
 
     # --- maximizing branch ---
     if maximizing:
         value = float("-inf")
 
-        for _, child in next_states(state):
-            value = max(
-                value,
-                minimax(
+        for index, (action, child) in enumerate(children):
+            low, high = alpha, beta
+            null_window = pvs and index > 0
+            if null_window:
+                high = math.nextafter(alpha, math.inf)
+
+            while True:
+                child_value = minimax(
                     child,
                     root_player,
                     is_terminal=is_terminal,
@@ -65,25 +144,48 @@ def minimax(
                     next_states=next_states,
                     current_player=current_player,
                     depth=None if depth is None else depth - 1,
-                    alpha=alpha,
-                    beta=beta,
-                ),
-            )
+                    alpha=low,
+                    beta=high,
+                    table=table,
+                    legal_actions=legal_actions,
+                    apply=apply,
+                    undo=undo,
+                    stats=stats,
+                    ply=ply + 1,
+                    next_state=next_state,
+                    ordering=ordering,
+                    pvs=pvs,
+                )
+                if not null_window or not alpha < child_value < beta:
+                    break
+                # the null window failed high: search again for the exact value
+                null_window = False
+                low, high = child_value, beta
+
+            if best_action is None or child_value > value:
+                value = child_value
+                best_action = action
 
             alpha = max(alpha, value)
             if beta <= alpha:
+                if stats is not None:
+                    stats.cutoff(index)
+                if ordering is not None:
+                    ordering.cutoff(action, ply, depth)
                 break
 
-        return value
-
     # --- minimizing branch ---
     else:
         value = float("inf")
 
-        for _, child in next_states(state):
-            value = min(
-                value,
-                minimax(
+        for index, (action, child) in enumerate(children):
+            low, high = alpha, beta
+            null_window = pvs and index > 0
+            if null_window:
+                low = math.nextafter(beta, -math.inf)
+
+            while True:
+                child_value = minimax(
                     child,
                     root_player,
                     is_terminal=is_terminal,
@@ -91,22 +193,62 @@ def minimax(
                     next_states=next_states,
                     current_player=current_player,
                     depth=None if depth is None else depth - 1,
-                    alpha=alpha,
-                    beta=beta,
-                ),
-            )
+                    alpha=low,
+                    beta=high,
+                    table=table,
+                    legal_actions=legal_actions,
+                    apply=apply,
+                    undo=undo,
+                    stats=stats,
+                    ply=ply + 1,
+                    next_state=next_state,
+                    ordering=ordering,
+                    pvs=pvs,
+                )
+                if not null_window or not alpha < child_value < beta:
+                    break
+                # the null window failed low: search again for the exact value
+                null_window = False
+                low, high = alpha, child_value
+
+            if best_action is None or child_value < value:
+                value = child_value
+                best_action = action
 
             beta = min(beta, value)
             if beta <= alpha:
+                if stats is not None:
+                    stats.cutoff(index)
+                if ordering is not None:
+                    ordering.cutoff(action, ply, depth)
                 break
 
-        return value
+    if apply is not None:
+        children.close()
+
+    if stats is not None:
+        stats.expansion(index + 1)
+
+    # --- transposition table store ---
+    if table is not None and best_action is not None:
+        table.store(state, value, depth, bound_flag(value, alpha_orig, beta_orig), best_action)
+
+    return value
 
 
 # ---------------------------------------------------------------------------
 # Decision helper
 # ---------------------------------------------------------------------------
 
+# "alphabeta"   every root child searched with a full window
+# "pvs"         principal variation search, at the root and below
+# "aspiration"  alpha-beta in a window of +-`window` around `guess`, widened
+#               to the full window if the value falls outside it
+# "mtdf"        MTD(f): null-window searches of the root, converging on its
+#               value from `guess` through the transposition table
+ALGORITHMS = ("alphabeta", "pvs", "aspiration", "mtdf")
+
+
 def minimax_decision(
     state: StateT,
     root_player: PlayerID,
@@ -116,30 +258,204 @@ def minimax_decision(
     next_states: NextStatesFn,
     current_player: CurrentPlayerFn,
     depth: Optional[int],
+    table: Optional[TranspositionTable] = None,
+    principal: Optional[ActionT] = None,
+    legal_actions: Optional[LegalActionsFn] = None,
+    apply: Optional[ApplyFn] = None,
+    undo: Optional[UndoFn] = None,
+    stats: Optional[SearchStats] = None,
+    next_state: Optional[NextStateFn] = None,
+    ordering: Optional[MoveOrdering] = None,
+    algorithm: str = "alphabeta",
+    guess: Optional[float] = None,
+    window: float = 0.5,
 ) -> ActionT:
     """
     Return optimal action for the player to move in `state`.
+
+    `table` is an optional transposition table shared by all root children
+    (and, if the caller keeps it, by later decisions for the same root player).
+
+    `principal`, if given, is searched first (e.g. the best action of a
+    previous, shallower search).
+
+    In-place search (`apply`/`undo`/`legal_actions`) mutates `state` and
+    restores it on return; pass a copy if the search may be interrupted.
+
+    `next_state` and `ordering` are passed on to `minimax`. Root children
+    are not reordered: the returned action does not depend on `ordering`.
+
+    `algorithm` is one of ALGORITHMS. All of them return the same action:
+    the first root child, in search order, with the best value. `guess`
+    (default: the evaluation of `state`) is where "aspiration" and "mtdf"
+    start; a narrow `window` pays off with integer-valued evaluations. MTD(f)
+    relies on a transposition table and creates one for the decision if
+    none is given (not possible with in-place search: pass one with a key).
+
+    `stats`, if given, is filled in with the work done by this search
+    (added to whatever it already holds).
     """
 
-    root_is_maximizing = current_player(state) == root_player
+    if algorithm not in ALGORITHMS:
+        raise ValueError(
+            f"Unknown algorithm {algorithm!r} (choose from {', '.join(ALGORITHMS)})."
+        )
 
-    best_action: Optional[ActionT] = None
-    best_value = float("-inf") if root_is_maximizing else float("inf")
+    if algorithm == "mtdf" and table is None:
+        if apply is not None:
+            raise ValueError("MTD(f) with in-place search needs a table with a key.")
+        table = TranspositionTable()
 
-    for action, child in next_states(state):
-        value = minimax(
-            child,
-            root_player,
-            is_terminal=is_terminal,
-            evaluate=evaluate,
-            next_states=next_states,
-            current_player=current_player,
-            depth=None if depth is None else depth - 1,
-            alpha=float("-inf"),
-            beta=float("inf"),
+    search = dict(
+        is_terminal=is_terminal,
+        evaluate=evaluate,
+        next_states=next_states,
+        current_player=current_player,
+        table=table,
+        legal_actions=legal_actions,
+        apply=apply,
+        undo=undo,
+        stats=stats,
+        next_state=next_state,
+        ordering=ordering,
+    )
+
+    if stats is not None:
+        stats.begin()
+
+    if guess is None and algorithm in ("aspiration", "mtdf"):
+        guess = evaluate(state, root_player)
+
+    inf = float("inf")
+
+    if algorithm == "alphabeta":
+        _, best_action = _search_root(
+            state, root_player, depth, principal, -inf, inf, narrow=False, **search
         )
 
-        if root_is_maximizing:
+    elif algorithm == "pvs":
+        _, best_action = _search_root(
+            state, root_player, depth, principal, -inf, inf, pvs=True, **search
+        )
+
+    elif algorithm == "aspiration":
+        low, high = guess - window, guess + window
+        value, best_action = _search_root(state, root_player, depth, principal, low, high, **search)
+        if not low < value < high:
+            value, best_action = _search_root(
+                state, root_player, depth, principal, -inf, inf, **search
+            )
+
+    else:
+        value = _mtdf(state, root_player, depth, guess, **search)
+        best_action = _first_with_value(state, root_player, depth, principal, value, **search)
+
+    if stats is not None:
+        stats.end()
+
+    if best_action is None:
+        raise ValueError("No legal actions available.")
+
+    return best_action
+
+
+def _search_root(
+    state: StateT,
+    root_player: PlayerID,
+    depth: Optional[int],
+    principal: Optional[ActionT],
+    alpha: float,
+    beta: float,
+    *,
+    narrow: bool = True,
+    pvs: bool = False,
+    current_player: CurrentPlayerFn,
+    next_states: NextStatesFn,
+    legal_actions: Optional[LegalActionsFn],
+    apply: Optional[ApplyFn],
+    undo: Optional[UndoFn],
+    stats: Optional[SearchStats],
+    next_state: Optional[NextStateFn],
+    **search,
+) -> Tuple[float, Optional[ActionT]]:
+    """
+    Search the root children within (alpha, beta); return (value, action).
+
+    With `narrow`, each child after the first only has to beat the best
+    value so far; otherwise each is searched within (alpha, beta). Either
+    way a later child with an equal value never replaces an earlier one.
+    """
+
+    if stats is not None:
+        stats.node(0)
+
+    maximizing = current_player(state) == root_player
+
+    best_action: Optional[ActionT] = None
+    best_value = float("-inf") if maximizing else float("inf")
+
+    children = iter_children(
+        state,
+        next_states=next_states,
+        legal_actions=legal_actions,
+        apply=apply,
+        undo=undo,
+        first=principal,
+        next_state=next_state,
+    )
+
+    searched = 0
+
+    for action, child in children:
+        searched += 1
+
+        low, high = alpha, beta
+        if narrow and best_action is not None:
+            if maximizing:
+                low = max(alpha, best_value)
+            else:
+                high = min(beta, best_value)
+
+        null_window = pvs and best_action is not None
+        if null_window:
+            if maximizing:
+                high = math.nextafter(low, math.inf)
+            else:
+                low = math.nextafter(high, -math.inf)
+
+        while True:
+            value = minimax(
+                child,
+                root_player,
+                current_player=current_player,
+                next_states=next_states,
+                legal_actions=legal_actions,
+                apply=apply,
+                undo=undo,
+                stats=stats,
+                next_state=next_state,
+                depth=None if depth is None else depth - 1,
+                alpha=low,
+                beta=high,
+                ply=1,
+                pvs=pvs,
+                **search,
+            )
+            # re-search only when the null window fails high (beats the best
+            # value) inside (alpha, beta); a fail low already settles the child
+            if maximizing:
+                research = null_window and best_value < value < beta
+            else:
+                research = null_window and alpha < value < best_value
+            if not research:
+                break
+            null_window = False
+            if maximizing:
+                low, high = value, beta
+            else:
+                low, high = alpha, value
+
+        if maximizing:
             if best_action is None or value > best_value:
                 best_value = value
                 best_action = action
@@ -148,7 +464,114 @@ def minimax_decision(
                 best_value = value
                 best_action = action
 
-    if best_action is None:
-        raise ValueError("No legal actions available.")
+        if (best_value >= beta) if maximizing else (best_value <= alpha):
+            break
+
+    if apply is not None:
+        children.close()
+
+    if stats is not None:
+        stats.expansion(searched)
+
+    return best_value, best_action
+
+
+def _mtdf(
+    state: StateT,
+    root_player: PlayerID,
+    depth: Optional[int],
+    guess: float,
+    **search,
+) -> float:
+    """
+    Value of `state`, found by null-window searches that move the window
+    to the last result until the lower and upper bounds meet.
+    """
+
+    value = guess
+    lower, upper = float("-inf"), float("inf")
+
+    while lower < upper:
+        beta = math.nextafter(value, math.inf) if value == lower else value
+        value = minimax(
+            state,
+            root_player,
+            depth=depth,
+            alpha=math.nextafter(beta, -math.inf),
+            beta=beta,
+            **search,
+        )
+        if value < beta:
+            upper = value
+        else:
+            lower = value
+
+    return value
+
+
+def _first_with_value(
+    state: StateT,
+    root_player: PlayerID,
+    depth: Optional[int],
+    principal: Optional[ActionT],
+    value: float,
+    *,
+    current_player: CurrentPlayerFn,
+    next_states: NextStatesFn,
+    legal_actions: Optional[LegalActionsFn],
+    apply: Optional[ApplyFn],
+    undo: Optional[UndoFn],
+    stats: Optional[SearchStats],
+    next_state: Optional[NextStateFn],
+    **search,
+) -> Optional[ActionT]:
+    """
+    First root child, in search order, whose value is (at least as good as)
+    the root `value`: one null-window test per child, mostly answered by
+    the table MTD(f) filled.
+    """
+
+    maximizing = current_player(state) == root_player
+
+    if maximizing:
+        low, high = math.nextafter(value, -math.inf), value
+    else:
+        low, high = value, math.nextafter(value, math.inf)
+
+    children = iter_children(
+        state,
+        next_states=next_states,
+        legal_actions=legal_actions,
+        apply=apply,
+        undo=undo,
+        first=principal,
+        next_state=next_state,
+    )
+
+    best_action: Optional[ActionT] = None
+
+    for action, child in children:
+        child_value = minimax(
+            child,
+            root_player,
+            current_player=current_player,
+            next_states=next_states,
+            legal_actions=legal_actions,
+            apply=apply,
+            undo=undo,
+            stats=stats,
+            next_state=next_state,
+            depth=None if depth is None else depth - 1,
+            alpha=low,
+            beta=high,
+            ply=1,
+            **search,
+        )
+        if child_value >= high if maximizing else child_value <= low:
+            best_action = action
+            break
+
+    if apply is not None:
+        children.close()
 
     return best_action
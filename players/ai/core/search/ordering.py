@@ -0,0 +1,147 @@
+"""
+Move-ordering helpers shared by the generic search engines.
+
+Alpha-beta prunes most when the best move is searched first, so engines
+reorder children using whatever hint they have (previous iteration's best
+move, transposition-table move, ...).
+
+`MoveOrdering` adds the classic heuristics on top of such a hint:
+  - a static, game-supplied priority per move (e.g. center before corners);
+  - killer moves: per ply, the last moves that caused a cutoff there;
+  - the history heuristic: every cutoff credits its move with depth^2, and
+    moves with more credit are tried earlier, across the whole search.
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+StateT = TypeVar("StateT")
+ActionT = TypeVar("ActionT")
+
+PriorityFn = Callable[[StateT, ActionT], float]
+
+
+def action_first(
+    children: Iterable[Tuple[ActionT, StateT]],
+    action: ActionT,
+) -> List[Tuple[ActionT, StateT]]:
+    """
+    Return `children` as a list with the child reached by `action` moved to
+    the front. Order is otherwise preserved; unknown actions are ignored.
+    """
+    ordered = list(children)
+
+    for i, (candidate, _) in enumerate(ordered):
+        if candidate == action:
+            if i:
+                ordered.insert(0, ordered.pop(i))
+            break
+
+    return ordered
+
+
+def move_first(actions: Iterable[ActionT], action: ActionT) -> List[ActionT]:
+    """
+    Return `actions` as a list with `action` moved to the front.
+    """
+    ordered = list(actions)
+
+    for i, candidate in enumerate(ordered):
+        if candidate == action:
+            if i:
+                ordered.insert(0, ordered.pop(i))
+            break
+
+    return ordered
+
+
+# ---------------------------------------------------------------------------
+# Heuristic ordering
+# ---------------------------------------------------------------------------
+
+class MoveOrdering:
+    """
+    Orders moves by: hint first, then killer moves of the ply, then history
+    score, then static `priority` (higher first); ties keep the generation
+    order.
+
+    Keep one instance per player: killers and history then carry over from
+    one search to the next. Actions must be hashable.
+    """
+
+    def __init__(
+        self,
+        priority: Optional[PriorityFn] = None,
+        killers: int = 2,
+        history: bool = True,
+    ):
+        self.priority = priority
+        self.num_killers = killers
+        self.use_history = history
+
+        self.killers: List[List[Hashable]] = []
+        self.history: Dict[Hashable, int] = {}
+
+    def clear(self) -> None:
+        self.killers.clear()
+        self.history.clear()
+
+    def order(
+        self,
+        state: StateT,
+        actions: Iterable[ActionT],
+        ply: int,
+        first: Optional[ActionT] = None,
+    ) -> List[ActionT]:
+        killers = self.killers[ply] if ply < len(self.killers) else ()
+        history = self.history
+        priority = self.priority
+
+        def rank(action: ActionT) -> Tuple[bool, int, int, float]:
+            killer = 0
+            for slot, move in enumerate(killers):
+                if move == action:
+                    killer = len(killers) - slot
+                    break
+            return (
+                action == first,
+                killer,
+                history.get(action, 0),
+                0.0 if priority is None else priority(state, action),
+            )
+
+        # sorted() is stable: equally ranked moves keep their order
+        return sorted(actions, key=rank, reverse=True)
+
+    def order_children(
+        self,
+        state: StateT,
+        children: Iterable[Tuple[ActionT, StateT]],
+        ply: int,
+        first: Optional[ActionT] = None,
+    ) -> List[Tuple[ActionT, StateT]]:
+        """
+        `order` for (action, child) pairs that were generated eagerly.
+        """
+        children = list(children)
+        by_action = {action: i for i, (action, _) in enumerate(children)}
+        ordered = self.order(state, [a for a, _ in children], ply, first)
+        return [children[by_action[action]] for action in ordered]
+
+    def cutoff(self, action: ActionT, ply: int, depth: Optional[int]) -> None:
+        """
+        Record that `action` caused a cutoff at `ply` with `depth` plies
+        left (None for an unlimited search).
+        """
+        if self.num_killers:
+            while len(self.killers) <= ply:
+                self.killers.append([])
+            slots = self.killers[ply]
+            if action in slots:
+                slots.remove(action)
+            slots.insert(0, action)
+            del slots[self.num_killers:]
+
+        if self.use_history:
+            weight = 1 if depth is None else depth * depth
+            self.history[action] = self.history.get(action, 0) + weight
@@ -0,0 +1,254 @@
+"""
+Multi-process root splitting for the generic minimax engine.
+
+The first root child is searched in the calling process (young brothers
+wait), which establishes a bound; the remaining root children are then
+searched in a process pool. Workers share the best bound found so far
+through shared memory and start each child with it as their alpha (beta
+for a minimizing root). The bound is read once, when a child's search
+starts: a bound a sibling improves later only helps children not yet
+started, so pruning is weaker than in a sequential search.
+
+Results are combined so that the returned action is the one sequential
+`minimax_decision` returns: the first child, in order, with the best value.
+
+Everything sent to the workers - states and the injected callables - must
+be picklable, i.e. module-level functions or functools.partial of them.
+"""
+
+from __future__ import annotations
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Hashable, List, Optional, Tuple, TypeVar
+
+from core.types import PlayerID
+
+from players.ai.core.search.minimax import (
+    minimax,
+    IsTerminalFn,
+    EvaluateFn,
+    NextStatesFn,
+    CurrentPlayerFn,
+)
+from players.ai.core.search.ordering import action_first
+from players.ai.core.search.stats import SearchStats
+from players.ai.core.search.transposition import TranspositionTable
+
+StateT = TypeVar("StateT")
+ActionT = TypeVar("ActionT")
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+_bound: Any = None
+_table: Optional[TranspositionTable] = None
+
+
+def _init_worker(
+    bound: Any,
+    table_size: Optional[int],
+    table_key: Optional[Callable[[Any], Hashable]],
+) -> None:
+    global _bound, _table
+    _bound = bound
+    _table = None if table_size is None else TranspositionTable(table_size, key=table_key)
+
+
+def _search_child(
+    index: int,
+    child: StateT,
+    root_player: PlayerID,
+    maximizing: bool,
+    depth: Optional[int],
+    callbacks: dict,
+    collect: bool = False,
+) -> Tuple[int, float, float, Optional[SearchStats]]:
+    """
+    Search one root child against the shared bound, as read when the
+    search starts (it is not re-read during the search).
+
+    Returns (index, value, bound used, stats); the value is exact only if
+    it is strictly better than the bound used. Stats are only collected if
+    `collect` is set.
+    """
+    bound = _bound.value
+    stats = SearchStats() if collect else None
+
+    if maximizing:
+        alpha, beta = bound, float("inf")
+    else:
+        alpha, beta = float("-inf"), bound
+
+    value = minimax(
+        child,
+        root_player,
+        **callbacks,
+        depth=depth,
+        alpha=alpha,
+        beta=beta,
+        table=_table,
+        stats=stats,
+        ply=1,
+    )
+
+    with _bound.get_lock():
+        if (value > _bound.value) if maximizing else (value < _bound.value):
+            _bound.value = value
+
+    return index, value, bound, stats
+
+
+# ---------------------------------------------------------------------------
+# Root splitter
+# ---------------------------------------------------------------------------
+
+class ParallelMinimax:
+    """
+    Owns a process pool and the shared bound; reuse it across decisions.
+
+    `table_size`/`table_key` give every worker its own transposition table,
+    kept for the lifetime of the pool. Tables hold values for one root
+    player, so do not share an instance between players.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        table_size: Optional[int] = None,
+        table_key: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        ctx = multiprocessing.get_context()
+        self._bound = ctx.Value("d", 0.0)
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_init_worker,
+            initargs=(self._bound, table_size, table_key),
+        )
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "ParallelMinimax":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def decision(
+        self,
+        state: StateT,
+        root_player: PlayerID,
+        *,
+        is_terminal: IsTerminalFn,
+        evaluate: EvaluateFn,
+        next_states: NextStatesFn,
+        current_player: CurrentPlayerFn,
+        depth: Optional[int],
+        principal: Optional[ActionT] = None,
+        stats: Optional[SearchStats] = None,
+        **inplace: Any,
+    ) -> ActionT:
+        """
+        Parallel counterpart of `minimax_decision` (same arguments; `inplace`
+        forwards legal_actions/apply/undo to the workers).
+
+        `stats` also receives the counters of the worker searches.
+        """
+        if stats is not None:
+            stats.begin()
+            stats.node(0)
+
+        maximizing = current_player(state) == root_player
+        better = (lambda a, b: a > b) if maximizing else (lambda a, b: a < b)
+
+        callbacks = dict(
+            is_terminal=is_terminal,
+            evaluate=evaluate,
+            next_states=next_states,
+            current_player=current_player,
+            **inplace,
+        )
+        child_depth = None if depth is None else depth - 1
+
+        # root children are always copies: each one is shipped to a worker
+        children: List[Tuple[ActionT, StateT]] = list(next_states(state))
+        if principal is not None:
+            children = action_first(children, principal)
+
+        if not children:
+            raise ValueError("No legal actions available.")
+
+        # --- eldest brother: searched here with a full window ---
+        first_value = minimax(
+            children[0][1],
+            root_player,
+            **callbacks,
+            depth=child_depth,
+            alpha=float("-inf"),
+            beta=float("inf"),
+            stats=stats,
+            ply=1,
+        )
+        self._bound.value = first_value
+
+        # --- younger brothers: searched in parallel against the shared bound ---
+        futures = [
+            self._pool.submit(
+                _search_child,
+                i,
+                child,
+                root_player,
+                maximizing,
+                child_depth,
+                callbacks,
+                stats is not None,
+            )
+            for i, (_, child) in enumerate(children)
+            if i > 0
+        ]
+        results = [(0, first_value, float("-inf") if maximizing else float("inf"))]
+        for future in futures:
+            index, value, bound, worker_stats = future.result()
+            results.append((index, value, bound))
+            if worker_stats is not None:
+                stats.merge(worker_stats)
+        results.sort()
+
+        # exact values are the ones strictly better than the bound they used;
+        # the best of them is the true root value
+        best_value = first_value
+        best_index = 0
+        for index, value, bound in results:
+            if better(value, bound) and better(value, best_value):
+                best_value, best_index = value, index
+
+        # a child searched with bound == best_value that failed low right at
+        # it may still equal it; sequential search would prefer it if it comes
+        # earlier. A fail-soft value strictly worse than the bound means the
+        # true value is strictly worse too, so those children need no re-search.
+        for index, value, bound in results:
+            if index >= best_index:
+                break
+            if bound == best_value and value == bound:
+                exact = minimax(
+                    children[index][1],
+                    root_player,
+                    **callbacks,
+                    depth=child_depth,
+                    alpha=float("-inf"),
+                    beta=float("inf"),
+                    stats=stats,
+                    ply=1,
+                )
+                if exact == best_value:
+                    best_index = index
+                    break
+
+        if stats is not None:
+            stats.expansion(len(children))
+            stats.end()
+
+        return children[best_index][0]
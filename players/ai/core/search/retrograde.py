@@ -0,0 +1,296 @@
+"""
+Retrograde solver and memory-mapped tablebase for small finite games.
+
+`solve` enumerates every state reachable from `game.initial_state()` and
+computes game-theoretic values backwards from the terminal states: a state
+is resolved once all of its children are, and its value is that of the
+child best for the player to move (max^n; for two-player zero-sum games
+this is plain minimax). Ties go to the first action in `legal_actions`
+order, as in the search engines.
+
+`write_tablebase` stores the solution as a flat file of fixed-size records
+indexed by an integer key of the state, and `Tablebase` memory-maps it:
+opening is O(1) and every process reading the same file shares one copy of
+it through the page cache.
+
+Works for any `core.game.Game` in which exactly one player acts per state
+and states are hashable. States on a cycle can never be resolved this way;
+they are left out of the table.
+"""
+
+from __future__ import annotations
+import json
+import mmap
+import struct
+from collections import deque
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from core.files import atomic_write
+from core.game import Game
+from core.types import PlayerID, Result
+
+StateT = TypeVar("StateT", bound=Hashable)
+
+KeyFn = Callable[[StateT], int]
+
+
+# ---------------------------------------------------------------------------
+# Action index markers
+# ---------------------------------------------------------------------------
+
+TERMINAL = -1   # the state is terminal: no action to play
+MISSING = -2    # the key is not a solved reachable state
+
+
+# ---------------------------------------------------------------------------
+# Solver
+# ---------------------------------------------------------------------------
+
+class Solution(Generic[StateT]):
+    """
+    Values of every solved state.
+
+    `values[state]` is the utility vector in `players` order and
+    `actions[state]` the index, into `legal_actions` order, of a best
+    action (TERMINAL for terminal states).
+    """
+
+    def __init__(self, players: Tuple[PlayerID, ...]):
+        self.players = players
+        self.values: Dict[StateT, Tuple[float, ...]] = {}
+        self.actions: Dict[StateT, int] = {}
+        self.unresolved = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _mover(game: Game, state: StateT) -> PlayerID:
+    active = list(game.active_players(state))
+    if len(active) != 1:
+        raise ValueError("Retrograde analysis needs exactly one player to move.")
+    return active[0]
+
+
+def solve(
+    game: Game,
+    players: Sequence[PlayerID],
+) -> Solution:
+    """
+    Solve every state reachable from `game.initial_state()`.
+    """
+    players = tuple(players)
+
+    # --- forward pass: enumerate states and edges ---
+    root = game.initial_state()
+    index: Dict[StateT, int] = {root: 0}
+    states: List[StateT] = [root]
+    children: List[List[int]] = []
+    parents: List[List[int]] = [[]]
+
+    i = 0
+    while i < len(states):
+        state = states[i]
+        kids: List[int] = []
+
+        if not game.is_terminal(state):
+            mover = _mover(game, state)
+            for action in game.legal_actions(state, mover):
+                child = game.next_state(state, {mover: action})
+                j = index.get(child)
+                if j is None:
+                    j = index[child] = len(states)
+                    states.append(child)
+                    parents.append([])
+                kids.append(j)
+                parents[j].append(i)
+
+        children.append(kids)
+        i += 1
+
+    # --- backward pass: resolve states whose children are all resolved ---
+    values: List[Optional[Tuple[float, ...]]] = [None] * len(states)
+    actions: List[int] = [MISSING] * len(states)
+    pending = [len(kids) for kids in children]
+
+    queue = deque()
+    for i, state in enumerate(states):
+        if game.is_terminal(state):
+            result: Result = game.result(state)
+            values[i] = tuple(float(result[p]) for p in players)
+            actions[i] = TERMINAL
+            queue.append(i)
+
+    while queue:
+        i = queue.popleft()
+        for p in parents[i]:
+            pending[p] -= 1
+            if pending[p]:
+                continue
+
+            me = players.index(_mover(game, states[p]))
+            best = 0
+            for n, j in enumerate(children[p]):
+                if values[j][me] > values[children[p][best]][me]:
+                    best = n
+
+            values[p] = values[children[p][best]]
+            actions[p] = best
+            queue.append(p)
+
+    solution: Solution = Solution(players)
+    for i, state in enumerate(states):
+        if values[i] is None:
+            solution.unresolved += 1
+            continue
+        solution.values[state] = values[i]
+        solution.actions[state] = actions[i]
+
+    return solution
+
+
+# ---------------------------------------------------------------------------
+# File format
+# ---------------------------------------------------------------------------
+#
+#   header   MAGIC, version, player count, key space, metadata length
+#   metadata JSON: {"players": [...]} plus any caller-supplied fields
+#   records  key space * (float32 per player, int16 action index)
+#
+# All integers little-endian; record k belongs to the state with key k.
+
+MAGIC = b"TBASE\x00\x00\x00"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sHHQI")
+
+
+def _record_format(num_players: int) -> struct.Struct:
+    return struct.Struct(f"<{num_players}fh")
+
+
+def write_tablebase(
+    path: str,
+    solution: Solution,
+    key: KeyFn,
+    key_space: int,
+    metadata: Optional[dict] = None,
+) -> None:
+    """
+    Write `solution` to `path`; `key` maps every state into [0, key_space).
+    """
+    players = solution.players
+    record = _record_format(len(players))
+
+    meta = dict(metadata or {})
+    meta["players"] = list(players)
+    meta_bytes = json.dumps(meta).encode("utf-8")
+
+    empty = record.pack(*([0.0] * len(players)), MISSING)
+    data = bytearray(empty * key_space)
+
+    for state, value in solution.values.items():
+        k = key(state)
+        if not 0 <= k < key_space:
+            raise ValueError(f"Key {k} outside [0, {key_space}).")
+        record.pack_into(data, k * record.size, *value, solution.actions[state])
+
+    def write(f: BinaryIO) -> None:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(players), key_space, len(meta_bytes)))
+        f.write(meta_bytes)
+        f.write(data)
+
+    atomic_write(path, write)
+
+
+# ---------------------------------------------------------------------------
+# Reader
+# ---------------------------------------------------------------------------
+
+class Tablebase:
+    """
+    Read-only memory-mapped view of a tablebase file.
+
+    Only the header is read on open; records are paged in by the OS as they
+    are looked up.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, num_players, key_space, meta_len = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} tablebase.")
+
+        start = _HEADER.size
+        self.metadata: dict = json.loads(self._map[start:start + meta_len].decode("utf-8"))
+        self.players: Tuple[PlayerID, ...] = tuple(self.metadata["players"])
+        self.key_space: int = key_space
+
+        self._record = _record_format(num_players)
+        self._offset = start + meta_len
+
+        expected = self._offset + key_space * self._record.size
+        if len(self._map) < expected:
+            self._map.close()
+            raise ValueError(f"{path} is truncated.")
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "Tablebase":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        # processes re-map the file instead of copying it
+        return {"path": self.path}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["path"])
+
+    def probe(self, key: int) -> Optional[Tuple[Tuple[float, ...], int]]:
+        """
+        (values, action index) for `key`, or None if it was not solved.
+        """
+        if not 0 <= key < self.key_space:
+            return None
+
+        *values, action = self._record.unpack_from(
+            self._map, self._offset + key * self._record.size
+        )
+        if action == MISSING:
+            return None
+        return tuple(values), action
+
+    def __contains__(self, key: int) -> bool:
+        return self.probe(key) is not None
+
+    def result(self, key: int) -> Result:
+        found = self.probe(key)
+        if found is None:
+            raise KeyError(key)
+        return dict(zip(self.players, found[0]))
+
+    def action_index(self, key: int) -> int:
+        found = self.probe(key)
+        if found is None:
+            raise KeyError(key)
+        return found[1]
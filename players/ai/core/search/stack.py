@@ -0,0 +1,665 @@
+"""
+Explicit-stack (non-recursive) Minimax and Max^n.
+
+Same searches as `minimax.py` and `max_n.py`, with the same results, node
+for node: the recursion is replaced by a list of frames, one per node on
+the current line, so
+
+  - depth is not capped by the interpreter's recursion limit,
+  - the injected callables are bound once per search instead of being
+    passed as keywords at every node,
+  - a search can be paused after any number of nodes and resumed later
+    (`step`), e.g. to time-slice several searches in one thread.
+
+While a search is paused, an in-place searched state is still mid-line;
+`close()` abandons the search and restores it.
+
+Knows NOTHING about any specific game.
+All game knowledge is injected via callables.
+"""
+
+from __future__ import annotations
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional, Tuple, TypeVar, Union
+
+from core.types import PlayerID, Result
+
+from players.ai.core.search.inplace import (
+    applied,
+    iter_children,
+    LegalActionsFn,
+    ApplyFn,
+    UndoFn,
+    NextStateFn,
+)
+from players.ai.core.search.max_n import PRUNING_MODES, RootUtility, shallow_cutoff
+from players.ai.core.search.max_n import EvaluateFn as UtilityFn
+from players.ai.core.search.minimax import (
+    CurrentPlayerFn,
+    EvaluateFn,
+    IsTerminalFn,
+    NextStatesFn,
+)
+from players.ai.core.search.ordering import MoveOrdering
+from players.ai.core.search.stats import SearchStats
+from players.ai.core.search.transposition import TranspositionTable, bound_flag, probe
+
+StateT = TypeVar("StateT")
+ActionT = TypeVar("ActionT")
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+class _StackSearch(ABC):
+    """
+    Pausable search over a stack of frames; subclasses walk the tree in
+    `_run`.
+    """
+
+    _decides = True
+
+    def __init__(self, stats: Optional[SearchStats], apply: Optional[ApplyFn]):
+        self.stats = stats
+        self.apply = apply
+
+        self._stack: List[Any] = []
+        self.done = False
+        self.value: Any = None
+        self.action: Any = None
+        self.nodes = 0
+
+        if stats is not None:
+            stats.begin()
+
+    def step(self, nodes: Optional[int] = None) -> bool:
+        """
+        Search at most `nodes` more nodes (all of them if None); return
+        True once the search is complete.
+        """
+        if self.done:
+            return True
+        return self._run(None if nodes is None else self.nodes + nodes)
+
+    def run(self) -> Any:
+        """
+        Search to the end; return the chosen action (or, for a value
+        search, the value).
+        """
+        self.step()
+        if self._decides and self.action is None:
+            raise ValueError("No legal actions available.")
+        return self.action if self._decides else self.value
+
+    def close(self) -> None:
+        """
+        Abandon a paused search, undoing in-place moves still applied.
+        """
+        while self._stack:
+            frame = self._stack.pop()
+            if self.apply is not None:
+                frame.children.close()
+
+    def __enter__(self) -> "_StackSearch":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    @abstractmethod
+    def _run(self, limit: Optional[int]) -> bool:
+        """
+        Walk the tree until the search is complete (True) or `self.nodes`
+        reaches `limit` (False).
+        """
+
+    def _complete(self, value: Any) -> None:
+        self.value = value
+        self.done = True
+        if self.stats is not None:
+            self.stats.end()
+
+
+# ---------------------------------------------------------------------------
+# Minimax
+# ---------------------------------------------------------------------------
+
+class _MinimaxFrame:
+    """
+    An interior node being searched.
+    """
+
+    __slots__ = (
+        "state",
+        "children",
+        "depth",
+        "ply",
+        "maximizing",
+        "root",
+        "alpha",
+        "beta",
+        "alpha_orig",
+        "beta_orig",
+        "value",
+        "best_action",
+        "action",
+        "index",
+    )
+
+    def __init__(self, state, children, depth, ply, maximizing, root, alpha, beta):
+        self.state = state
+        self.children = children
+        self.depth = depth
+        self.ply = ply
+        self.maximizing = maximizing
+        self.root = root
+        self.alpha = self.alpha_orig = alpha
+        self.beta = self.beta_orig = beta
+        self.value = float("-inf") if maximizing else float("inf")
+        self.best_action = None
+        self.action = None
+        self.index = -1
+
+
+class MinimaxSearch(_StackSearch):
+    """
+    Alpha-beta minimax; arguments as for `minimax_decision` (plain
+    "alphabeta": every root child searched with a full window).
+
+    With `window` (alpha, beta), computes the value of `state` within it,
+    as `minimax` does, instead of choosing an action.
+
+    Once `step()` returns True, `action` holds the decision (None with
+    `window`) and `value` the root value.
+    """
+
+    def __init__(
+        self,
+        state: StateT,
+        root_player: PlayerID,
+        *,
+        is_terminal: IsTerminalFn,
+        evaluate: EvaluateFn,
+        next_states: NextStatesFn,
+        current_player: CurrentPlayerFn,
+        depth: Optional[int],
+        table: Optional[TranspositionTable] = None,
+        principal: Optional[ActionT] = None,
+        legal_actions: Optional[LegalActionsFn] = None,
+        apply: Optional[ApplyFn] = None,
+        undo: Optional[UndoFn] = None,
+        stats: Optional[SearchStats] = None,
+        next_state: Optional[NextStateFn] = None,
+        ordering: Optional[MoveOrdering] = None,
+        window: Optional[Tuple[float, float]] = None,
+    ):
+        super().__init__(stats, apply)
+
+        self.root_player = root_player
+        self.is_terminal = is_terminal
+        self.evaluate = evaluate
+        self.next_states = next_states
+        self.current_player = current_player
+        self.table = table
+        self.legal_actions = legal_actions
+        self.undo = undo
+        self.next_state = next_state
+        self.ordering = ordering
+        self._decides = window is None
+
+        if window is not None:
+            # a value search: the root is an ordinary node
+            self.nodes += 1
+            if stats is not None:
+                stats.node(0)
+
+            terminal = is_terminal(state)
+            if terminal or depth == 0:
+                if stats is not None:
+                    stats.evaluation(terminal)
+                self._complete(evaluate(state, root_player))
+                return
+
+            value = self._expand(state, depth, window[0], window[1], 0)
+            if value is not None:
+                self._complete(value)
+            return
+
+        if stats is not None:
+            stats.node(0)
+
+        children = iter_children(
+            state,
+            next_states=next_states,
+            legal_actions=legal_actions,
+            apply=apply,
+            undo=undo,
+            first=principal,
+            next_state=next_state,
+        )
+        self._stack.append(_MinimaxFrame(
+            state,
+            iter(children),
+            depth,
+            0,
+            current_player(state) == root_player,
+            True,
+            float("-inf"),
+            float("inf"),
+        ))
+
+    def _run(self, limit: Optional[int]) -> bool:
+        stack = self._stack
+        stats = self.stats
+        ordering = self.ordering
+        is_terminal = self.is_terminal
+        evaluate = self.evaluate
+        root_player = self.root_player
+        expand = self._expand
+        finish = self._finish
+        nodes = self.nodes
+
+        while stack:
+            if limit is not None and nodes >= limit:
+                self.nodes = nodes
+                return False
+
+            frame = stack[-1]
+            pair = next(frame.children, None)
+
+            if pair is None:
+                value = finish(frame)
+            else:
+                nodes += 1
+                frame.index += 1
+                frame.action, child = pair
+
+                depth = frame.depth
+                if depth is not None:
+                    depth -= 1
+                ply = frame.ply + 1
+                if stats is not None:
+                    stats.node(ply)
+
+                # --- terminal or depth cutoff ---
+                terminal = is_terminal(child)
+                if terminal or depth == 0:
+                    if stats is not None:
+                        stats.evaluation(terminal)
+                    value = evaluate(child, root_player)
+                else:
+                    value = expand(child, depth, frame.alpha, frame.beta, ply)
+                    if value is None:
+                        # the child's frame is on top now
+                        continue
+
+            # --- hand the value up until a node has children left to search ---
+            while stack:
+                frame = stack[-1]
+
+                if frame.maximizing:
+                    if frame.best_action is None or value > frame.value:
+                        frame.value = value
+                        frame.best_action = frame.action
+                    if frame.root:
+                        break
+                    if frame.value > frame.alpha:
+                        frame.alpha = frame.value
+                else:
+                    if frame.best_action is None or value < frame.value:
+                        frame.value = value
+                        frame.best_action = frame.action
+                    if frame.root:
+                        break
+                    if frame.value < frame.beta:
+                        frame.beta = frame.value
+
+                if frame.beta > frame.alpha:
+                    break
+
+                if stats is not None:
+                    stats.cutoff(frame.index)
+                if ordering is not None:
+                    ordering.cutoff(frame.action, frame.ply, frame.depth)
+                value = finish(frame)
+
+            if not stack:
+                self._complete(value)
+
+        self.nodes = nodes
+        return True
+
+    def _expand(
+        self,
+        state: StateT,
+        depth: Optional[int],
+        alpha: float,
+        beta: float,
+        ply: int,
+    ) -> Optional[float]:
+        """
+        Push the frame of interior node `state`, or return its value if the
+        table already has it.
+        """
+        hint: Optional[ActionT] = None
+
+        # --- transposition table probe ---
+        if self.table is not None:
+            stored, alpha, beta, hint = probe(self.table, state, depth, alpha, beta)
+            if stored is not None:
+                if self.stats is not None:
+                    self.stats.table_hits += 1
+                return stored
+
+        children = iter_children(
+            state,
+            next_states=self.next_states,
+            legal_actions=self.legal_actions,
+            apply=self.apply,
+            undo=self.undo,
+            first=hint,
+            next_state=self.next_state,
+            ordering=self.ordering,
+            ply=ply,
+        )
+        self._stack.append(_MinimaxFrame(
+            state,
+            iter(children),
+            depth,
+            ply,
+            self.current_player(state) == self.root_player,
+            False,
+            alpha,
+            beta,
+        ))
+        return None
+
+    def _finish(self, frame: _MinimaxFrame) -> float:
+        """
+        Pop `frame` (the top one) and return its value.
+        """
+        self._stack.pop()
+
+        if self.apply is not None:
+            frame.children.close()
+
+        if self.stats is not None:
+            self.stats.expansion(frame.index + 1)
+
+        if frame.root:
+            self.action = frame.best_action
+            return frame.value
+
+        # --- transposition table store ---
+        value = frame.value
+        if self.table is not None and frame.best_action is not None:
+            flag = bound_flag(value, frame.alpha_orig, frame.beta_orig)
+            self.table.store(frame.state, value, frame.depth, flag, frame.best_action)
+
+        return value
+
+
+def stack_minimax(
+    state: StateT,
+    root_player: PlayerID,
+    *,
+    alpha: float,
+    beta: float,
+    **search: Any,
+) -> float:
+    """
+    Explicit-stack counterpart of `minimax` (same arguments, without `ply`).
+    """
+    return MinimaxSearch(state, root_player, window=(alpha, beta), **search).run()
+
+
+def stack_minimax_decision(state: StateT, root_player: PlayerID, **search: Any) -> ActionT:
+    """
+    Explicit-stack counterpart of `minimax_decision` with "alphabeta".
+    """
+    return MinimaxSearch(state, root_player, **search).run()
+
+
+# ---------------------------------------------------------------------------
+# Max^n
+# ---------------------------------------------------------------------------
+
+class _MaxNFrame:
+    """
+    An interior node being searched.
+    """
+
+    __slots__ = (
+        "children",
+        "depth",
+        "ply",
+        "player",
+        "parent_best",
+        "value",
+        "best_action",
+        "action",
+        "index",
+    )
+
+    def __init__(self, children, depth, ply, player, parent_best):
+        self.children = children
+        self.depth = depth
+        self.ply = ply
+        self.player = player
+        self.parent_best = parent_best
+        self.value = None
+        self.best_action = None
+        self.action = None
+        self.index = -1
+
+
+class MaxNSearch(_StackSearch):
+    """
+    Max^n with "none" or "shallow" pruning; arguments as for
+    `max_n_decision` (`max_n_search` also covers "paranoid").
+
+    Once `step()` returns True, `action` holds the best action for
+    `root_player` and `value` the root's utility vector.
+    """
+
+    def __init__(
+        self,
+        state: StateT,
+        root_player: PlayerID,
+        *,
+        is_terminal: IsTerminalFn,
+        evaluate: UtilityFn,
+        next_states: NextStatesFn,
+        current_player: CurrentPlayerFn,
+        depth: Optional[int],
+        principal: Optional[ActionT] = None,
+        legal_actions: Optional[LegalActionsFn] = None,
+        apply: Optional[ApplyFn] = None,
+        undo: Optional[UndoFn] = None,
+        pruning: str = "none",
+        max_sum: Optional[float] = None,
+        min_utility: float = 0.0,
+        stats: Optional[SearchStats] = None,
+    ):
+        if pruning not in PRUNING_MODES:
+            raise ValueError(f"Unknown pruning mode: {pruning!r}")
+        if pruning == "paranoid":
+            raise ValueError("Paranoid search is a MinimaxSearch: use max_n_search().")
+
+        if pruning == "shallow":
+            if max_sum is None:
+                raise ValueError("Shallow pruning requires max_sum.")
+        else:
+            max_sum = None
+
+        super().__init__(stats, apply)
+
+        self.is_terminal = is_terminal
+        self.evaluate = evaluate
+        self.next_states = next_states
+        self.current_player = current_player
+        self.legal_actions = legal_actions
+        self.undo = undo
+        self.max_sum = max_sum
+        self.min_utility = min_utility
+
+        if stats is not None:
+            stats.node(0)
+
+        children = iter_children(
+            state,
+            next_states=next_states,
+            legal_actions=legal_actions,
+            apply=apply,
+            undo=undo,
+            first=principal,
+        )
+        self._stack.append(_MaxNFrame(iter(children), depth, 0, root_player, None))
+
+    def _run(self, limit: Optional[int]) -> bool:
+        stack = self._stack
+        stats = self.stats
+        is_terminal = self.is_terminal
+        evaluate = self.evaluate
+        max_sum = self.max_sum
+        min_utility = self.min_utility
+        next_states = self.next_states
+        legal_actions = self.legal_actions
+        apply = self.apply
+        undo = self.undo
+        current_player = self.current_player
+        finish = self._finish
+        nodes = self.nodes
+
+        while stack:
+            if limit is not None and nodes >= limit:
+                self.nodes = nodes
+                return False
+
+            frame = stack[-1]
+            pair = next(frame.children, None)
+
+            if pair is None:
+                value = finish(frame)
+            else:
+                nodes += 1
+                frame.index += 1
+                frame.action, child = pair
+
+                depth = frame.depth
+                if depth is not None:
+                    depth -= 1
+                ply = frame.ply + 1
+                if stats is not None:
+                    stats.node(ply)
+
+                # terminal or depth cutoff
+                terminal = is_terminal(child)
+                if terminal or depth == 0:
+                    if stats is not None:
+                        stats.evaluation(terminal)
+                    value = evaluate(child)
+                else:
+                    # same children as iter_children gives without `first`
+                    if apply is None:
+                        children = iter(next_states(child))
+                    else:
+                        children = applied(child, legal_actions(child), apply, undo)
+                    # the shallow bound needs the child's mover to differ
+                    best = frame.value
+                    player = current_player(child)
+                    stack.append(_MaxNFrame(
+                        children,
+                        depth,
+                        ply,
+                        player,
+                        None if best is None or player == frame.player else best[frame.player],
+                    ))
+                    continue
+
+            # hand the value up until a node has children left to search
+            while stack:
+                frame = stack[-1]
+                player = frame.player
+                best = frame.value
+
+                if best is not None and value[player] <= best[player]:
+                    break
+
+                frame.value = value
+                frame.best_action = frame.action
+
+                # shallow cutoff: the parent's player gets at most what is left
+                if (
+                    max_sum is None
+                    or frame.parent_best is None
+                    or not shallow_cutoff(value, player, frame.parent_best, max_sum, min_utility)
+                ):
+                    break
+
+                if stats is not None:
+                    stats.cutoff(frame.index)
+                value = finish(frame)
+
+            if not stack:
+                self._complete(value)
+
+        self.nodes = nodes
+        return True
+
+    def _finish(self, frame: _MaxNFrame) -> Result:
+        """
+        Pop `frame` (the top one) and return its value.
+        """
+        self._stack.pop()
+
+        if self.apply is not None:
+            frame.children.close()
+
+        if self.stats is not None:
+            self.stats.expansion(frame.index + 1)
+
+        if not self._stack:
+            self.action = frame.best_action
+        elif frame.value is None:
+            raise ValueError("No legal moves found.")
+
+        return frame.value
+
+
+def max_n_search(
+    state: StateT,
+    root_player: PlayerID,
+    *,
+    pruning: str = "none",
+    max_sum: Optional[float] = None,
+    min_utility: float = 0.0,
+    **search: Any,
+) -> Union[MaxNSearch, MinimaxSearch]:
+    """
+    Pausable search for `max_n_decision`'s arguments: a MaxNSearch, or for
+    "paranoid" a MinimaxSearch on the root player's utility.
+    """
+    if pruning == "paranoid":
+        return MinimaxSearch(
+            state,
+            root_player,
+            **dict(search, evaluate=RootUtility(search["evaluate"])),
+        )
+
+    return MaxNSearch(
+        state,
+        root_player,
+        pruning=pruning,
+        max_sum=max_sum,
+        min_utility=min_utility,
+        **search,
+    )
+
+
+def stack_max_n_decision(state: StateT, root_player: PlayerID, **search: Any) -> ActionT:
+    """
+    Explicit-stack counterpart of `max_n_decision`.
+    """
+    return max_n_search(state, root_player, **search).run()
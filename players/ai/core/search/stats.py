@@ -0,0 +1,157 @@
+"""
+Search statistics collector for the generic search engines.
+
+Pass a `SearchStats` as `stats=` to a search and it is filled in as the
+tree is walked; without one, the engines skip all bookkeeping. A collector
+accumulates over every search it is passed to until `reset()`, so one
+instance can cover all iterations of an iterative deepening run.
+
+Knows NOTHING about any specific game.
+"""
+
+from __future__ import annotations
+import time
+from typing import Any, Dict, List, Optional
+
+
+class SearchStats:
+    """
+    Counters gathered during a search.
+
+    `nodes[p]`       nodes visited at ply p (0 = root)
+    `terminal_evals` evaluations of terminal states
+    `cutoff_evals`   evaluations at the depth limit of non-terminal states
+    `expanded`       interior nodes whose children were searched
+    `children`       children searched over all expanded nodes
+    `cutoffs[i]`     alpha-beta (or shallow) cutoffs after the i-th child
+    `table_hits`     nodes answered from the transposition table
+    `elapsed`        wall time, in seconds, from the first search to the last
+    """
+
+    __slots__ = (
+        "nodes",
+        "terminal_evals",
+        "cutoff_evals",
+        "expanded",
+        "children",
+        "cutoffs",
+        "table_hits",
+        "elapsed",
+        "_start",
+    )
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.nodes: List[int] = []
+        self.terminal_evals = 0
+        self.cutoff_evals = 0
+        self.expanded = 0
+        self.children = 0
+        self.cutoffs: List[int] = []
+        self.table_hits = 0
+        self.elapsed = 0.0
+        self._start: Optional[float] = None
+
+    # -----------------------------------------------------------------------
+    # Recording (called by the engines)
+    # -----------------------------------------------------------------------
+
+    def begin(self) -> None:
+        if self._start is None:
+            self._start = time.perf_counter()
+
+    def end(self) -> None:
+        if self._start is not None:
+            self.elapsed = time.perf_counter() - self._start
+
+    def node(self, ply: int) -> None:
+        _bump(self.nodes, ply)
+
+    def evaluation(self, terminal: bool) -> None:
+        if terminal:
+            self.terminal_evals += 1
+        else:
+            self.cutoff_evals += 1
+
+    def expansion(self, searched: int) -> None:
+        self.expanded += 1
+        self.children += searched
+
+    def cutoff(self, index: int) -> None:
+        _bump(self.cutoffs, index)
+
+    def merge(self, other: "SearchStats") -> None:
+        """
+        Add the counters of `other` (e.g. from a worker process).
+        """
+        for ply, count in enumerate(other.nodes):
+            _bump(self.nodes, ply, count)
+        for index, count in enumerate(other.cutoffs):
+            _bump(self.cutoffs, index, count)
+
+        self.terminal_evals += other.terminal_evals
+        self.cutoff_evals += other.cutoff_evals
+        self.expanded += other.expanded
+        self.children += other.children
+        self.table_hits += other.table_hits
+
+    # -----------------------------------------------------------------------
+    # Derived figures
+    # -----------------------------------------------------------------------
+
+    @property
+    def total_nodes(self) -> int:
+        return sum(self.nodes)
+
+    @property
+    def branching_factor(self) -> float:
+        """
+        Mean number of children searched per expanded node (the effective
+        branching factor after pruning).
+        """
+        return self.children / self.expanded if self.expanded else 0.0
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """
+        Share of cutoffs caused by the first child searched: a measure of
+        move ordering quality.
+        """
+        total = sum(self.cutoffs)
+        return self.cutoffs[0] / total if total else 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.total_nodes / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "nodes": list(self.nodes),
+            "total_nodes": self.total_nodes,
+            "terminal_evals": self.terminal_evals,
+            "cutoff_evals": self.cutoff_evals,
+            "expanded": self.expanded,
+            "branching_factor": self.branching_factor,
+            "cutoffs": list(self.cutoffs),
+            "first_move_cutoff_rate": self.first_move_cutoff_rate,
+            "table_hits": self.table_hits,
+            "elapsed": self.elapsed,
+            "nodes_per_second": self.nodes_per_second,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchStats(nodes={self.total_nodes}, "
+            f"evals={self.terminal_evals + self.cutoff_evals}, "
+            f"cutoffs={sum(self.cutoffs)}, "
+            f"branching={self.branching_factor:.2f}, "
+            f"elapsed={self.elapsed:.4f}s)"
+        )
+
+
+def _bump(counts: List[int], index: int, amount: int = 1) -> None:
+    if index >= len(counts):
+        counts.extend([0] * (index + 1 - len(counts)))
+    counts[index] += amount
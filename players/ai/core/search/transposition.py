@@ -0,0 +1,209 @@
+"""
+Size-bounded transposition table for the generic search engines.
+
+Stores the result of searching a position so that the same position reached
+through a different move order is scored once. Entries carry the remaining
+search depth and a bound flag, because an alpha-beta value is only exact when
+it fell strictly inside the search window.
+
+Knows NOTHING about any specific game: states only need to be hashable,
+or a `key` callable can map them to something hashable (e.g. a canonical
+form shared by symmetric positions).
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+StateT = TypeVar("StateT")
+ActionT = TypeVar("ActionT")
+
+
+# ---------------------------------------------------------------------------
+# Bound flags
+# ---------------------------------------------------------------------------
+
+EXACT = 0   # value is the true minimax value
+LOWER = 1   # search failed high: true value >= value
+UPPER = 2   # search failed low:  true value <= value
+
+
+def bound_flag(value: float, alpha: float, beta: float) -> int:
+    """
+    Flag of a value an alpha-beta search of the window (alpha, beta) returned.
+    """
+    if value <= alpha:
+        return UPPER
+    if value >= beta:
+        return LOWER
+    return EXACT
+
+
+# ---------------------------------------------------------------------------
+# Entries
+# ---------------------------------------------------------------------------
+
+class TTEntry(Generic[ActionT]):
+    """
+    One stored search result.
+
+    `depth` is the remaining depth the value was searched to, or None for a
+    search that ran to terminal states everywhere.
+    """
+
+    __slots__ = ("value", "depth", "flag", "action")
+
+    def __init__(
+        self,
+        value: float,
+        depth: Optional[int],
+        flag: int,
+        action: Optional[ActionT],
+    ):
+        self.value = value
+        self.depth = depth
+        self.flag = flag
+        self.action = action
+
+    def covers(self, depth: Optional[int]) -> bool:
+        """
+        True if this entry was searched at least as deep as `depth`.
+        """
+        if self.depth is None:
+            return True
+        return depth is not None and self.depth >= depth
+
+
+# ---------------------------------------------------------------------------
+# Table
+# ---------------------------------------------------------------------------
+
+class TranspositionTable(Generic[StateT, ActionT]):
+    """
+    Bounded mapping from state to TTEntry.
+
+    Replacement policy:
+      - an existing entry for the same state is only overwritten by a result
+        searched at least as deep (depth-preferred);
+      - when the table is full, the oldest inserted entry is evicted.
+
+    Values are stored from the root player's perspective, so a table must
+    only be shared between searches for the same root player.
+
+    If `key` maps several states to one entry, the stored action is only a
+    hint: it belongs to whichever of those states stored it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1_000_000,
+        key: Optional[Callable[[StateT], Hashable]] = None,
+    ):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive.")
+
+        self.max_entries = max_entries
+        self.key = key
+        self._entries: Dict[Hashable, TTEntry[ActionT]] = {}
+
+        self.probes = 0
+        self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, state: object) -> bool:
+        if self.key is not None:
+            state = self.key(state)
+        return state in self._entries
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.probes = 0
+        self.hits = 0
+
+    def lookup(self, state: StateT) -> Optional[TTEntry[ActionT]]:
+        self.probes += 1
+
+        if self.key is not None:
+            state = self.key(state)
+
+        entry = self._entries.get(state)
+        if entry is not None:
+            self.hits += 1
+
+        return entry
+
+    def store(
+        self,
+        state: StateT,
+        value: float,
+        depth: Optional[int],
+        flag: int,
+        action: Optional[ActionT] = None,
+    ) -> None:
+        if self.key is not None:
+            state = self.key(state)
+
+        entries = self._entries
+        existing = entries.get(state)
+
+        if existing is not None:
+            # depth-preferred: never replace a deeper result with a shallower one
+            if not _deeper_or_equal(depth, existing.depth):
+                return
+
+            existing.value = value
+            existing.depth = depth
+            existing.flag = flag
+            existing.action = action
+            return
+
+        if len(entries) >= self.max_entries:
+            # dicts preserve insertion order: evict the oldest entry
+            del entries[next(iter(entries))]
+
+        entries[state] = TTEntry(value, depth, flag, action)
+
+
+def _deeper_or_equal(depth: Optional[int], other: Optional[int]) -> bool:
+    if depth is None:
+        return True
+    if other is None:
+        return False
+    return depth >= other
+
+
+# ---------------------------------------------------------------------------
+# Probing
+# ---------------------------------------------------------------------------
+
+def probe(
+    table: TranspositionTable[StateT, ActionT],
+    state: StateT,
+    depth: Optional[int],
+    alpha: float,
+    beta: float,
+) -> Tuple[Optional[float], float, float, Optional[ActionT]]:
+    """
+    Look `state` up before searching it to `depth` within (alpha, beta).
+
+    Return (value, alpha, beta, hint): `value` is the stored value if it
+    settles the search (None otherwise), the window is narrowed by a stored
+    bound, and `hint` is the stored best action, to be searched first.
+    """
+    entry = table.lookup(state)
+    if entry is None:
+        return None, alpha, beta, None
+
+    if entry.covers(depth):
+        if entry.flag == EXACT:
+            return entry.value, alpha, beta, entry.action
+        if entry.flag == LOWER:
+            alpha = max(alpha, entry.value)
+        else:
+            beta = min(beta, entry.value)
+
+        if beta <= alpha:
+            return entry.value, alpha, beta, entry.action
+
+    return None, alpha, beta, entry.action
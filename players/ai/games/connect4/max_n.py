@@ -0,0 +1,160 @@
+"""
+Connect Four Max^n player using generic engine.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Optional
+
+from core.player import Player
+from core.types import Action, PlayerID, Result
+
+from games.connect4.game import Connect4Game
+from games.connect4.heuristic import WIN_SCORE, value
+from games.connect4.state import Connect4State
+
+from players.ai.core.search.max_n import PRUNING_MODES, max_n_decision
+from players.ai.core.search.iterative import iterative_deepening
+from players.ai.core.search.stack import stack_max_n_decision
+from players.ai.core.search.stats import SearchStats
+from players.ai.games.connect4.minimax import (
+    DEFAULT_DEPTH,
+    apply_move,
+    current_player,
+    is_terminal,
+    legal_moves,
+    next_states,
+    undo_move,
+)
+
+
+_game = Connect4Game()
+
+# utilities are +-value and always sum to zero
+MAX_SUM = 0.0
+MIN_UTILITY = -float(WIN_SCORE)
+
+
+# ---------------------------------------------------------------------------
+# Evaluation
+# ---------------------------------------------------------------------------
+
+def evaluate(state: Connect4State) -> Result:
+    """
+    Return utility vector for all players.
+    """
+    v = value(state)
+    return {_game.PLAYER_X: v, _game.PLAYER_O: -v}
+
+
+def callbacks() -> Dict[str, Any]:
+    """
+    Engine callables; the tree is walked in place with apply/undo.
+    """
+    return dict(
+        is_terminal=is_terminal,
+        evaluate=evaluate,
+        next_states=next_states,
+        current_player=current_player,
+        legal_actions=legal_moves,
+        apply=apply_move,
+        undo=undo_move,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Player implementation
+# ---------------------------------------------------------------------------
+
+class MaxnConnect4Player(Player):
+    """
+    Depth-limited Connect Four AI using Max^n.
+
+    With `time_budget` (seconds) and/or `node_budget` (expansions), the
+    search deepens iteratively up to `depth` and plays the best move of the
+    last iteration completed within the budget.
+
+    `pruning` selects the Max^n variant: "none", "shallow" (same move, fewer
+    nodes) or "paranoid" (alpha-beta against a coalition of the others).
+    With `stack`, the explicit-stack engine runs the search instead (same
+    move).
+
+    With `collect_stats`, the SearchStats of the latest move are kept in
+    `last_stats`.
+    """
+
+    def __init__(
+        self,
+        player_id: PlayerID,
+        depth: Optional[int] = DEFAULT_DEPTH,
+        time_budget: Optional[float] = None,
+        node_budget: Optional[int] = None,
+        pruning: str = "none",
+        stack: bool = False,
+        collect_stats: bool = False,
+    ):
+        if pruning not in PRUNING_MODES:
+            raise ValueError(
+                f"Unknown pruning mode {pruning!r} (choose from {', '.join(PRUNING_MODES)})."
+            )
+
+        super().__init__(player_id)
+        self.depth = depth
+        self.game = _game
+        self.callbacks = callbacks()
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.pruning = pruning
+        self.stack = stack
+
+        self.collect_stats = collect_stats
+        self.last_stats: Optional[SearchStats] = None
+
+    def select_action(self, state, legal_actions) -> Action:
+        assert isinstance(state, Connect4State)
+
+        stats = SearchStats() if self.collect_stats else None
+
+        action = self._search(state, stats)
+
+        if stats is not None:
+            stats.end()
+        self.last_stats = stats
+
+        return action
+
+    def _search(self, state: Connect4State, stats: Optional[SearchStats]) -> Action:
+        # in-place search mutates the root; keep the caller's state intact
+        state = state.copy()
+
+        decide = stack_max_n_decision if self.stack else max_n_decision
+
+        if self.time_budget is not None or self.node_budget is not None:
+            # the game cannot last longer than the number of free cells
+            remaining = Connect4Game.ROWS * Connect4Game.COLS - state.mask.bit_count()
+
+            return iterative_deepening(
+                decide,
+                state,
+                self.player_id,
+                **self.callbacks,
+                max_depth=(
+                    remaining if self.depth is None else min(self.depth, remaining)
+                ),
+                time_budget=self.time_budget,
+                node_budget=self.node_budget,
+                pruning=self.pruning,
+                max_sum=MAX_SUM,
+                min_utility=MIN_UTILITY,
+                stats=stats,
+            )
+
+        return decide(
+            state,
+            self.player_id,
+            **self.callbacks,
+            depth=self.depth,
+            pruning=self.pruning,
+            max_sum=MAX_SUM,
+            min_utility=MIN_UTILITY,
+            stats=stats,
+        )
@@ -0,0 +1,212 @@
+"""
+Connect Four Minimax player using generic minimax engine.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Tuple, Optional
+
+from core.player import Player
+from core.types import Action, PlayerID
+
+from games.connect4.game import Connect4Game
+from games.connect4.heuristic import value
+from games.connect4.state import Connect4State, position_key
+
+from players.ai.core.search.minimax import ALGORITHMS, minimax_decision
+from players.ai.core.search.iterative import iterative_deepening
+from players.ai.core.search.ordering import MoveOrdering
+from players.ai.core.search.stack import stack_minimax_decision
+from players.ai.core.search.stats import SearchStats
+from players.ai.core.search.transposition import TranspositionTable
+
+
+_game = Connect4Game()
+
+DEFAULT_DEPTH = 6
+
+
+# ---------------------------------------------------------------------------
+# Terminal + heuristic evaluation
+# ---------------------------------------------------------------------------
+
+def is_terminal(state: Connect4State) -> bool:
+    return _game.is_terminal(state)
+
+
+def evaluate(state: Connect4State, root_player: PlayerID) -> float:
+    v = value(state)
+    return v if root_player == _game.PLAYER_X else -v
+
+
+def next_states(state: Connect4State) -> Iterable[Tuple[Action, Connect4State]]:
+    player = state.current_player
+
+    return [
+        (column, _game.next_state(state, {player: column}))
+        for column in _game.legal_actions(state, player)
+    ]
+
+
+def current_player(state: Connect4State) -> PlayerID:
+    return state.current_player
+
+
+# in-place (apply/undo) counterparts
+
+def legal_moves(state: Connect4State) -> Iterable[Action]:
+    return _game.legal_actions(state, state.current_player)
+
+
+def apply_move(state: Connect4State, action: Action) -> None:
+    state.apply(action)
+
+
+def undo_move(state: Connect4State) -> None:
+    state.undo()
+
+
+# static move ordering: central columns first
+_COLUMN_PRIORITY = (0, 1, 2, 3, 2, 1, 0)
+
+
+def move_priority(state: Connect4State, action: Action) -> int:
+    return _COLUMN_PRIORITY[action]
+
+
+def callbacks() -> Dict[str, Any]:
+    """
+    Engine callables; the tree is walked in place with apply/undo.
+    """
+    return dict(
+        is_terminal=is_terminal,
+        evaluate=evaluate,
+        next_states=next_states,
+        current_player=current_player,
+        legal_actions=legal_moves,
+        apply=apply_move,
+        undo=undo_move,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Player implementation
+# ---------------------------------------------------------------------------
+
+class MinimaxConnect4Player(Player):
+    """
+    Depth-limited Connect Four AI (the full tree is far too large to
+    search; `depth=None` would try).
+
+    If `table_size` is given, a transposition table of that many entries is
+    kept for the lifetime of the player and reused across moves.
+
+    With `time_budget` (seconds) and/or `node_budget` (expansions), the
+    search deepens iteratively up to `depth` and plays the best move of the
+    last iteration completed within the budget.
+
+    With `ordering` (the default), children are searched central columns
+    first, with killer moves and a history table kept across moves.
+
+    `algorithm` selects the root search ("alphabeta", "pvs", "aspiration",
+    "mtdf"; see `minimax_decision`). With `stack`, the explicit-stack engine
+    runs the search instead (same move; "alphabeta" only).
+
+    With `collect_stats`, the SearchStats of the latest move are kept in
+    `last_stats`.
+    """
+
+    def __init__(
+        self,
+        player_id: PlayerID,
+        depth: Optional[int] = DEFAULT_DEPTH,
+        table_size: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        node_budget: Optional[int] = None,
+        ordering: bool = True,
+        algorithm: str = "alphabeta",
+        stack: bool = False,
+        collect_stats: bool = False,
+    ):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(
+                f"Unknown algorithm {algorithm!r} (choose from {', '.join(ALGORITHMS)})."
+            )
+        if stack and algorithm != "alphabeta":
+            raise ValueError("stack can only be combined with alphabeta.")
+
+        super().__init__(player_id)
+        self.depth = depth
+        self.game = _game
+        self.callbacks = callbacks()
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.algorithm = algorithm
+        self.stack = stack
+
+        self.ordering: Optional[MoveOrdering] = None
+        if ordering:
+            self.ordering = MoveOrdering(priority=move_priority)
+            self.callbacks["ordering"] = self.ordering
+
+        self.table: Optional[TranspositionTable] = None
+        if table_size is not None:
+            self.table = TranspositionTable(table_size, key=position_key)
+
+        self.collect_stats = collect_stats
+        self.last_stats: Optional[SearchStats] = None
+
+    def select_action(self, state, legal_actions) -> Action:
+        assert isinstance(state, Connect4State)
+
+        stats = SearchStats() if self.collect_stats else None
+
+        action = self._search(state, stats)
+
+        if stats is not None:
+            stats.end()
+        self.last_stats = stats
+
+        return action
+
+    def _search(self, state: Connect4State, stats: Optional[SearchStats]) -> Action:
+        # in-place search mutates the root; keep the caller's state intact
+        state = state.copy()
+
+        table = self.table
+        if table is None and self.algorithm == "mtdf":
+            # MTD(f) needs a table; without a lasting one, use one per move
+            table = TranspositionTable(key=position_key)
+
+        if self.stack:
+            decide, options = stack_minimax_decision, {}
+        else:
+            decide, options = minimax_decision, {"algorithm": self.algorithm}
+
+        if self.time_budget is not None or self.node_budget is not None:
+            # the game cannot last longer than the number of free cells
+            remaining = Connect4Game.ROWS * Connect4Game.COLS - state.mask.bit_count()
+
+            return iterative_deepening(
+                decide,
+                state,
+                self.player_id,
+                **self.callbacks,
+                max_depth=(
+                    remaining if self.depth is None else min(self.depth, remaining)
+                ),
+                time_budget=self.time_budget,
+                node_budget=self.node_budget,
+                table=table,
+                stats=stats,
+                **options,
+            )
+
+        return decide(
+            state,
+            self.player_id,
+            **self.callbacks,
+            depth=self.depth,
+            table=table,
+            stats=stats,
+            **options,
+        )
@@ -0,0 +1,241 @@
+"""
+m,n,k Max^n player using generic engine; any number of players.
+"""
+
+from __future__ import annotations
+from functools import lru_cache, partial
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.player import Player
+from core.types import Action, PlayerID, Result
+
+from games.mnk.game import MNKGame, three_player_game
+from games.mnk.heuristic import MAX_SUM, MIN_UTILITY, utilities
+from games.mnk.state import MNKState
+
+from players.ai.core.search.max_n import PRUNING_MODES, max_n_decision
+from players.ai.core.search.iterative import iterative_deepening
+from players.ai.core.search.stack import stack_max_n_decision
+from players.ai.core.search.stats import SearchStats
+
+
+DEFAULT_DEPTH = 2
+
+
+# ---------------------------------------------------------------------------
+# Terminal + evaluation
+# ---------------------------------------------------------------------------
+
+def is_terminal(state: MNKState, game: MNKGame) -> bool:
+    return game.is_terminal(state)
+
+
+def evaluate(state: MNKState, game: MNKGame) -> Result:
+    """
+    Return utility vector for all players.
+    """
+    return utilities(state, game)
+
+
+def next_states(
+    state: MNKState, game: MNKGame
+) -> Iterable[Tuple[Action, MNKState]]:
+    player = state.current_player
+
+    return [
+        (move, game.next_state(state, {player: move}))
+        for move in game.legal_actions(state, player)
+    ]
+
+
+def current_player(state: MNKState) -> PlayerID:
+    return state.current_player
+
+
+# ---------------------------------------------------------------------------
+# Candidate moves
+# ---------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def _neighbourhoods(rows: int, cols: int, radius: int) -> Tuple[int, ...]:
+    """
+    Per cell bit, the bitmask of cells within `radius` of it.
+    """
+    masks: List[int] = []
+
+    for r in range(rows):
+        for c in range(cols):
+            mask = 0
+            for rr in range(max(0, r - radius), min(rows, r + radius + 1)):
+                for cc in range(max(0, c - radius), min(cols, c + radius + 1)):
+                    mask |= 1 << (rr * cols + cc)
+            masks.append(mask)
+
+    return tuple(masks)
+
+
+def nearby_moves(state: MNKState, game: MNKGame, radius: int) -> Tuple[Action, ...]:
+    """
+    Free cells within `radius` (rows and columns) of a placed stone; on an
+    empty board, the central cell.
+    """
+    occupied = 0
+    for mask in state.stones:
+        occupied |= mask
+
+    if not occupied:
+        return ((game.rows // 2, game.cols // 2),)
+
+    # grow the stones by `radius`: one table lookup per stone
+    near = _neighbourhoods(game.rows, game.cols, radius)
+    reach = 0
+    stones = occupied
+    while stones:
+        low = stones & -stones
+        reach |= near[low.bit_length() - 1]
+        stones ^= low
+
+    return tuple(game.moves(reach & state.free))
+
+
+def nearby_next_states(
+    state: MNKState, game: MNKGame, radius: int
+) -> Iterable[Tuple[Action, MNKState]]:
+    """
+    Like `next_states`, for the `nearby_moves` only.
+    """
+    player = state.current_player
+
+    return [
+        (move, game.next_state(state, {player: move}))
+        for move in nearby_moves(state, game, radius)
+    ]
+
+
+def callbacks(game: MNKGame, radius: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Engine callables bound to `game`.
+
+    With `radius`, only cells within that distance of a placed stone are
+    searched (see `nearby_moves`); moves far from all stones rarely matter
+    in k-in-a-row games, and cutting them shrinks the branching factor
+    several times over.
+    """
+    if radius is None:
+        expand = partial(next_states, game=game)
+    else:
+        expand = partial(nearby_next_states, game=game, radius=radius)
+
+    return dict(
+        is_terminal=partial(is_terminal, game=game),
+        evaluate=partial(evaluate, game=game),
+        next_states=expand,
+        current_player=current_player,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Player implementation
+# ---------------------------------------------------------------------------
+
+class MaxnMNKPlayer(Player):
+    """
+    Depth-limited m,n,k AI using Max^n, for any number of players.
+
+    `game` is the MNKGame being played (defaults to `three_player_game()`);
+    positions are scored with the utility vectors of `games.mnk.heuristic`.
+
+    With `radius`, only moves within that distance of a placed stone are
+    considered, which makes deeper searches affordable on larger boards.
+
+    With `time_budget` (seconds) and/or `node_budget` (expansions), the
+    search deepens iteratively up to `depth` and plays the best move of the
+    last iteration completed within the budget.
+
+    `pruning` selects the Max^n variant: "none", "shallow" (same move, fewer
+    nodes) or "paranoid" (alpha-beta against a coalition of the others).
+    With `stack`, the explicit-stack engine runs the search instead (same
+    move).
+
+    With `collect_stats`, the SearchStats of the latest move are kept in
+    `last_stats`.
+    """
+
+    def __init__(
+        self,
+        player_id: PlayerID,
+        game: Optional[MNKGame] = None,
+        depth: Optional[int] = DEFAULT_DEPTH,
+        radius: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        node_budget: Optional[int] = None,
+        pruning: str = "none",
+        stack: bool = False,
+        collect_stats: bool = False,
+    ):
+        if radius is not None and radius < 1:
+            raise ValueError("radius must be at least 1.")
+        if pruning not in PRUNING_MODES:
+            raise ValueError(
+                f"Unknown pruning mode {pruning!r} (choose from {', '.join(PRUNING_MODES)})."
+            )
+
+        super().__init__(player_id)
+        self.game = three_player_game() if game is None else game
+        self.depth = depth
+        self.radius = radius
+        self.callbacks = callbacks(self.game, radius)
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.pruning = pruning
+        self.stack = stack
+
+        self.collect_stats = collect_stats
+        self.last_stats: Optional[SearchStats] = None
+
+    def select_action(self, state, legal_actions) -> Action:
+        assert isinstance(state, MNKState)
+
+        stats = SearchStats() if self.collect_stats else None
+
+        action = self._search(state, stats)
+
+        if stats is not None:
+            stats.end()
+        self.last_stats = stats
+
+        return action
+
+    def _search(self, state: MNKState, stats: Optional[SearchStats]) -> Action:
+        decide = stack_max_n_decision if self.stack else max_n_decision
+
+        if self.time_budget is not None or self.node_budget is not None:
+            # the game cannot last longer than the number of free cells
+            remaining = state.free.bit_count()
+
+            return iterative_deepening(
+                decide,
+                state,
+                self.player_id,
+                **self.callbacks,
+                max_depth=(
+                    remaining if self.depth is None else min(self.depth, remaining)
+                ),
+                time_budget=self.time_budget,
+                node_budget=self.node_budget,
+                pruning=self.pruning,
+                max_sum=MAX_SUM,
+                min_utility=MIN_UTILITY,
+                stats=stats,
+            )
+
+        return decide(
+            state,
+            self.player_id,
+            **self.callbacks,
+            depth=self.depth,
+            pruning=self.pruning,
+            max_sum=MAX_SUM,
+            min_utility=MIN_UTILITY,
+            stats=stats,
+        )
@@ -0,0 +1,76 @@
+"""
+Tic-Tac-Toe opening book: positions keyed on their base-3 code, minimax
+once out of book.
+"""
+
+from __future__ import annotations
+from typing import Any, Iterable, Optional
+
+from core.player import Player
+from core.types import PlayerID
+
+from games.tictactoe.encoding import decode_moves, encode, replay
+from games.tictactoe.game import TicTacToeGame
+
+from players.ai.core.book import BookPlayer, OpeningBook
+from players.ai.games.tictactoe.minimax import MinimaxTicTacToePlayer, cached
+
+
+_game = TicTacToeGame()
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+def build_book(
+    encoded_games: Iterable[bytes],
+    max_ply: int = 4,
+    min_count: int = 1,
+) -> OpeningBook:
+    """
+    Book from games encoded with `encoding.encode_moves` (e.g. the records
+    of a bot_match archive).
+    """
+    book = OpeningBook(encode, max_ply=max_ply, min_count=min_count)
+
+    for data in encoded_games:
+        states = replay(data, _game)
+        history = [
+            {state.current_player: move}
+            for state, move in zip(states, decode_moves(data))
+        ]
+        book.add_game(_game, history, _game.result(states[-1]))
+
+    return book
+
+
+# ---------------------------------------------------------------------------
+# Player implementation
+# ---------------------------------------------------------------------------
+
+class BookTicTacToePlayer(BookPlayer):
+    """
+    Plays from the book saved at `path`, then searches with a
+    MinimaxTicTacToePlayer built from `depth`, `game` and `fallback_params`.
+
+    With `cache`, the searched moves go through the shared position cache
+    (see `minimax.cached`).
+    """
+
+    def __init__(
+        self,
+        player_id: PlayerID,
+        path: str,
+        depth: Optional[int] = None,
+        game: Optional[TicTacToeGame] = None,
+        min_count: Optional[int] = None,
+        cache: bool = False,
+        **fallback_params: Any,
+    ):
+        fallback: Player = MinimaxTicTacToePlayer(
+            player_id, depth=depth, game=game, **fallback_params
+        )
+        if cache:
+            fallback = cached(fallback)
+        super().__init__(fallback, OpeningBook.load(path, encode, min_count=min_count))
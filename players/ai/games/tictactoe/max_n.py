@@ -3,53 +3,134 @@ Tic-Tac-Toe Max^n player using generic engine.
 """
 
 from __future__ import annotations
-from typing import Iterable, Tuple, Optional, Sequence
+from functools import partial
+from typing import Any, Dict, Iterable, Tuple, Optional
 
 from core.player import Player
 from core.types import Action, PlayerID,Result
 
+from games.tictactoe.encoding import encode
 from games.tictactoe.game import TicTacToeGame
 from games.tictactoe.state import TicTacToeState
+from games.tictactoe.symmetry import unique_actions, unique_children
 
 from players.ai.core.search.max_n import max_n_decision
+from players.ai.core.search.iterative import iterative_deepening
+from players.ai.core.search.cache import CachedPlayer, PositionCache
+from players.ai.core.search.stats import SearchStats
 
 
 _game = TicTacToeGame()
 
+# utilities are +1 / -1 / 0 and always sum to zero
+MAX_SUM = 0.0
+MIN_UTILITY = -1.0
+
 
 # ---------------------------------------------------------------------------
 # Terminal + evaluation
 # ---------------------------------------------------------------------------
 
-def is_terminal(state: TicTacToeState) -> bool:
-    return _game.is_terminal(state)
+def is_terminal(state: TicTacToeState, game: TicTacToeGame = _game) -> bool:
+    return game.is_terminal(state)
 
 
-def evaluate(state: TicTacToeState) -> Result:
+def evaluate(state: TicTacToeState, game: TicTacToeGame = _game) -> Result:
     """
     Return utility vector for all players.
     """
-    result = _game.result(state)
+    result = game.result(state)
     return result
 
 
 
-def next_states(state: TicTacToeState) -> Iterable[Tuple[Action, TicTacToeState]]:
+def next_states(
+    state: TicTacToeState, game: TicTacToeGame = _game
+) -> Iterable[Tuple[Action, TicTacToeState]]:
     player = state.current_player
 
     results: list[Tuple[Action, TicTacToeState]] = []
 
-    for action in _game.legal_actions(state, player):
+    for action in game.legal_actions(state, player):
         joint = {player: action}
-        results.append((action, _game.next_state(state, joint)))
+        results.append((action, game.next_state(state, joint)))
 
     return results
 
 
+def symmetric_next_states(
+    state: TicTacToeState, game: TicTacToeGame = _game
+) -> Iterable[Tuple[Action, TicTacToeState]]:
+    """
+    Like `next_states`, keeping one child per symmetry class.
+    """
+    return unique_children(next_states(state, game))
+
+
 def current_player(state: TicTacToeState) -> PlayerID:
     return state.current_player
 
 
+# in-place (apply/undo) counterparts, used when the game supports them
+
+def legal_moves(
+    state: TicTacToeState, game: TicTacToeGame = _game
+) -> Iterable[Action]:
+    return game.legal_actions(state, state.current_player)
+
+
+def symmetric_legal_moves(
+    state: TicTacToeState, game: TicTacToeGame = _game
+) -> Iterable[Action]:
+    return unique_actions(state, legal_moves(state, game))
+
+
+def apply_move(state: TicTacToeState, action: Action) -> None:
+    state.apply(action)
+
+
+def undo_move(state: TicTacToeState) -> None:
+    state.undo()
+
+
+def callbacks(
+    game: TicTacToeGame = _game, symmetry: bool = False
+) -> Dict[str, Any]:
+    """
+    Engine callables bound to `game` (e.g. a BitboardTicTacToeGame).
+
+    With `symmetry`, children symmetric to an earlier sibling are skipped.
+    If the game supports in-place apply/undo, the engines are given those
+    too and will mutate the searched state instead of copying it.
+    """
+    expand = symmetric_next_states if symmetry else next_states
+
+    if game is _game:
+        return dict(
+            is_terminal=is_terminal,
+            evaluate=evaluate,
+            next_states=expand,
+            current_player=current_player,
+        )
+
+    fns = dict(
+        is_terminal=partial(is_terminal, game=game),
+        evaluate=partial(evaluate, game=game),
+        next_states=partial(expand, game=game),
+        current_player=current_player,
+    )
+
+    if game.supports_inplace():
+        moves = symmetric_legal_moves if symmetry else legal_moves
+        fns.update(
+            legal_actions=partial(moves, game=game),
+            apply=apply_move,
+            undo=undo_move,
+        )
+
+    return fns
+
+
 # ---------------------------------------------------------------------------
 # Player implementation
 # ---------------------------------------------------------------------------
@@ -57,21 +138,106 @@ def current_player(state: TicTacToeState) -> PlayerID:
 class MaxnTicTacToePlayer(Player):
     """
     Perfect or depth-limited Tic-Tac-Toe AI using Max^n.
+
+    `game` selects the rules implementation searched (defaults to the
+    tuple-based TicTacToeGame; pass a BitboardTicTacToeGame for speed).
+
+    With `symmetry`, only one of each set of symmetric sibling positions is
+    searched; the chosen move is the same as without it.
+
+    With `time_budget` (seconds) and/or `node_budget` (expansions), the
+    search deepens iteratively up to `depth` and plays the best move of the
+    last iteration completed within the budget.
+
+    `pruning` selects the Max^n variant: "none", "shallow" (same move, fewer
+    nodes) or "paranoid" (alpha-beta against a coalition of the others).
+
+    With `collect_stats`, the SearchStats of the latest move are kept in
+    `last_stats`.
     """
 
-    def __init__(self, player_id: PlayerID, depth: Optional[int] = None):
+    def __init__(
+        self,
+        player_id: PlayerID,
+        depth: Optional[int] = None,
+        game: Optional[TicTacToeGame] = None,
+        symmetry: bool = False,
+        time_budget: Optional[float] = None,
+        node_budget: Optional[int] = None,
+        pruning: str = "none",
+        collect_stats: bool = False,
+    ):
         super().__init__(player_id)
         self.depth = depth
+        self.game = _game if game is None else game
+        self.symmetry = symmetry
+        self.callbacks = callbacks(self.game, symmetry)
+        self.inplace = self.game.supports_inplace()
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.pruning = pruning
+
+        self.collect_stats = collect_stats
+        self.last_stats: Optional[SearchStats] = None
 
     def select_action(self, state, legal_actions) -> Action:
         assert isinstance(state, TicTacToeState)
 
+        stats = SearchStats() if self.collect_stats else None
+
+        action = self._search(state, stats)
+
+        if stats is not None:
+            stats.end()
+        self.last_stats = stats
+
+        return action
+
+    def _search(self, state: TicTacToeState, stats: Optional[SearchStats]) -> Action:
+        if self.inplace:
+            # in-place search mutates the root; keep the caller's state intact
+            state = state.copy()
+
+        if self.time_budget is not None or self.node_budget is not None:
+            # the game cannot last longer than the number of free cells
+            remaining = len(list(self.game.legal_actions(state, self.player_id)))
+
+            return iterative_deepening(
+                max_n_decision,
+                state,
+                self.player_id,
+                **self.callbacks,
+                max_depth=(
+                    remaining if self.depth is None else min(self.depth, remaining)
+                ),
+                time_budget=self.time_budget,
+                node_budget=self.node_budget,
+                pruning=self.pruning,
+                max_sum=MAX_SUM,
+                min_utility=MIN_UTILITY,
+                stats=stats,
+            )
+
         return max_n_decision(
             state,
             self.player_id,
-            is_terminal=is_terminal,
-            evaluate=evaluate,
-            next_states=next_states,
-            current_player=current_player,
+            **self.callbacks,
             depth=self.depth,
+            pruning=self.pruning,
+            max_sum=MAX_SUM,
+            min_utility=MIN_UTILITY,
+            stats=stats,
         )
+
+
+def cached(
+    player: MaxnTicTacToePlayer, cache: Optional[PositionCache] = None
+) -> Player:
+    """
+    `player` behind a CachedPlayer keyed on its depth, pruning mode and the
+    position (default: the process-wide shared cache). Budgeted players are
+    returned as they are, since their moves depend on timing.
+    """
+    if player.time_budget is not None or player.node_budget is not None:
+        return player
+    return CachedPlayer(player, encode, ("maxn", player.depth, player.pruning), cache)
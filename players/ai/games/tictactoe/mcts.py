@@ -0,0 +1,94 @@
+"""
+Tic-Tac-Toe MCTS player using generic UCT engine.
+"""
+
+from __future__ import annotations
+from functools import partial
+from typing import Optional, Sequence
+
+from core.player import Player
+from core.types import Action, PlayerID, Result
+
+from games.tictactoe.game import TicTacToeGame
+from games.tictactoe.state import TicTacToeState
+
+from players.ai.core.search.mcts import MCTS
+
+
+_game = TicTacToeGame()
+
+
+# ---------------------------------------------------------------------------
+# Game callables
+# ---------------------------------------------------------------------------
+
+def is_terminal(state: TicTacToeState, game: TicTacToeGame = _game) -> bool:
+    return game.is_terminal(state)
+
+
+def result(state: TicTacToeState, game: TicTacToeGame = _game) -> Result:
+    return game.result(state)
+
+
+def legal_actions(
+    state: TicTacToeState, game: TicTacToeGame = _game
+) -> Sequence[Action]:
+    actions = game.legal_actions(state, state.current_player)
+    return actions if isinstance(actions, (list, tuple)) else list(actions)
+
+
+def next_state(
+    state: TicTacToeState, action: Action, game: TicTacToeGame = _game
+) -> TicTacToeState:
+    return game.next_state(state, {state.current_player: action})
+
+
+def current_player(state: TicTacToeState) -> PlayerID:
+    return state.current_player
+
+
+# ---------------------------------------------------------------------------
+# Player implementation
+# ---------------------------------------------------------------------------
+
+class MCTSTicTacToePlayer(Player):
+    """
+    Tic-Tac-Toe AI using UCT Monte Carlo Tree Search.
+
+    Each move runs `iterations` playouts and/or searches for `time_budget`
+    seconds. The tree under the chosen move is kept, so the next decision
+    starts from the statistics already gathered for the reply.
+    """
+
+    def __init__(
+        self,
+        player_id: PlayerID,
+        iterations: Optional[int] = 1000,
+        time_budget: Optional[float] = None,
+        exploration: float = 1.4,
+        seed: Optional[int] = None,
+        game: Optional[TicTacToeGame] = None,
+    ):
+        super().__init__(player_id)
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.game = _game if game is None else game
+
+        self.search = MCTS(
+            is_terminal=partial(is_terminal, game=self.game),
+            result=partial(result, game=self.game),
+            legal_actions=partial(legal_actions, game=self.game),
+            next_state=partial(next_state, game=self.game),
+            current_player=current_player,
+            exploration=exploration,
+            seed=seed,
+        )
+
+    def select_action(self, state, legal_actions) -> Action:
+        assert isinstance(state, TicTacToeState)
+
+        return self.search.search(
+            state,
+            iterations=self.iterations,
+            time_budget=self.time_budget,
+        )
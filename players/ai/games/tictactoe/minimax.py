@@ -3,16 +3,26 @@ Tic-Tac-Toe Minimax player using generic minimax engine.
 """
 
 from __future__ import annotations
-from typing import Iterable, Tuple, Optional
+from functools import partial
+from typing import Any, Dict, Iterable, Tuple, Optional
 
 from core.player import Player
 from core.types import Action, PlayerID
 
+from games.tictactoe.bitboard import position_key
+from games.tictactoe.encoding import encode
 from games.tictactoe.game import TicTacToeGame
 from games.tictactoe.state import TicTacToeState
+from games.tictactoe.symmetry import canonical_key, unique_actions, unique_children
 
 
-from players.ai.core.search.minimax import minimax_decision
+from players.ai.core.search.minimax import ALGORITHMS, minimax_decision
+from players.ai.core.search.iterative import iterative_deepening
+from players.ai.core.search.ordering import MoveOrdering
+from players.ai.core.search.parallel import ParallelMinimax
+from players.ai.core.search.cache import CachedPlayer, PositionCache
+from players.ai.core.search.stats import SearchStats
+from players.ai.core.search.transposition import TranspositionTable
 
 
 _game = TicTacToeGame()
@@ -23,30 +33,117 @@ _game = TicTacToeGame()
 # ---------------------------------------------------------------------------
 
 
-def is_terminal(state: TicTacToeState) -> bool:
-    return _game.is_terminal(state)
+def is_terminal(state: TicTacToeState, game: TicTacToeGame = _game) -> bool:
+    return game.is_terminal(state)
 
 
-def evaluate(state: TicTacToeState, root_player: PlayerID) -> float:
-    return _game.result(state).get(root_player, 0.0)
+def evaluate(
+    state: TicTacToeState, root_player: PlayerID, game: TicTacToeGame = _game
+) -> float:
+    return game.result(state).get(root_player, 0.0)
 
 
-def next_states(state: TicTacToeState) -> Iterable[Tuple[Action, TicTacToeState]]:
+def next_states(
+    state: TicTacToeState, game: TicTacToeGame = _game
+) -> Iterable[Tuple[Action, TicTacToeState]]:
     player = state.current_player
 
     results: list[Tuple[Action, TicTacToeState]] = []
 
-    for action in _game.legal_actions(state, player):
+    for action in game.legal_actions(state, player):
         joint = {player: action}
-        results.append((action, _game.next_state(state, joint)))
+        results.append((action, game.next_state(state, joint)))
 
     return results
 
 
+def symmetric_next_states(
+    state: TicTacToeState, game: TicTacToeGame = _game
+) -> Iterable[Tuple[Action, TicTacToeState]]:
+    """
+    Like `next_states`, keeping one child per symmetry class.
+    """
+    return unique_children(next_states(state, game))
+
+
 def current_player(state: TicTacToeState) -> PlayerID:
     return state.current_player
 
 
+# in-place (apply/undo) counterparts, used when the game supports them
+
+def legal_moves(
+    state: TicTacToeState, game: TicTacToeGame = _game
+) -> Iterable[Action]:
+    return game.legal_actions(state, state.current_player)
+
+
+def symmetric_legal_moves(
+    state: TicTacToeState, game: TicTacToeGame = _game
+) -> Iterable[Action]:
+    return unique_actions(state, legal_moves(state, game))
+
+
+def next_state(
+    state: TicTacToeState, action: Action, game: TicTacToeGame = _game
+) -> TicTacToeState:
+    return game.next_state(state, {state.current_player: action})
+
+
+# static move ordering: center, then corners, then edges
+_CELL_PRIORITY = {(1, 1): 2, (0, 0): 1, (0, 2): 1, (2, 0): 1, (2, 2): 1}
+
+
+def move_priority(state: TicTacToeState, action: Action) -> int:
+    return _CELL_PRIORITY.get(action, 0)
+
+
+def apply_move(state: TicTacToeState, action: Action) -> None:
+    state.apply(action)
+
+
+def undo_move(state: TicTacToeState) -> None:
+    state.undo()
+
+
+def callbacks(
+    game: TicTacToeGame = _game, symmetry: bool = False
+) -> Dict[str, Any]:
+    """
+    Engine callables bound to `game` (e.g. a BitboardTicTacToeGame).
+
+    With `symmetry`, children symmetric to an earlier sibling are skipped.
+    If the game supports in-place apply/undo, the engines are given those
+    too and will mutate the searched state instead of copying it.
+    """
+    expand = symmetric_next_states if symmetry else next_states
+
+    if game is _game:
+        return dict(
+            is_terminal=is_terminal,
+            evaluate=evaluate,
+            next_states=expand,
+            current_player=current_player,
+        )
+
+    fns = dict(
+        is_terminal=partial(is_terminal, game=game),
+        evaluate=partial(evaluate, game=game),
+        next_states=partial(expand, game=game),
+        current_player=current_player,
+    )
+
+    if game.supports_inplace():
+        moves = symmetric_legal_moves if symmetry else legal_moves
+        fns.update(
+            legal_actions=partial(moves, game=game),
+            apply=apply_move,
+            undo=undo_move,
+        )
+
+    return fns
+
+
 # ---------------------------------------------------------------------------
 # Player implementation
 # ---------------------------------------------------------------------------
@@ -55,21 +152,185 @@ def current_player(state: TicTacToeState) -> PlayerID:
 class MinimaxTicTacToePlayer(Player):
     """
     Perfect or depth-limited Tic-Tac-Toe AI.
+
+    If `table_size` is given, a transposition table of that many entries is
+    kept for the lifetime of the player and reused across moves.
+
+    `game` selects the rules implementation searched (defaults to the
+    tuple-based TicTacToeGame; pass a BitboardTicTacToeGame for speed).
+
+    With `symmetry`, only one of each set of symmetric sibling positions is
+    searched and the transposition table is keyed on canonical positions;
+    the chosen move is the same as without it.
+
+    With `time_budget` (seconds) and/or `node_budget` (expansions), the
+    search deepens iteratively up to `depth` and plays the best move of the
+    last iteration completed within the budget.
+
+    With `workers`, fixed-depth searches split the root moves over a pool of
+    that many processes (created on first use; call `close()` to release
+    it). The chosen move is the same as the sequential search's. Each worker
+    keeps its own `table_size` transposition table.
+
+    With `collect_stats`, the SearchStats of the latest move are kept in
+    `last_stats`.
+
+    With `ordering`, children are searched center/corners first, with
+    killer moves and a history table kept across moves, and are generated
+    lazily; the chosen move is the same, with fewer nodes searched.
+
+    `algorithm` selects the root search ("alphabeta", "pvs", "aspiration",
+    "mtdf"; see `minimax_decision`); the chosen move is the same, only the
+    work done differs. Alternatives to "alphabeta" cannot use `workers`.
     """
 
-    def __init__(self, player_id: PlayerID, depth: Optional[int] = None):
+    def __init__(
+        self,
+        player_id: PlayerID,
+        depth: Optional[int] = None,
+        table_size: Optional[int] = None,
+        game: Optional[TicTacToeGame] = None,
+        symmetry: bool = False,
+        time_budget: Optional[float] = None,
+        node_budget: Optional[int] = None,
+        workers: Optional[int] = None,
+        collect_stats: bool = False,
+        ordering: bool = False,
+        algorithm: str = "alphabeta",
+    ):
         super().__init__(player_id)
         self.depth = depth
+        self.game = _game if game is None else game
+        self.symmetry = symmetry
+        self.callbacks = callbacks(self.game, symmetry)
+        self.inplace = self.game.supports_inplace()
+
+        self.ordering: Optional[MoveOrdering] = None
+        if ordering:
+            self.ordering = MoveOrdering(priority=move_priority)
+            self.callbacks["ordering"] = self.ordering
+
+            if not self.inplace:
+                moves = symmetric_legal_moves if symmetry else legal_moves
+                self.callbacks.update(
+                    legal_actions=partial(moves, game=self.game),
+                    next_state=partial(next_state, game=self.game),
+                )
+        self.time_budget = time_budget
+        self.node_budget = node_budget
+        self.table: Optional[TranspositionTable] = None
+
+        if symmetry:
+            self.table_key = canonical_key
+        elif self.inplace:
+            self.table_key = position_key
+        else:
+            self.table_key = None
+
+        if table_size is not None:
+            self.table = TranspositionTable(table_size, key=self.table_key)
+
+        if workers is not None and (time_budget is not None or node_budget is not None):
+            raise ValueError("workers cannot be combined with a search budget.")
+        if algorithm not in ALGORITHMS:
+            raise ValueError(
+                f"Unknown algorithm {algorithm!r} (choose from {', '.join(ALGORITHMS)})."
+            )
+        if workers is not None and algorithm != "alphabeta":
+            raise ValueError("workers can only be combined with alphabeta.")
+
+        self.algorithm = algorithm
+
+        self.table_size = table_size
+        self.workers = workers
+        self._parallel: Optional[ParallelMinimax] = None
+
+        self.collect_stats = collect_stats
+        self.last_stats: Optional[SearchStats] = None
+
+    def close(self) -> None:
+        """
+        Shut down the worker pool, if one was started.
+        """
+        if self._parallel is not None:
+            self._parallel.close()
+            self._parallel = None
 
     def select_action(self, state, legal_actions) -> Action:
         assert isinstance(state, TicTacToeState)
 
+        stats = SearchStats() if self.collect_stats else None
+
+        action = self._search(state, stats)
+
+        if stats is not None:
+            stats.end()
+        self.last_stats = stats
+
+        return action
+
+    def _search(self, state: TicTacToeState, stats: Optional[SearchStats]) -> Action:
+        if self.inplace:
+            # in-place search mutates the root; keep the caller's state intact
+            state = state.copy()
+
+        table = self.table
+        if table is None and self.algorithm == "mtdf":
+            # MTD(f) needs a table; without a lasting one, use one per move
+            table = TranspositionTable(key=self.table_key)
+
+        if self.time_budget is not None or self.node_budget is not None:
+            # the game cannot last longer than the number of free cells
+            remaining = len(list(self.game.legal_actions(state, self.player_id)))
+
+            return iterative_deepening(
+                minimax_decision,
+                state,
+                self.player_id,
+                **self.callbacks,
+                max_depth=(
+                    remaining if self.depth is None else min(self.depth, remaining)
+                ),
+                time_budget=self.time_budget,
+                node_budget=self.node_budget,
+                table=table,
+                stats=stats,
+                algorithm=self.algorithm,
+            )
+
+        if self.workers is not None:
+            if self._parallel is None:
+                self._parallel = ParallelMinimax(
+                    self.workers, self.table_size, self.table_key
+                )
+
+            return self._parallel.decision(
+                state,
+                self.player_id,
+                **self.callbacks,
+                depth=self.depth,
+                stats=stats,
+            )
+
         return minimax_decision(
             state,
             self.player_id,
-            is_terminal=is_terminal,
-            evaluate=evaluate,
-            next_states=next_states,
-            current_player=current_player,
+            **self.callbacks,
             depth=self.depth,
+            table=table,
+            stats=stats,
+            algorithm=self.algorithm,
         )
+
+
+def cached(
+    player: MinimaxTicTacToePlayer, cache: Optional[PositionCache] = None
+) -> Player:
+    """
+    `player` behind a CachedPlayer keyed on its depth and the position
+    (default: the process-wide shared cache). Budgeted players are returned
+    as they are, since their moves depend on timing.
+    """
+    if player.time_budget is not None or player.node_budget is not None:
+        return player
+    return CachedPlayer(player, encode, ("minimax", player.depth), cache)
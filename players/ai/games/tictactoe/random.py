@@ -1,7 +1,7 @@
 
 from __future__ import annotations
 import random
-from typing import Iterable
+from typing import Iterable, List, Sequence
 
 from core.player import Player
 from core.state import State
@@ -23,3 +23,22 @@ class RandomTicTacToePlayer(Player):
             raise ValueError("No legal actions available for RandomTicTacToePlayer.")
 
         return self._rng.choice(legal_list)
+
+    def select_actions(
+        self,
+        states: Sequence[State],
+        legal_actions_list: Sequence[Iterable[Action]],
+    ) -> List[Action]:
+        # bind choice once for the whole batch
+        choice = self._rng.choice
+        actions: List[Action] = []
+
+        for legal_actions in legal_actions_list:
+            legal_list = list(legal_actions)
+
+            if not legal_list:
+                raise ValueError("No legal actions available for RandomTicTacToePlayer.")
+
+            actions.append(choice(legal_list))
+
+        return actions
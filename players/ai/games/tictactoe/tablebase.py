@@ -0,0 +1,90 @@
+"""
+Tic-Tac-Toe player backed by a retrograde tablebase.
+
+The whole game is solved once and written to disk; every move afterwards
+is a single record lookup in the memory-mapped file.
+"""
+
+from __future__ import annotations
+import os
+from typing import Optional
+
+from core.player import Player
+from core.types import Action, PlayerID
+
+from games.tictactoe.encoding import NUM_CODES, encode
+from games.tictactoe.game import TicTacToeGame
+from games.tictactoe.state import TicTacToeState
+
+from players.ai.core.search.retrograde import (
+    TERMINAL,
+    Tablebase,
+    solve,
+    write_tablebase,
+)
+
+
+_game = TicTacToeGame()
+
+DEFAULT_PATH = "tictactoe.tb"
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+def build(path: str = DEFAULT_PATH, game: Optional[TicTacToeGame] = None) -> int:
+    """
+    Solve Tic-Tac-Toe and write the tablebase; return the number of states.
+    """
+    game = _game if game is None else game
+
+    solution = solve(game, (game.PLAYER_X, game.PLAYER_O))
+    write_tablebase(
+        path,
+        solution,
+        key=encode,
+        key_space=NUM_CODES,
+        metadata={"game": "tictactoe", "key": "base3"},
+    )
+    return len(solution)
+
+
+# ---------------------------------------------------------------------------
+# Player implementation
+# ---------------------------------------------------------------------------
+
+class TablebaseTicTacToePlayer(Player):
+    """
+    Perfect Tic-Tac-Toe player reading moves from a tablebase file.
+
+    The file is built on first use if it does not exist yet. Stored action
+    indices refer to `legal_actions` order, which every Tic-Tac-Toe rules
+    implementation here shares (row-major empty cells).
+    """
+
+    def __init__(
+        self,
+        player_id: PlayerID,
+        path: str = DEFAULT_PATH,
+        game: Optional[TicTacToeGame] = None,
+    ):
+        super().__init__(player_id)
+        self.game = _game if game is None else game
+
+        if not os.path.exists(path):
+            build(path, self.game)
+
+        self.table = Tablebase(path)
+
+    def close(self) -> None:
+        self.table.close()
+
+    def select_action(self, state, legal_actions) -> Action:
+        assert isinstance(state, TicTacToeState)
+
+        index = self.table.action_index(encode(state))
+        if index == TERMINAL:
+            raise ValueError("No legal actions available.")
+
+        return list(self.game.legal_actions(state, self.player_id))[index]
@@ -1,74 +1,425 @@
 
 """
-Automated bot-vs-bot match runner for Tic-Tac-Toe.
+Automated bot-vs-bot match runner for Tic-Tac-Toe and m,n,k-games.
 
-Runs multiple games and prints win/draw statistics.
+Runs many games across a process pool and prints win/draw statistics and
+throughput. Each player's seed is derived from the base seed, the game
+index and its seat, so a series is reproducible regardless of the number of
+workers, and series with different base seeds share no player seeds. Results
+can be streamed to a JSONL file as games finish.
+
+Players are given as NAME[:key=value,...], e.g.
+
+    python -m runners.bot_match --x minimax:depth=3 --o mcts:iterations=500 \
+        --games 10000 --workers 8 --out results.jsonl
+
+Games with more than two players take one --seat per player, in turn
+order, e.g. three Max^n players on the 7x7, four-in-a-row board:
+
+    python -m runners.bot_match --game mnk3 --seat maxn:depth=3,radius=1 \
+        --seat maxn:pruning=shallow --seat random
+
+With --archive, every game's moves are appended to a record file (see
+core.records), readable by random access (Tic-Tac-Toe only).
 """
 
 from __future__ import annotations
 
+import argparse
+import ast
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, IO, Iterator, List, Optional, Sequence, Tuple
 
+from core.game import Game
 from core.match import Match
+from core.records import RecordWriter
+
+from games.mnk.game import MNKGame, three_player_game
 
 from games.tictactoe.game import TicTacToeGame
+from games.tictactoe.bitboard import BitboardTicTacToeGame
+from games.tictactoe.encoding import encode_moves, moves_from_history
 
 from players.ai.games.tictactoe.random import RandomTicTacToePlayer
 from players.ai.games.tictactoe.minimax import MinimaxTicTacToePlayer
+from players.ai.games.tictactoe.minimax import cached as cached_minimax
 from players.ai.games.tictactoe.max_n import MaxnTicTacToePlayer
+from players.ai.games.tictactoe.max_n import cached as cached_maxn
+from players.ai.games.tictactoe.mcts import MCTSTicTacToePlayer
+from players.ai.games.tictactoe.tablebase import TablebaseTicTacToePlayer
+from players.ai.games.tictactoe.book import BookTicTacToePlayer
+from players.ai.games.mnk.max_n import MaxnMNKPlayer
 from core.types import PlayerID
 from core.player import Player
-from typing import Dict
 # ---------------------------------------------------------------------------
-# Configure matchup here
+# Defaults
 # ---------------------------------------------------------------------------
 
 NUM_GAMES = 50
 
-PLAYER_X_FACTORY = lambda: MinimaxTicTacToePlayer("X", depth=None)
-PLAYER_O_FACTORY = lambda: MaxnTicTacToePlayer("O", depth=None)
+DEFAULT_X = "minimax"
+DEFAULT_O = "maxn"
+
+GAMES: Dict[str, Callable[[], Game]] = {
+    "tictactoe": TicTacToeGame,
+    "bitboard": BitboardTicTacToeGame,
+    "mnk3": three_player_game,
+}
+
+# games whose moves can be archived (see games.tictactoe.encoding)
+ARCHIVABLE = ("tictactoe", "bitboard")
+
+# players available per game, where not all of PLAYERS are
+GAME_PLAYERS: Dict[str, Tuple[str, ...]] = {
+    "mnk3": ("random", "maxn"),
+}
+
+# seat taken by every player of a game with more than two, unless --seat
+DEFAULT_SEAT = "maxn"
+
+
+# ---------------------------------------------------------------------------
+# Player specs
+# ---------------------------------------------------------------------------
+
+PlayerSpec = Tuple[str, Dict[str, Any]]
+
+
+def _random(pid: PlayerID, game: Game, seed: int, **params: Any) -> Player:
+    return RandomTicTacToePlayer(pid, seed=seed, **params)
+
+
+# search players share each worker's position cache across games unless
+# the spec says cache=False
+def _minimax(
+    pid: PlayerID, game: TicTacToeGame, seed: int, cache: bool = True, **params: Any
+) -> Player:
+    player = MinimaxTicTacToePlayer(pid, game=game, **params)
+    return cached_minimax(player) if cache else player
+
+
+def _maxn(pid: PlayerID, game: Game, seed: int, cache: bool = True, **params: Any) -> Player:
+    if isinstance(game, MNKGame):
+        return MaxnMNKPlayer(pid, game=game, **params)
+    player = MaxnTicTacToePlayer(pid, game=game, **params)
+    return cached_maxn(player) if cache else player
+
+
+def _mcts(pid: PlayerID, game: TicTacToeGame, seed: int, **params: Any) -> Player:
+    return MCTSTicTacToePlayer(pid, game=game, seed=seed, **params)
+
+
+def _book(pid: PlayerID, game: TicTacToeGame, seed: int, **params: Any) -> Player:
+    params.setdefault("cache", True)
+    return BookTicTacToePlayer(pid, game=game, **params)
+
+
+def _tablebase(pid: PlayerID, game: TicTacToeGame, seed: int, **params: Any) -> Player:
+    return TablebaseTicTacToePlayer(pid, game=game, **params)
+
+
+PLAYERS: Dict[str, Callable[..., Player]] = {
+    "random": _random,
+    "minimax": _minimax,
+    "maxn": _maxn,
+    "mcts": _mcts,
+    "tablebase": _tablebase,
+    "book": _book,
+}
+
+
+def parse_player_spec(text: str) -> PlayerSpec:
+    """
+    Parse NAME[:key=value,...]; values are Python literals where possible
+    (depth=3, symmetry=True, depth=None), strings otherwise.
+    """
+    name, _, rest = text.partition(":")
+    name = name.strip()
+
+    if name not in PLAYERS:
+        raise argparse.ArgumentTypeError(
+            f"unknown player {name!r} (choose from {', '.join(sorted(PLAYERS))})"
+        )
+
+    params: Dict[str, Any] = {}
+    for item in filter(None, (part.strip() for part in rest.split(","))):
+        key, sep, raw = item.partition("=")
+        if not sep:
+            raise argparse.ArgumentTypeError(f"expected key=value, got {item!r}")
+        try:
+            params[key.strip()] = ast.literal_eval(raw.strip())
+        except (ValueError, SyntaxError):
+            params[key.strip()] = raw.strip()
+
+    return name, params
+
+
+# ---------------------------------------------------------------------------
+# Running games (worker side)
+# ---------------------------------------------------------------------------
+
+def seat_seed(base_seed: int, index: int, seat: int) -> int:
+    """
+    Seed of the player in `seat` of game `index` of a series.
+    """
+    key = f"{base_seed}:{index}:{seat}".encode()
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def play_game(
+    index: int,
+    base_seed: int,
+    game_name: str,
+    seats: Sequence[PlayerSpec],
+    keep_moves: bool = False,
+) -> Dict[str, Any]:
+    """
+    Play one game and return its JSON-serializable record; with
+    `keep_moves`, the encoded moves are added under "encoded" (bytes).
+
+    `seats` holds one player spec per player of the game, in turn order;
+    each player is seeded with `seat_seed(base_seed, index, seat)`.
+    """
+    game = GAMES[game_name]()
+
+    players: Dict[PlayerID, Player] = {
+        pid: PLAYERS[name](pid, game, seat_seed(base_seed, index, i), **params)
+        for i, (pid, (name, params)) in enumerate(zip(game.PLAYERS, seats))
+    }
+
+    match = Match(game=game, players=players, history="actions" if keep_moves else "none")
+
+    start = time.perf_counter()
+    final_result, history = match.run()
+    elapsed = time.perf_counter() - start
+
+    for player in players.values():
+        close = getattr(player, "close", None)
+        if close is not None:
+            close()
+
+    # Determine winner label: the one player with the best result, if any
+    best = max(final_result.values())
+    leaders = [pid for pid in game.PLAYERS if final_result[pid] == best]
+    winner = leaders[0] if len(leaders) == 1 else None
+
+    record = {
+        "game": index,
+        "seed": base_seed,
+        "winner": winner,
+        "result": dict(final_result),
+        "moves": match.plies,
+        "seconds": elapsed,
+    }
+    if keep_moves:
+        record["encoded"] = encode_moves(moves_from_history(history))
+
+    return record
+
+
+def play_chunk(
+    indices: List[int],
+    base_seed: int,
+    game_name: str,
+    seats: Sequence[PlayerSpec],
+    keep_moves: bool = False,
+) -> List[Dict[str, Any]]:
+    return [
+        play_game(i, base_seed, game_name, seats, keep_moves)
+        for i in indices
+    ]
+
+
+def _chunks(num_games: int, size: int) -> Iterator[List[int]]:
+    for start in range(0, num_games, size):
+        yield list(range(start, min(start + size, num_games)))
 
 
 # ---------------------------------------------------------------------------
 # Run matches
 # ---------------------------------------------------------------------------
 
-def run_series(num_games: int) -> None:
-    game = TicTacToeGame()
+def run_series(
+    num_games: int,
+    seats: Sequence[PlayerSpec] = ((DEFAULT_X, {}), (DEFAULT_O, {})),
+    *,
+    game_name: str = "tictactoe",
+    workers: Optional[int] = None,
+    seed: int = 0,
+    chunk_size: Optional[int] = None,
+    out: Optional[IO[str]] = None,
+    archive: Optional[RecordWriter] = None,
+) -> Counter:
+    """
+    Play `num_games` games and print a summary; return the result counts
+    ("<player>_win" and "draw").
+
+    `seats` holds one player spec per player of the game, in turn order.
+
+    `workers` defaults to the CPU count; 1 runs everything in this process.
+    Records are written to `out` (JSONL) and moves to `archive`, both in
+    completion order. The summary goes to stdout, or to stderr when `out`
+    is stdout.
+    """
+    check_seats(game_name, seats, archive=archive is not None)
+    players = GAMES[game_name]().PLAYERS
 
-    results = Counter()
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        # a few chunks per worker keeps the pool busy without per-game IPC
+        chunk_size = max(1, min(64, num_games // (workers * 4) or 1))
 
-    for _ in range(num_games):
-        players:Dict[PlayerID, Player] = {
-            game.PLAYER_X: PLAYER_X_FACTORY(),
-            game.PLAYER_O: PLAYER_O_FACTORY(),
-        }
+    results: Counter = Counter()
+    start = time.perf_counter()
 
-        match = Match(game=game, players=players)
-        final_result, _ = match.run()
+    keep_moves = archive is not None
 
-        # Determine winner label
-        if final_result[game.PLAYER_X] > final_result[game.PLAYER_O]:
-            results["X_win"] += 1
-        elif final_result[game.PLAYER_O] > final_result[game.PLAYER_X]:
-            results["O_win"] += 1
-        else:
-            results["draw"] += 1
+    def record(rec: Dict[str, Any]) -> None:
+        label = "draw" if rec["winner"] is None else f"{rec['winner']}_win"
+        results[label] += 1
+        if keep_moves:
+            rec["archived"] = archive.append(rec.pop("encoded"))
+        if out is not None:
+            out.write(json.dumps(rec) + "\n")
+
+    if workers == 1:
+        for chunk in _chunks(num_games, chunk_size):
+            for rec in play_chunk(chunk, seed, game_name, seats, keep_moves):
+                record(rec)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(
+                    play_chunk, chunk, seed, game_name, seats, keep_moves
+                )
+                for chunk in _chunks(num_games, chunk_size)
+            ]
+            for future in as_completed(futures):
+                for rec in future.result():
+                    record(rec)
+                if out is not None:
+                    out.flush()
+
+    elapsed = time.perf_counter() - start
 
     # -----------------------------------------------------------------------
     # Print summary
     # -----------------------------------------------------------------------
 
-    print("\n=== Bot Match Results ===")
-    print(f"Total games: {num_games}")
-    print(f"X wins: {results['X_win']}")
-    print(f"O wins: {results['O_win']}")
-    print(f"Draws : {results['draw']}")
+    # keep a JSONL stream on stdout clean
+    summary = sys.stderr if out is sys.stdout else sys.stdout
+
+    print("\n=== Bot Match Results ===", file=summary)
+    for pid, spec in zip(players, seats):
+        print(f"{pid}: {_describe(spec)}", file=summary)
+    print(f"Total games: {num_games}", file=summary)
+    for pid in players:
+        print(f"{pid} wins: {results[pid + '_win']}", file=summary)
+    print(f"Draws : {results['draw']}", file=summary)
+    rate = num_games / elapsed if elapsed else 0.0
+    print(f"Time  : {elapsed:.2f}s ({rate:.1f} games/s, {workers} workers)", file=summary)
+
+    return results
+
+
+def check_seats(game_name: str, seats: Sequence[PlayerSpec], archive: bool = False) -> None:
+    """
+    Raise ValueError unless `seats` fill the game's seats with players that
+    can play it (and the game can be archived, if asked).
+    """
+    players = GAMES[game_name]().PLAYERS
+    if len(seats) != len(players):
+        raise ValueError(f"{game_name} needs {len(players)} seats, got {len(seats)}.")
+
+    allowed = GAME_PLAYERS.get(game_name, tuple(PLAYERS))
+    for name, _ in seats:
+        if name not in allowed:
+            raise ValueError(
+                f"{name} cannot play {game_name} (choose from {', '.join(allowed)})."
+            )
+
+    if archive and game_name not in ARCHIVABLE:
+        raise ValueError(f"Moves of {game_name} cannot be archived.")
+
+
+def _describe(spec: PlayerSpec) -> str:
+    name, params = spec
+    if not params:
+        return name
+    return name + " (" + ", ".join(f"{k}={v!r}" for k, v in params.items()) + ")"
 
 
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
 
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--x", type=parse_player_spec, default=None,
+                        help=f"player X as NAME[:key=value,...] (default {DEFAULT_X})")
+    parser.add_argument("--o", type=parse_player_spec, default=None,
+                        help=f"player O as NAME[:key=value,...] (default {DEFAULT_O})")
+    parser.add_argument("--seat", type=parse_player_spec, action="append", default=None,
+                        help="player as NAME[:key=value,...], once per player in turn "
+                             f"order; replaces --x/--o (default for more than two "
+                             f"players: {DEFAULT_SEAT} everywhere)")
+    parser.add_argument("--games", type=int, default=NUM_GAMES)
+    parser.add_argument("--game", choices=sorted(GAMES), default="tictactoe",
+                        help="rules implementation")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes (default: CPU count; 1 = in-process)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="games per worker task")
+    parser.add_argument("--out", default=None,
+                        help="stream per-game records to this JSONL file ('-' = stdout)")
+    parser.add_argument("--archive", default=None,
+                        help="append every game's moves to this record file")
+    args = parser.parse_args(argv)
+
+    players = GAMES[args.game]().PLAYERS
+    if args.seat is not None:
+        if args.x is not None or args.o is not None:
+            parser.error("--seat cannot be combined with --x/--o")
+        seats = args.seat
+    elif len(players) == 2:
+        seats = [args.x or (DEFAULT_X, {}), args.o or (DEFAULT_O, {})]
+    elif args.x is not None or args.o is not None:
+        parser.error(f"--game {args.game} has {len(players)} players; use --seat")
+    else:
+        seats = [(DEFAULT_SEAT, {})] * len(players)
+
+    try:
+        check_seats(args.game, seats, archive=args.archive is not None)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    kwargs = dict(
+        game_name=args.game,
+        workers=args.workers,
+        seed=args.seed,
+        chunk_size=args.chunk_size,
+    )
+
+    with contextlib.ExitStack() as stack:
+        if args.archive is not None:
+            kwargs["archive"] = stack.enter_context(RecordWriter(args.archive))
+
+        if args.out == "-":
+            kwargs["out"] = sys.stdout
+        elif args.out is not None:
+            kwargs["out"] = stack.enter_context(open(args.out, "w"))
+
+        run_series(args.games, seats, **kwargs)
+
+
 if __name__ == "__main__":
-    run_series(NUM_GAMES)
+    main()
@@ -0,0 +1,43 @@
+"""
+Build a Tic-Tac-Toe opening book from archived games.
+
+    python -m runners.bot_match --x mcts --o mcts --games 5000 --archive games.rec
+    python -m runners.build_book games.rec --out book.pkl --max-ply 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Iterator, List, Optional
+
+from core.records import RecordReader
+
+from players.ai.games.tictactoe.book import build_book
+
+
+def _games(paths: List[str]) -> Iterator[bytes]:
+    for path in paths:
+        with RecordReader(path) as records:
+            yield from records
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("archives", nargs="+", help="record files written by bot_match --archive")
+    parser.add_argument("--out", required=True, help="book file")
+    parser.add_argument("--max-ply", type=int, default=4, help="plies kept per game")
+    parser.add_argument("--min-count", type=int, default=1,
+                        help="times a move must have been played to be used")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    book = build_book(_games(args.archives), max_ply=args.max_ply, min_count=args.min_count)
+    book.save(args.out)
+    elapsed = time.perf_counter() - start
+
+    print(f"{book.games} games -> {len(book)} positions in {elapsed:.2f}s -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Solve Tic-Tac-Toe by retrograde analysis and write the tablebase file.
+
+    python -m runners.build_tablebase --out tictactoe.tb
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List, Optional
+
+from players.ai.games.tictactoe.tablebase import DEFAULT_PATH, build
+from players.ai.core.search.retrograde import Tablebase
+
+from games.tictactoe.encoding import encode
+from games.tictactoe.game import TicTacToeGame
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--out", default=DEFAULT_PATH, help="tablebase file")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    states = build(args.out)
+    elapsed = time.perf_counter() - start
+
+    with Tablebase(args.out) as table:
+        value = table.result(encode(TicTacToeGame().initial_state()))
+
+    print(f"Solved {states} states in {elapsed:.2f}s -> {args.out}")
+    print(f"Initial position: {value}")
+
+
+if __name__ == "__main__":
+    main()